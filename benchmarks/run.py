@@ -0,0 +1,230 @@
+"""Benchmark suite for the Battleship simulator.
+
+Generates seeded synthetic games over a grid of board sizes (M), ship counts (S) and missile counts (T), times
+each stage of a simulation run (parse, validate, setup, simulate, render, write) for every selected engine, and
+writes the results as JSON. Given the results of an earlier run as a baseline, fails when a stage regresses past
+the threshold. Separately, times the validation of long move lines (optionally with malformed moves) against a time
+budget.
+"""
+
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.engines import ENGINES
+from ..src.instrumentation import Instrumentation, PHASES
+from ..src.validator import InputValidator
+from ..src.workload import generate_game, write_game
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Default grid of the workload parameters. Grid points which an engine does not accept are skipped for it.
+DEFAULT_BOARD_SIZES = (5, 9, 100, 1000)
+DEFAULT_SHIP_COUNTS = (4, 20)
+DEFAULT_MISSILE_COUNTS = (50, 99, 10000)
+
+def workload_grid(board_sizes:List[int], ship_counts:List[int], missile_counts:List[int],
+                    engine:str) -> Iterator[Tuple[int, int, int]]:
+    """Grid points (M, S, T) which are valid inputs for an engine
+
+    Args:
+        board_sizes (List[int]): Board sizes M
+        ship_counts (List[int]): Ship counts S
+        missile_counts (List[int]): Missile counts T
+        engine (str): Name of the game engine (see ENGINES)
+
+    Yields:
+        Tuple[int, int, int]: Valid (M, S, T) combinations
+    """
+    game_class = ENGINES[engine]
+    for (M, S, T) in itertools.product(board_sizes, ship_counts, missile_counts):
+        if game_class.max_board_size is not None and M >= game_class.max_board_size:
+            continue
+        if game_class.max_missiles is not None and T >= game_class.max_missiles:
+            continue
+        if S >= int(M**2/2):
+            continue
+        yield (M, S, T)
+
+def time_stages(input_path:Path, output_dir:Path, engine:str) -> Dict[str, float]:
+    """Runs one simulation and times each of its stages
+
+    Args:
+        input_path (Path): Input text file of the game
+        output_dir (Path): Directory for the result file
+        engine (str): Name of the game engine (see ENGINES)
+
+    Returns:
+        Dict[str, float]: Seconds spent in each phase (see PHASES)
+    """
+    instrumentation = Instrumentation()
+    s = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine](), output_dir=output_dir, instrumentation=instrumentation)
+    s.read_input(str(input_path))
+    s.simulate()
+    s.write_result()
+    return dict(instrumentation.timings)
+
+def run_benchmarks(engines:List[str], board_sizes:List[int], ship_counts:List[int], missile_counts:List[int],
+                    repeat:int=5, seed:int=0) -> List[Dict]:
+    """Runs the benchmarks over the workload grid. Every engine simulates the same games.
+
+    Args:
+        engines (List[str]): Names of the game engines to benchmark
+        board_sizes (List[int]): Board sizes M
+        ship_counts (List[int]): Ship counts S
+        missile_counts (List[int]): Missile counts T
+        repeat (int): Number of times each game is simulated (the median time is reported)
+        seed (int): Seed of the synthetic workload
+
+    Returns:
+        List[Dict]: One result per engine, grid point and stage ('engine', 'M', 'S', 'T', 'stage', 'seconds')
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for engine in engines:
+            for (M, S, T) in workload_grid(board_sizes, ship_counts, missile_counts, engine):
+                input_path = Path(tmp_dir) / 'bench--{M}-{S}-{T}.txt'.format(M=M, S=S, T=T)
+                write_game(generate_game(random.Random('{seed}-{M}-{S}-{T}'.format(seed=seed, M=M, S=S, T=T)), M, S, T), input_path)
+                runs = [time_stages(input_path, Path(tmp_dir), engine) for _ in range(repeat)]
+                for stage in PHASES:
+                    results.append({'engine': engine, 'M': M, 'S': S, 'T': T, 'stage': stage,
+                                    'seconds': statistics.median(run[stage] for run in runs)})
+    return results
+
+def time_move_parse(n_moves:int, n_bad:int=0, repeat:int=3, seed:int=0) -> float:
+    """Times the validation of a game with long move lines (on a 1000x1000 board)
+
+    Args:
+        n_moves (int): Number of moves T of each player
+        n_bad (int): Number of moves of Player 1 which are replaced with malformed ones
+        repeat (int): Number of times the game is validated (the fastest time is reported)
+        seed (int): Seed of the synthetic workload
+
+    Returns:
+        float: Seconds spent validating the game
+    """
+    rng = random.Random(seed)
+    lines = generate_game(rng, board_size=1000, n_ships=20, n_missiles=n_moves)
+    if n_bad:
+        moves = lines[5].split(':')
+        for i in rng.sample(range(n_moves), min(n_bad, n_moves)):
+            moves[i] = 'x,' + moves[i]
+        lines[5] = ':'.join(moves)
+    validator = InputValidator()
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validator.validate_lines(lines)
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+def check_parse_budget(seconds:float, n_coordinates:int, budget:float) -> Optional[str]:
+    """Compares the time of a move parse benchmark with its budget
+
+    Args:
+        seconds (float): Seconds spent validating the game (see time_move_parse)
+        n_coordinates (int): Number of coordinates of the move lines of the game
+        budget (float): Allowed seconds per 10 million coordinates
+
+    Returns:
+        Optional[str]: Description of the regression, or None if the parse is within the budget
+    """
+    if seconds <= budget * n_coordinates / 1e7:
+        return None
+    return "parse: {seconds:.3f}s for {n} coordinates is over the budget of {budget}s per 10 million".format(
+        seconds=seconds, n=n_coordinates, budget=budget)
+
+def find_regressions(results:List[Dict], baseline:List[Dict], threshold:float,
+                        min_seconds:float=1e-4) -> List[str]:
+    """Compares benchmark results with the results of an earlier run
+
+    Args:
+        results (List[Dict]): Results of this run
+        baseline (List[Dict]): Results of the earlier run
+        threshold (float): Allowed relative slowdown of a stage (e.g. 0.25 for 25%)
+        min_seconds (float): Stages faster than this in the baseline are not compared (too noisy)
+
+    Returns:
+        List[str]: Description of every stage which regressed past the threshold
+    """
+    def key(result:Dict) -> Tuple:
+        return (result['engine'], result['M'], result['S'], result['T'], result['stage'])
+
+    baseline_seconds = {key(result): result['seconds'] for result in baseline}
+    regressions = []
+    for result in results:
+        before = baseline_seconds.get(key(result))
+        if before is None or before < min_seconds:
+            continue
+        if result['seconds'] > before * (1 + threshold):
+            regressions.append("{engine} M={M} S={S} T={T} {stage}: {before:.6f}s -> {after:.6f}s (+{change:.0%})".format(
+                engine=result['engine'], M=result['M'], S=result['S'], T=result['T'], stage=result['stage'],
+                before=before, after=result['seconds'], change=result['seconds'] / before - 1))
+    return regressions
+
+def main(argv:Optional[List[str]]=None) -> int:
+    """Command line entry point of the benchmark suite
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments (defaults to sys.argv)
+
+    Returns:
+        int: Exit code (1 if a stage regressed past the threshold, or the move parsing is over its budget)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=sorted(ENGINES))
+    parser.add_argument('--board-sizes', nargs='+', type=int, default=list(DEFAULT_BOARD_SIZES))
+    parser.add_argument('--ship-counts', nargs='+', type=int, default=list(DEFAULT_SHIP_COUNTS))
+    parser.add_argument('--missile-counts', nargs='+', type=int, default=list(DEFAULT_MISSILE_COUNTS))
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per game (the median is reported)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the synthetic workload")
+    parser.add_argument('--output', default=None, help="JSON file to write the results to")
+    parser.add_argument('--baseline', default=None, help="JSON results of an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Allowed relative slowdown of a stage")
+    parser.add_argument('--parse-moves', type=int, default=None,
+                        help="Only time the validation of a game with this many moves per player")
+    parser.add_argument('--parse-bad-moves', type=int, default=0, help="Number of malformed moves of Player 1")
+    parser.add_argument('--parse-budget', type=float, default=None,
+                        help="Allowed seconds per 10 million coordinates (20 million numbers) of moves")
+    args = parser.parse_args(argv)
+
+    if args.parse_moves is not None:
+        seconds = time_move_parse(args.parse_moves, n_bad=args.parse_bad_moves, repeat=args.repeat, seed=args.seed)
+        n_coordinates = 2 * args.parse_moves
+        print("parse {n} coordinates ({bad} malformed): {seconds:.3f} s ({rate:.1f} M coordinates/s)".format(
+            n=n_coordinates, bad=args.parse_bad_moves, seconds=seconds, rate=n_coordinates / seconds / 1e6))
+        regression = None if args.parse_budget is None else check_parse_budget(seconds, n_coordinates, args.parse_budget)
+        if regression is not None:
+            print("REGRESSION " + regression, file=sys.stderr)
+            return 1
+        return 0
+
+    results = run_benchmarks(args.engines, args.board_sizes, args.ship_counts, args.missile_counts,
+                                repeat=args.repeat, seed=args.seed)
+    for result in results:
+        print("{engine:<8} M={M:<6} S={S:<5} T={T:<7} {stage:<9} {ms:10.3f} ms".format(ms=result['seconds'] * 1e3, **result))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(), 'seed': args.seed, 'repeat': args.repeat, 'results': results}, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print("REGRESSION " + regression, file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+"""This file contains the aggregation of per-location statistics and score distributions across many games.
+
+Games are added as they finish, straight from the boards of their game engine (no result file is parsed). The counts
+are kept in fixed-size arrays, and aggregators of the same board size can be merged, so that every worker of a batch
+run aggregates its own games and the partial aggregates are combined at the end. For each location of the board of
+Player 1 and of Player 2, over all the games -
+    'ships': number of games with a ship at the location
+    'hits': number of games in which the ship at the location was hit
+    'misses': number of games in which the location was fired at without a ship
+    'survived': number of games in which the ship at the location was not hit
+The aggregate also counts the games per score of each player and per game result.
+
+Aggregates are exported as a compressed NumPy archive (.npz, with all the arrays) or as CSV files (one row per
+location, and a '__scores.csv' file with one row per score).
+"""
+
+from .monte_carlo import DRAW, P1_WINS, P2_WINS, RESULT_STRINGS
+from .numpy_game import EMPTY, SHIP, MISS, HIT
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Per-location counters of the aggregates (arrays of shape (2, M, M), for the boards of Player 1 and Player 2)
+COUNTERS = ('ships', 'hits', 'misses', 'survived')
+# Largest board (in locations) an aggregate is kept for
+MAX_AGGREGATE_CELLS = 1 << 22
+# Location codes of the characters of the game boards
+_CELL_CODES = bytes.maketrans(b'_BOX', bytes((EMPTY, SHIP, MISS, HIT)))
+
+def _result_code(p1_score:int, p2_score:int) -> int:
+    """Result code of the scores of a game (the player with the higher score wins)
+
+    Args:
+        p1_score (int): Score of Player 1
+        p2_score (int): Score of Player 2
+
+    Returns:
+        int: DRAW, P1_WINS or P2_WINS
+    """
+    if p1_score == p2_score:
+        return DRAW
+    return P1_WINS if p1_score > p2_score else P2_WINS
+
+class HeatmapAggregator():
+    def __init__(self, board_size:Optional[int]=None) -> None:
+        """Per-location counts and score distributions of games of the same board size
+
+        Args:
+            board_size (Optional[int]): Board size M (defaults to the board size of the first game added)
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for the aggregation of game statistics.")
+        self.board_size = None
+        self.n_games = 0
+        # COUNTERS -> (2, M, M) counts, allocated with the board size
+        self.__counts = {}
+        # Number of games per score of Player 1 (row 0) and Player 2 (row 1), grown with the highest score
+        self.__scores = np.zeros((2, 1), dtype=np.int64)
+        # Number of games per result code
+        self.__results = np.zeros(len(RESULT_STRINGS), dtype=np.int64)
+        if board_size is not None:
+            self.__allocate(board_size)
+
+    def __allocate(self, board_size:int) -> None:
+        """Allocates the counts on the first game, or checks that a game has the board size of the aggregate
+
+        Args:
+            board_size (int): Board size M of the game
+
+        Raises:
+            ValueError: If the board size is not the one of the aggregate, or the board is too large
+        """
+        if self.board_size is not None:
+            if board_size != self.board_size:
+                raise ValueError("Board size {M} does not match the aggregated board size {size}.".format(M=board_size, size=self.board_size))
+            return
+        if board_size * board_size > MAX_AGGREGATE_CELLS:
+            raise ValueError("Board size {M} is too large to aggregate (at most {n} locations).".format(M=board_size, n=MAX_AGGREGATE_CELLS))
+        self.board_size = board_size
+        self.__counts = {counter: np.zeros((2, board_size, board_size), dtype=np.int64) for counter in COUNTERS}
+
+    def __add_scores(self, p1_score:int, p2_score:int) -> None:
+        """Counts the scores and the result of a game
+
+        Args:
+            p1_score (int): Score of Player 1
+            p2_score (int): Score of Player 2
+        """
+        self.__grow_scores(max(p1_score, p2_score) + 1)
+        self.__scores[0, p1_score] += 1
+        self.__scores[1, p2_score] += 1
+        self.__results[_result_code(p1_score, p2_score)] += 1
+        self.n_games += 1
+
+    def __grow_scores(self, n_scores:int) -> None:
+        """Makes room for the scores up to n_scores - 1
+
+        Args:
+            n_scores (int): Number of score columns needed
+        """
+        if n_scores > self.__scores.shape[1]:
+            scores = np.zeros((2, max(n_scores, 2 * self.__scores.shape[1])), dtype=np.int64)
+            scores[:, :self.__scores.shape[1]] = self.__scores
+            self.__scores = scores
+
+    def add_codes(self, p1_codes:'np.ndarray', p2_codes:'np.ndarray', p1_score:int, p2_score:int) -> None:
+        """Adds a finished game from the location codes of its boards (EMPTY, SHIP, MISS or HIT, as in NumpyGame)
+
+        Args:
+            p1_codes (np.ndarray): (M, M) codes of the board of Player 1
+            p2_codes (np.ndarray): (M, M) codes of the board of Player 2
+            p1_score (int): Score of Player 1
+            p2_score (int): Score of Player 2
+
+        Raises:
+            ValueError: If the board size is not the one of the aggregate
+        """
+        codes = np.stack((p1_codes, p2_codes))
+        self.__allocate(codes.shape[1])
+        counts = self.__counts
+        survived = codes == SHIP
+        hits = codes == HIT
+        counts['survived'] += survived
+        counts['hits'] += hits
+        counts['ships'] += survived | hits
+        counts['misses'] += codes == MISS
+        self.__add_scores(p1_score, p2_score)
+
+    def add_boards(self, p1_board:List[List[str]], p2_board:List[List[str]], p1_score:int, p2_score:int) -> None:
+        """Adds a finished game from its boards, as returned by Game.get_player_board
+
+        Args:
+            p1_board (List[List[str]]): Board of Player 1 ('_', 'B', 'O' or 'X' locations)
+            p2_board (List[List[str]]): Board of Player 2
+            p1_score (int): Score of Player 1
+            p2_score (int): Score of Player 2
+        """
+        codes = []
+        for board in (p1_board, p2_board):
+            # Each board is joined into one byte string and translated to the location codes in a single pass
+            text = ''.join(map(''.join, board)).encode().translate(_CELL_CODES)
+            codes.append(np.frombuffer(text, dtype=np.uint8).reshape(len(board), len(board)))
+        self.add_codes(codes[0], codes[1], p1_score, p2_score)
+
+    def add_cells(self, board_size:int, p1_cells:Mapping[Tuple[int, int], str], p2_cells:Mapping[Tuple[int, int], str],
+                    p1_score:int, p2_score:int) -> None:
+        """Adds a finished game from the occupied locations of its boards, as returned by SparseGame.get_occupied_cells,
+        without expanding the boards
+
+        Args:
+            board_size (int): Board size M
+            p1_cells (Mapping[Tuple[int, int], str]): Location -> 'B', 'O' or 'X' on the board of Player 1
+            p2_cells (Mapping[Tuple[int, int], str]): Location -> 'B', 'O' or 'X' on the board of Player 2
+            p1_score (int): Score of Player 1
+            p2_score (int): Score of Player 2
+
+        Raises:
+            ValueError: If the board size is not the one of the aggregate
+        """
+        self.__allocate(board_size)
+        for (board, cells) in enumerate((p1_cells, p2_cells)):
+            if not cells:
+                continue
+            locs = np.array(list(cells.keys()), dtype=np.intp)
+            codes = np.frombuffer(''.join(cells.values()).encode().translate(_CELL_CODES), dtype=np.uint8)
+            for (counter, mask) in (('survived', codes == SHIP), ('hits', codes == HIT),
+                                    ('ships', (codes == SHIP) | (codes == HIT)), ('misses', codes == MISS)):
+                # Locations are distinct, so the counts can be incremented with fancy indexing
+                self.__counts[counter][board, locs[mask, 0], locs[mask, 1]] += 1
+        self.__add_scores(p1_score, p2_score)
+
+    def add_game(self, game, board_size:int) -> None:
+        """Adds the finished game of a game engine, from the most compact form of boards the engine provides
+
+        Args:
+            game: Game object of any engine (see ENGINES)
+            board_size (int): Board size M of the game
+        """
+        (p1_score, p2_score) = (game.get_player_scores(player_id=1), game.get_player_scores(player_id=2))
+        if hasattr(game, 'get_board_codes'):
+            self.add_codes(game.get_board_codes(player_id=1), game.get_board_codes(player_id=2), p1_score, p2_score)
+        elif hasattr(game, 'get_occupied_cells'):
+            self.add_cells(board_size, game.get_occupied_cells(player_id=1), game.get_occupied_cells(player_id=2), p1_score, p2_score)
+        else:
+            self.add_boards(game.get_player_board(player_id=1), game.get_player_board(player_id=2), p1_score, p2_score)
+
+    def add_simulator(self, s) -> None:
+        """Adds the simulated game of a simulator. The simulator must not use the result cache, since the boards
+        of a cached game are not simulated.
+
+        Args:
+            s (Simulator): Simulator of the game, after simulate()
+        """
+        self.add_game(s.get_game(), s.get_sim_inputs()['M'])
+
+    def merge(self, other:'HeatmapAggregator') -> 'HeatmapAggregator':
+        """Adds the counts of another aggregate (e.g. the partial aggregate of a worker)
+
+        Args:
+            other (HeatmapAggregator): Aggregate of games of the same board size
+
+        Raises:
+            ValueError: If the board sizes of the aggregates do not match
+
+        Returns:
+            HeatmapAggregator: This aggregate
+        """
+        if other.board_size is not None:
+            self.__allocate(other.board_size)
+            for counter in COUNTERS:
+                self.__counts[counter] += other.get_counts(counter)
+        other_scores = other.get_score_counts()
+        self.__grow_scores(other_scores.shape[1])
+        self.__scores[:, :other_scores.shape[1]] += other_scores
+        self.__results += other.get_result_counts()
+        self.n_games += other.n_games
+        return self
+
+    def get_counts(self, counter:str) -> 'np.ndarray':
+        """Per-location counts of the boards of both players
+
+        Args:
+            counter (str): One of COUNTERS
+
+        Raises:
+            ValueError: If the counter is not one of COUNTERS
+
+        Returns:
+            np.ndarray: (2, M, M) counts, for the board of Player 1 at index 0 and the board of Player 2 at index 1
+                (empty before the first game)
+        """
+        if counter not in COUNTERS:
+            raise ValueError("Unknown counter: {counter} (one of {counters})".format(counter=counter, counters=', '.join(COUNTERS)))
+        return self.__counts.get(counter, np.zeros((2, 0, 0), dtype=np.int64))
+
+    def get_score_counts(self) -> 'np.ndarray':
+        """Number of games per score of each player
+
+        Returns:
+            np.ndarray: (2, n) counts, the number of games in which Player 1 (row 0) or Player 2 (row 1) scored s in column s
+        """
+        return self.__scores
+
+    def get_result_counts(self) -> 'np.ndarray':
+        """Number of games per result code
+
+        Returns:
+            np.ndarray: Counts indexed by DRAW, P1_WINS and P2_WINS
+        """
+        return self.__results
+
+    def get_results(self) -> Dict[str, int]:
+        """Number of games per game result
+
+        Returns:
+            Dict[str, int]: "Player 1 wins", "Player 2 wins" and "It is a draw" -> number of games
+        """
+        return {RESULT_STRINGS[code]: int(self.__results[code]) for code in (P1_WINS, P2_WINS, DRAW)}
+
+    def save(self, file_path:Path) -> List[Path]:
+        """Writes the aggregate as a compressed NumPy archive if the path ends with .npz, or else as CSV files
+
+        Args:
+            file_path (Path): Path of the archive, or of the CSV file of the locations
+
+        Returns:
+            List[Path]: Paths of the written files
+        """
+        file_path = Path(file_path)
+        if file_path.suffix == '.npz':
+            with open(file_path, 'wb') as f:
+                np.savez_compressed(f, board_size=np.int64(self.board_size or 0), n_games=np.int64(self.n_games),
+                                    scores=self.__scores, results=self.__results,
+                                    **{counter: self.get_counts(counter) for counter in COUNTERS})
+            return [file_path]
+
+        # One row per location of each board, and one row per score
+        M = self.board_size or 0
+        (boards, loc_x, loc_y) = np.indices((2, M, M)).reshape(3, -1)
+        columns = [boards + 1, loc_x, loc_y] + [self.get_counts(counter).reshape(-1) for counter in COUNTERS]
+        np.savetxt(file_path, np.column_stack(columns), fmt='%d', delimiter=',', comments='',
+                    header=','.join(['player', 'x', 'y'] + list(COUNTERS)))
+        scores_path = file_path.with_name(file_path.stem + '__scores.csv')
+        np.savetxt(scores_path, np.column_stack([np.arange(self.__scores.shape[1]), self.__scores[0], self.__scores[1]]),
+                    fmt='%d', delimiter=',', comments='', header='score,P1,P2')
+        return [file_path, scores_path]
+
+    @classmethod
+    def load(cls, file_path:Path) -> 'HeatmapAggregator':
+        """Reads an aggregate written as a NumPy archive
+
+        Args:
+            file_path (Path): Path of the .npz archive
+
+        Returns:
+            HeatmapAggregator: Aggregate
+        """
+        with np.load(file_path) as data:
+            aggregate = cls(board_size=int(data['board_size']) or None)
+            if aggregate.board_size is not None:
+                for counter in COUNTERS:
+                    aggregate.__counts[counter] += data[counter]
+            aggregate.__scores = data['scores'].astype(np.int64)
+            aggregate.__results += data['results']
+            aggregate.n_games = int(data['n_games'])
+        return aggregate
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merges the aggregates of several runs (.npz archives) into one")
+    parser.add_argument('output_path', help="Merged aggregate (.npz archive, or CSV files for any other suffix)")
+    parser.add_argument('input_paths', nargs='+', help="Aggregates to merge (.npz archives)")
+    args = parser.parse_args()
+
+    merged = HeatmapAggregator()
+    for input_path in args.input_paths:
+        merged.merge(HeatmapAggregator.load(Path(input_path)))
+    for path in merged.save(Path(args.output_path)):
+        print(path)
+    for (result, n_games) in merged.get_results().items():
+        print("{result:<15}{n:>12}".format(result=result, n=n_games))
@@ -0,0 +1,229 @@
+"""This file contains the analysis of finished games: counterfactual queries answered from an index of the game,
+without simulating it again.
+
+The game is resolved once into the cumulative number of hits of each player after every turn, and an index from
+each opponent ship location to the turns the player fired at it (the first of them is the turn it was hit). Then -
+    "Who wins if the game stops at turn k?" is answered in O(1) from the cumulative hits
+    "Does changing the i-th move of a player flip the result?" is answered in O(1): only the location no longer fired
+        at turn i (hit later, or never) and the location fired instead (hit earlier, or for the first time) change
+        the score
+The queries follow the rules of the default engine (a ship location scores once, for the first shot hitting it).
+"""
+
+from .simulator import Simulator
+from .player import Player
+from .sparse_game import SparseGame
+
+import argparse
+from array import array
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+def _game_result(p1_score:int, p2_score:int) -> str:
+    """Game result of the scores, as given by the game engines
+
+    Args:
+        p1_score (int): Score of Player 1
+        p2_score (int): Score of Player 2
+
+    Returns:
+        str: Either "It is a draw", "Player 1 wins" or "Player 2 wins"
+    """
+    if p1_score == p2_score:
+        return "It is a draw"
+    return "Player 1 wins" if p1_score > p2_score else "Player 2 wins"
+
+class GameAnalysis():
+    def __init__(self, sim_inputs:Dict) -> None:
+        """Index of a game for counterfactual queries
+
+        Args:
+            sim_inputs (Dict): Sanitized inputs of the game (see Simulator.get_sim_inputs), with the move lists
+                (not streamed moves)
+        """
+        self.board_size = sim_inputs['M']
+        self.n_turns = sim_inputs['T']
+        # For Player 1 at index 0 and Player 2 at index 1: the moves, the opponent ship locations, the number of
+        # hits after each turn (from turn 0), and opponent ship location -> turns the player fired at it
+        self.__moves = ([], [])
+        self.__targets = (set(map(tuple, sim_inputs['P2_POS_SHIPS'])), set(map(tuple, sim_inputs['P1_POS_SHIPS'])))
+        self.__hits = (array('I', [0]), array('I', [0]))
+        self.__shot_turns = ({}, {})
+        for (index, moves) in enumerate((sim_inputs['P1_MOVES'], sim_inputs['P2_MOVES'])):
+            targets = self.__targets[index]
+            shot_turns = self.__shot_turns[index]
+            hits = self.__hits[index]
+            player_moves = self.__moves[index]
+            n_hits = 0
+            for (turn, hit_loc) in enumerate(moves, start=1):
+                hit_loc = tuple(hit_loc)
+                player_moves.append(hit_loc)
+                if hit_loc in targets:
+                    turns = shot_turns.setdefault(hit_loc, [])
+                    if not turns:
+                        n_hits += 1
+                    turns.append(turn)
+                hits.append(n_hits)
+
+    @classmethod
+    def from_file(cls, input_path:Path) -> 'GameAnalysis':
+        """Index of the game of an input text file (which is sanity checked, without limits on M and T)
+
+        Args:
+            input_path (Path): Path of the input file
+
+        Returns:
+            GameAnalysis: Index of the game
+        """
+        s = Simulator(p1=Player(), p2=Player(), g=SparseGame())
+        s.read_input(str(Path(input_path).resolve()))
+        return cls(s.get_sim_inputs())
+
+    def __check_turn(self, turn:int, lower:int=0) -> None:
+        """Checks a turn
+
+        Args:
+            turn (int): Turn
+            lower (int): Lowest valid turn
+
+        Raises:
+            ValueError: If the turn is not between lower and T
+        """
+        if not lower <= turn <= self.n_turns:
+            raise ValueError("Turn needs to be between {lower} and {T}.".format(lower=lower, T=self.n_turns))
+
+    def result_at(self, turn:int) -> Tuple[int, int, str]:
+        """Scores and result of the game if it stopped after a turn
+
+        Args:
+            turn (int): Turn (0 before the first move, T for the full game)
+
+        Returns:
+            Tuple[int, int, str]: Score of Player 1, score of Player 2 and the game result
+        """
+        self.__check_turn(turn)
+        p1_score = self.__hits[0][turn]
+        p2_score = self.__hits[1][turn]
+        return (p1_score, p2_score, _game_result(p1_score, p2_score))
+
+    def get_first_hit_turn(self, player_id:int, hit_loc:Tuple[int, int]) -> Optional[int]:
+        """Turn at which a player first hit an opponent ship location
+
+        Args:
+            player_id (int): ID of the player (either 1 or 2)
+            hit_loc (Tuple[int, int]): Location on the opponent's board
+
+        Returns:
+            Optional[int]: Turn, or None if the location is not a ship location or was never fired at by the player
+        """
+        turns = self.__shot_turns[player_id - 1].get(tuple(hit_loc))
+        return turns[0] if turns else None
+
+    def __score_change(self, index:int, turn:int, hit_loc:Tuple[int, int], stop_turn:int) -> int:
+        """Change of the score of a player after stop_turn, if their move at turn was hit_loc instead
+
+        Args:
+            index (int): Index of the player (0 for Player 1, 1 for Player 2)
+            turn (int): Turn of the substituted move (at most stop_turn)
+            hit_loc (Tuple[int, int]): Substituted location
+            stop_turn (int): Turn after which the score is compared
+
+        Returns:
+            int: Change of the score (-1, 0 or 1)
+        """
+        old_loc = self.__moves[index][turn - 1]
+        if old_loc == hit_loc:
+            return 0
+        shot_turns = self.__shot_turns[index]
+        change = 0
+        # The old location is no longer hit at this turn: it only scores if fired at again by stop_turn
+        turns = shot_turns.get(old_loc)
+        if turns and turns[0] == turn and (len(turns) == 1 or turns[1] > stop_turn):
+            change -= 1
+        # The new location scores now, unless it was already hit by stop_turn
+        if hit_loc in self.__targets[index]:
+            turns = shot_turns.get(hit_loc)
+            if not turns or turns[0] > stop_turn:
+                change += 1
+        return change
+
+    def substitute(self, player_id:int, turn:int, hit_loc:Tuple[int, int], stop_turn:Optional[int]=None) -> Tuple[int, int, str]:
+        """Scores and result of the game if one move of a player was another location
+
+        Args:
+            player_id (int): ID of the player (either 1 or 2)
+            turn (int): Turn of the move (from 1)
+            hit_loc (Tuple[int, int]): Location fired at instead
+            stop_turn (Optional[int]): Turn after which the game stops (defaults to T)
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2, a turn is out of range or the location is not on the board
+
+        Returns:
+            Tuple[int, int, str]: Score of Player 1, score of Player 2 and the game result
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        self.__check_turn(turn, lower=1)
+        stop_turn = self.n_turns if stop_turn is None else stop_turn
+        self.__check_turn(stop_turn)
+        hit_loc = tuple(hit_loc)
+        if not all(0 <= value < self.board_size for value in hit_loc):
+            raise ValueError("Location needs to be in the range [0, {upper}].".format(upper=self.board_size - 1))
+
+        scores = [self.__hits[0][stop_turn], self.__hits[1][stop_turn]]
+        if turn <= stop_turn:
+            scores[player_id - 1] += self.__score_change(player_id - 1, turn, hit_loc, stop_turn)
+        return (scores[0], scores[1], _game_result(scores[0], scores[1]))
+
+    def flips_result(self, player_id:int, turn:int, hit_loc:Tuple[int, int], stop_turn:Optional[int]=None) -> bool:
+        """Whether one move of a player being another location changes the game result
+
+        Args:
+            player_id (int): ID of the player (either 1 or 2)
+            turn (int): Turn of the move (from 1)
+            hit_loc (Tuple[int, int]): Location fired at instead
+            stop_turn (Optional[int]): Turn after which the game stops (defaults to T)
+
+        Returns:
+            bool: True if the result changes
+        """
+        stop_turn = self.n_turns if stop_turn is None else stop_turn
+        return self.substitute(player_id, turn, hit_loc, stop_turn)[2] != self.result_at(stop_turn)[2]
+
+def _format_result(label:str, scores:Tuple[int, int, str]) -> str:
+    """Line of the command line output
+
+    Args:
+        label (str): Query
+        scores (Tuple[int, int, str]): Scores and result
+
+    Returns:
+        str: Printable line
+    """
+    return "{label}: P1:{p1} P2:{p2} {result}".format(label=label, p1=scores[0], p2=scores[1], result=scores[2])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answers counterfactual queries on a Battleship game without simulating it again")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    prefix_parser = subparsers.add_parser('prefix', help="Result of the game if it stopped after the given turns")
+    prefix_parser.add_argument('input_path', help="Input text file of the game")
+    prefix_parser.add_argument('turns', nargs='+', type=int, help="Turns (0 to T)")
+    substitute_parser = subparsers.add_parser('substitute', help="Result of the game if one move was another location")
+    substitute_parser.add_argument('input_path', help="Input text file of the game")
+    substitute_parser.add_argument('--player', type=int, choices=(1, 2), required=True, help="Player of the move")
+    substitute_parser.add_argument('--turn', type=int, required=True, help="Turn of the move (from 1)")
+    substitute_parser.add_argument('--loc', type=lambda loc: tuple(map(int, loc.split(','))), required=True,
+                                    help="Location fired at instead, as x,y")
+    substitute_parser.add_argument('--stop-turn', type=int, default=None, help="Turn after which the game stops (defaults to T)")
+    args = parser.parse_args()
+
+    analysis = GameAnalysis.from_file(Path(args.input_path))
+    if args.command == 'prefix':
+        for turn in args.turns:
+            print(_format_result("Turn {turn}".format(turn=turn), analysis.result_at(turn)))
+    else:
+        stop_turn = analysis.n_turns if args.stop_turn is None else args.stop_turn
+        print(_format_result("Original (turn {turn})".format(turn=stop_turn), analysis.result_at(stop_turn)))
+        print(_format_result("Substituted (turn {turn})".format(turn=stop_turn),
+                                analysis.substitute(args.player, args.turn, args.loc, stop_turn=stop_turn)))
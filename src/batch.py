@@ -0,0 +1,171 @@
+"""This file contains the batch runner which simulates many Battleship input files over a process pool.
+"""
+
+from .simulator import Simulator
+from .player import Player
+from .engines import ENGINES
+from .sinks import ResultSink, open_sink
+from .cache import ResultCache, DEFAULT_MAX_BYTES
+from .aggregate import HeatmapAggregator
+
+import csv
+import glob
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Columns of the aggregated batch summary file
+SUMMARY_FIELDS = ['input', 'output', 'P1', 'P2', 'result', 'error']
+
+def collect_input_files(pattern:str) -> List[Path]:
+    """Collects the input files for a batch run
+
+    Args:
+        pattern (str): Either a directory (all the '.txt' files in it are used) or a glob pattern
+
+    Returns:
+        List[Path]: Sorted list of the input file paths
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.txt')
+    return sorted(Path(p).resolve() for p in glob.glob(pattern) if os.path.isfile(p))
+
+def simulate_file(input_path:Path, output_dir:Path, engine:str='default', simulator:Optional[Simulator]=None,
+                    sink:Optional[ResultSink]=None, aggregator:Optional[HeatmapAggregator]=None) -> Dict[str, Optional[str]]:
+    """Simulates a single input file and writes its result file (runs inside a worker process)
+
+    Args:
+        input_path (Path): Absolute path of the input file
+        output_dir (Path): Directory in which the result file is written
+        engine (str): Name of the game engine (see ENGINES)
+        simulator (Optional[Simulator]): Simulator (writing in output_dir) reused from an earlier game 
+            (a new one is created if None)
+        sink (Optional[ResultSink]): Sink the result is written to (defaults to a result file in output_dir)
+        aggregator (Optional[HeatmapAggregator]): Aggregate the finished game is added to (the simulator must not
+            use the result cache)
+
+    Returns:
+        Dict[str, Optional[str]]: Summary row of the game (see SUMMARY_FIELDS). 'error' is set instead of the
+            scores if the input file could not be simulated.
+    """
+    row = dict.fromkeys(SUMMARY_FIELDS)
+    row['input'] = str(input_path)
+    s = simulator or Simulator(p1=Player(), p2=Player(), g=ENGINES[engine](), output_dir=output_dir)
+    try:
+        s.read_input(str(input_path))
+        s.simulate()
+        row['output'] = str(s.write_result(sink))
+        if aggregator is not None:
+            aggregator.add_simulator(s)
+    except (ValueError, IndexError, OSError) as e:
+        # Input validation errors are reported in the summary instead of aborting the whole batch
+        row['error'] = str(e) or type(e).__name__
+    else:
+        (row['P1'], row['P2'], row['result']) = s.get_scores()
+    return row
+
+def _simulate_chunk(chunk:Tuple[List[Path], Path, str, str, Optional[str], Optional[str], int, bool]
+                    ) -> Tuple[List[Dict[str, Optional[str]]], Optional[HeatmapAggregator], Optional[Dict[str, int]]]:
+    """Simulates a chunk of input files in one worker call, so that small games do not pay for IPC one by one
+
+    Args:
+        chunk (Tuple[List[Path], Path, str, str, Optional[str], Optional[str], int, bool]): Input file paths of the chunk, 
+            the output directory, the engine name, the kind and path of the result sink, the result cache directory and 
+            size limit, and whether the games are aggregated
+
+    Returns:
+        Tuple[List[Dict[str, Optional[str]]], Optional[HeatmapAggregator], Optional[Dict[str, int]]]: Summary rows of the 
+            games in the chunk, the partial aggregate of the chunk (None if the games are not aggregated), and the result
+            cache counters of the chunk (None without a result cache)
+    """
+    input_paths, output_dir, engine, sink_kind, sink_path, cache_dir, cache_max_bytes, aggregate = chunk
+    cache = ResultCache(Path(cache_dir), max_bytes=cache_max_bytes) if cache_dir else None
+    # One simulator (with its game, players and boards) is reused for all the games of the chunk
+    s = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine](), output_dir=output_dir, cache=cache)
+    aggregator = HeatmapAggregator() if aggregate else None
+    with open_sink(sink_kind, output_dir, sink_path) as sink:
+        rows = [simulate_file(input_path, output_dir, engine, simulator=s, sink=sink, aggregator=aggregator) 
+                for input_path in input_paths]
+    return rows, aggregator, cache.counters if cache is not None else None
+
+def run_batch(input_paths:List[Path], output_dir:Path, workers:Optional[int]=None,
+                chunksize:Optional[int]=None, engine:str='default', sink:str='text',
+                sink_path:Optional[str]=None, cache_dir:Optional[str]=None, cache_max_bytes:int=DEFAULT_MAX_BYTES,
+                cache_stats:Optional[Dict[str, int]]=None,
+                aggregator:Optional[HeatmapAggregator]=None) -> List[Dict[str, Optional[str]]]:
+    """Simulates the input files over a pool of worker processes
+
+    Args:
+        input_paths (List[Path]): Input files to simulate
+        output_dir (Path): Directory in which the per-game result files are written
+        workers (Optional[int]): Number of worker processes (defaults to the number of CPUs).
+            With a single worker the files are simulated in the current process.
+        chunksize (Optional[int]): Number of input files handed to a worker at once
+            (defaults to splitting the batch into ~4 chunks per worker)
+        engine (str): Name of the game engine (see ENGINES)
+        sink (str): Kind of result sink (see SINKS). Each chunk writes its results in one go.
+        sink_path (Optional[str]): File of the 'append' or 'sqlite' sink (defaults to a file in output_dir)
+        cache_dir (Optional[str]): Directory of the result cache shared by the workers (disabled if None)
+        cache_max_bytes (int): Size limit of the result cache
+        cache_stats (Optional[Dict[str, int]]): Dictionary the hit, miss and eviction counters of the result cache
+            are added to, summed over the chunks
+        aggregator (Optional[HeatmapAggregator]): Aggregate the games are added to. Each chunk is aggregated by its worker,
+            and the partial aggregates are merged into it. The result cache is then bypassed, since cached games are 
+            not simulated.
+
+    Returns:
+        List[Dict[str, Optional[str]]]: Summary rows of all the games, in the order of input_paths
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    if not chunksize:
+        chunksize, extra = divmod(len(input_paths), workers * 4)
+        if extra or not chunksize:
+            chunksize += 1
+    if aggregator is not None and cache_dir:
+        logging.warning("The result cache is bypassed while aggregating the games")
+        cache_dir = None
+    chunks = [(input_paths[i:i + chunksize], output_dir, engine, sink, sink_path, cache_dir, cache_max_bytes,
+                aggregator is not None) for i in range(0, len(input_paths), chunksize)]
+    logging.info("Simulating {n} files in {c} chunks over {w} workers".format(n=len(input_paths), c=len(chunks), w=workers))
+
+    rows = []
+    with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as executor:
+        # With a single worker the chunks are simulated in the current process
+        results = executor.map(_simulate_chunk, chunks) if executor is not None else map(_simulate_chunk, chunks)
+        # The partial aggregates are merged as the chunks complete, instead of being held until the end
+        for (chunk_rows, chunk_aggregator, chunk_cache_stats) in results:
+            rows.extend(chunk_rows)
+            if aggregator is not None:
+                aggregator.merge(chunk_aggregator)
+            if cache_stats is not None and chunk_cache_stats is not None:
+                for (name, count) in chunk_cache_stats.items():
+                    cache_stats[name] = cache_stats.get(name, 0) + count
+    return rows
+
+def write_summary(rows:List[Dict[str, Optional[str]]], output_dir:Path) -> Path:
+    """Writes the aggregated summary of a batch run as a CSV file
+
+    Args:
+        rows (List[Dict[str, Optional[str]]]): Summary rows returned by run_batch
+        output_dir (Path): Directory in which the summary file is written
+
+    Returns:
+        Path: Path of the summary file
+    """
+    summary_path = Path(output_dir) / ('Summary__' + str(int(datetime.now().timestamp())) + '.csv')
+    with open(summary_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    n_errors = sum(1 for row in rows if row['error'])
+    if n_errors:
+        logging.warning("{n} of {total} input files could not be simulated (see {path})"
+                            .format(n=n_errors, total=len(rows), path=summary_path))
+    logging.debug("Batch summary written in the file: {path}".format(path=summary_path))
+    return summary_path
@@ -0,0 +1,192 @@
+"""This file contains the compact binary format of Battleship games, with memory-mapped (zero-copy) loading.
+
+A binary game file is a fixed header followed by four packed arrays of coordinates -
+    Header: magic b'BSIM', format version (uint16), reserved (uint16), M, S and T (uint32 each)
+    Player 1 ship locations, Player 2 ship locations (S x-y pairs each, uint32)
+    Player 1 moves, Player 2 moves (T x-y pairs each, uint32)
+All the values are little-endian.
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from collections import abc
+from pathlib import Path
+from typing import Dict, Iterator, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BINARY_MAGIC = b'BSIM'
+BINARY_VERSION = 1
+BINARY_SUFFIX = '.bsim'
+_HEADER = struct.Struct('<4sHHIII')
+
+class CoordinateArray(abc.Sequence):
+    def __init__(self, values:memoryview) -> None:
+        """Read-only sequence of x-y coordinates over a flat buffer of uint32 values (x0, y0, x1, y1, ...).
+        Indexing returns integer tuples, like the lists of tuples of the text format, without copying the buffer.
+
+        Args:
+            values (memoryview): Flat uint32 view of the coordinates (format 'I')
+        """
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values) // 2
+
+    def __getitem__(self, index:Union[int, slice]) -> Union[Tuple[int, int], 'CoordinateArray']:
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            if step != 1:
+                raise ValueError("CoordinateArray only supports contiguous slices.")
+            return CoordinateArray(self.values[2 * start:2 * max(start, stop)])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CoordinateArray index out of range")
+        return (self.values[2 * index], self.values[2 * index + 1])
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return CoordinateIterator(self)
+
+    def max_value(self) -> int:
+        """Largest coordinate value (in bulk with NumPy when it is installed)
+
+        Returns:
+            int: Largest x or y coordinate, or -1 if there are no coordinates
+        """
+        if not len(self.values):
+            return -1
+        if np is not None:
+            return int(np.frombuffer(self.values, dtype=np.uint32).max())
+        return max(self.values)
+
+    def __array__(self, dtype=None, copy=None) -> 'np.ndarray':
+        # Zero-copy (n x 2) NumPy view of the coordinates
+        coordinates = np.frombuffer(self.values, dtype=np.uint32).reshape(-1, 2)
+        return coordinates if dtype is None else coordinates.astype(dtype, copy=False)
+
+class CoordinateIterator():
+    def __init__(self, coordinates:CoordinateArray) -> None:
+        """Iterator over a CoordinateArray, which can also hand out the next coordinates as a (zero-copy) slice
+
+        Args:
+            coordinates (CoordinateArray): Coordinates to iterate over
+        """
+        self.__coordinates = coordinates
+        self.__index = 0
+
+    def __iter__(self) -> 'CoordinateIterator':
+        return self
+
+    def __next__(self) -> Tuple[int, int]:
+        if self.__index >= len(self.__coordinates):
+            raise StopIteration
+        self.__index += 1
+        return self.__coordinates[self.__index - 1]
+
+    def take(self, n_items:int) -> CoordinateArray:
+        """Returns the next n_items coordinates at once
+
+        Args:
+            n_items (int): Number of coordinates to return
+
+        Returns:
+            CoordinateArray: Slice of the next coordinates (may be shorter than n_items at the end)
+        """
+        items = self.__coordinates[self.__index:self.__index + n_items]
+        self.__index += len(items)
+        return items
+
+def _uint32_values(buffer:Union[mmap.mmap, bytes], offset:int, n_values:int) -> memoryview:
+    """Flat uint32 view of a part of the buffer (copied and byte-swapped only on big-endian machines)
+
+    Args:
+        buffer (Union[mmap.mmap, bytes]): Contents of the binary game file
+        offset (int): Byte offset of the first value
+        n_values (int): Number of values
+
+    Returns:
+        memoryview: View of the values (format 'I')
+    """
+    values = memoryview(buffer)[offset:offset + 4 * n_values]
+    if sys.byteorder == 'little':
+        return values.cast('I')
+    values = array('I', bytes(values))
+    values.byteswap()
+    return memoryview(values)
+
+def load_binary(file_path:Path) -> Dict[str, Union[int, CoordinateArray]]:
+    """Memory-maps a binary game file and exposes its ship and move arrays without copying them.
+    The coordinates are not range checked here (see Simulator.read_binary_input).
+
+    Args:
+        file_path (Path): Path of the binary game file
+
+    Raises:
+        ValueError: If the file is not a binary game file, or is truncated
+
+    Returns:
+        Dict[str, Union[int, CoordinateArray]]: Inputs with the same keys as the sanitized inputs of the text format
+            ('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES')
+    """
+    with open(file_path, 'rb') as f:
+        # The mapping stays valid after the file is closed, as long as the arrays refer to it
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Binary game file is truncated. ({path})".format(path=file_path))
+    (magic, version, _, M, S, T) = _HEADER.unpack_from(buffer)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("Not a binary game file (version {version}). ({path})".format(version=BINARY_VERSION, path=file_path))
+    if len(buffer) != _HEADER.size + 4 * (4 * S + 4 * T):
+        raise ValueError("Binary game file does not match its header. ({path})".format(path=file_path))
+
+    inputs = {'M': M, 'S': S, 'T': T}
+    offset = _HEADER.size
+    for (name, n_items) in (('P1_POS_SHIPS', S), ('P2_POS_SHIPS', S), ('P1_MOVES', T), ('P2_MOVES', T)):
+        inputs[name] = CoordinateArray(_uint32_values(buffer, offset, 2 * n_items))
+        offset += 8 * n_items
+    return inputs
+
+def write_binary(inputs:Dict[str, Union[int, Sequence[Tuple[int, int]]]], file_path:Path) -> None:
+    """Writes sanitized game inputs as a binary game file
+
+    Args:
+        inputs (Dict[str, Union[int, Sequence[Tuple[int, int]]]]): Sanitized inputs (as returned by Simulator.get_sim_inputs)
+        file_path (Path): Path of the binary game file to write
+    """
+    with open(file_path, 'wb') as f:
+        f.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, inputs['M'], inputs['S'], inputs['T']))
+        for name in ('P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES'):
+            values = array('I', (v for coordinate in inputs[name] for v in coordinate))
+            if sys.byteorder != 'little':
+                values.byteswap()
+            f.write(values.tobytes())
+
+def convert_text_to_binary(text_path:Path, binary_path:Path) -> None:
+    """Converts an input text file to a binary game file, after performing the sanity checks on it.
+    The board size and number of missiles are not limited (as with the sparse game engine).
+
+    Args:
+        text_path (Path): Path of the input text file
+        binary_path (Path): Path of the binary game file to write
+    """
+    from .simulator import Simulator
+    from .player import Player
+    from .sparse_game import SparseGame
+
+    s = Simulator(p1=Player(), p2=Player(), g=SparseGame())
+    s.read_input(str(Path(text_path).resolve()))
+    write_binary(s.get_sim_inputs(), binary_path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Converts a Battleship input text file to the binary game format")
+    parser.add_argument('text_path', help="Input text file")
+    parser.add_argument('binary_path', help="Binary game file to write (conventionally with the {} suffix)".format(BINARY_SUFFIX))
+    args = parser.parse_args()
+    convert_text_to_binary(Path(args.text_path), Path(args.binary_path))
@@ -0,0 +1,60 @@
+"""This file contains the pool of board grids which are reused across games instead of being allocated for every game.
+"""
+
+from typing import Dict, List
+
+class BoardPool():
+    def __init__(self, max_free:int=8) -> None:
+        """Pool of (M x M) list-of-lists boards, kept per board size
+
+        Args:
+            max_free (int): Number of released boards kept per board size (the rest are left to the garbage collector)
+        """
+        self.__max_free = max_free
+        self.__free = {}
+        self.__empty_rows = {}
+        self.n_allocated = 0
+        self.n_reused = 0
+
+    def acquire(self, board_size:int) -> List[List[str]]:
+        """Hands out a cleared board (every location is '_')
+
+        Args:
+            board_size (int): Board size M
+
+        Returns:
+            List[List[str]]: Board of M rows of M locations
+        """
+        free = self.__free.get(board_size)
+        if not free:
+            self.n_allocated += 1
+            return [['_'] * board_size for _ in range(board_size)]
+
+        self.n_reused += 1
+        board = free.pop()
+        empty_row = self.__empty_rows[board_size]
+        # Rows are cleared in place, so the row lists themselves are reused too
+        for row in board:
+            row[:] = empty_row
+        return board
+
+    def release(self, board:List[List[str]]) -> None:
+        """Takes back a board which is no longer used (it is cleared when it is handed out again)
+
+        Args:
+            board (List[List[str]]): Board handed out by acquire
+        """
+        board_size = len(board)
+        free = self.__free.setdefault(board_size, [])
+        if len(free) < self.__max_free:
+            self.__empty_rows.setdefault(board_size, ['_'] * board_size)
+            free.append(board)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Numbers of boards allocated and reused by the pool
+
+        Returns:
+            Dict[str, int]: 'allocated', 'reused' and 'free' (boards currently held) counts
+        """
+        return {'allocated': self.n_allocated, 'reused': self.n_reused,
+                'free': sum(len(free) for free in self.__free.values())}
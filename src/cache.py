@@ -0,0 +1,152 @@
+"""This file contains the content-addressed result cache: results of already simulated games are kept on disk, keyed on a
+hash of the sanitized simulation inputs, so that resubmitted games are not simulated again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+# Default size limit of the cache directory
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Fraction of the size limit the cache is evicted down to, so that the puts following an eviction do not each rescan
+# the cache directory
+EVICTION_LOW_WATER = 0.9
+
+def _update_locations(h:'hashlib._Hash', locations:Iterable[Tuple[int, int]]) -> None:
+    """Feeds a list of locations to a hash, in the same form whatever container holds them
+
+    Args:
+        h (hashlib._Hash): Hash object
+        locations (Iterable[Tuple[int, int]]): Locations as integer tuples (or ships of fleet games)
+    """
+    h.update(b'|')
+    h.update(':'.join(','.join(map(str, location)) for location in locations).encode())
+
+def input_key(sim_inputs:dict, engine:str) -> Optional[str]:
+    """Canonical hash of sanitized simulation inputs. The ship locations are sorted (their order does not change
+    the game), and the moves are hashed in order.
+
+    Args:
+        sim_inputs (dict): Sanitized inputs ('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES')
+        engine (str): Name of the game engine (the result text of some engines is rendered differently)
+
+    Returns:
+        Optional[str]: Hex digest of the inputs, or None if the moves are streamed (and cannot be hashed up front)
+    """
+    if not all(isinstance(sim_inputs[name], Sequence) for name in ('P1_MOVES', 'P2_MOVES')):
+        return None
+    h = hashlib.sha256(json.dumps([engine, sim_inputs['M'], sim_inputs['S'], sim_inputs['T']]).encode())
+    _update_locations(h, sorted(map(tuple, sim_inputs['P1_POS_SHIPS'])))
+    _update_locations(h, sorted(map(tuple, sim_inputs['P2_POS_SHIPS'])))
+    _update_locations(h, sim_inputs['P1_MOVES'])
+    _update_locations(h, sim_inputs['P2_MOVES'])
+    return h.hexdigest()
+
+class ResultCache():
+    def __init__(self, cache_dir:Path, max_bytes:int=DEFAULT_MAX_BYTES) -> None:
+        """On-disk store of result records (scores, game result and result text with the final boards), one file
+        per key. When the store grows past max_bytes, the least recently used records are evicted down to
+        EVICTION_LOW_WATER of it (the modification time of a record file is its last use).
+
+        Args:
+            cache_dir (Path): Directory of the cache (created if it does not exist)
+            max_bytes (int): Size limit of the record files
+        """
+        self.__cache_dir = Path(cache_dir)
+        self.__cache_dir.mkdir(parents=True, exist_ok=True)
+        self.__max_bytes = max_bytes
+        self.__n_bytes = sum(path.stat().st_size for path in self.__cache_dir.glob('*.json'))
+        self.counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __path(self, key:str) -> Path:
+        """Path of the record file of a key
+
+        Args:
+            key (str): Key of the inputs
+
+        Returns:
+            Path: Record file
+        """
+        return self.__cache_dir / (key + '.json')
+
+    def get(self, key:str) -> Optional[Dict[str, Union[int, str]]]:
+        """Looks up the result record of a game
+
+        Args:
+            key (str): Key of the inputs (see input_key)
+
+        Returns:
+            Optional[Dict[str, Union[int, str]]]: Record ('P1', 'P2', 'result', 'text' and 'decided_turn'), or None on a miss
+        """
+        path = self.__path(key)
+        try:
+            with open(path) as f:
+                record = json.load(f)
+            # Marks the record as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            self.counters['misses'] += 1
+            return None
+        self.counters['hits'] += 1
+        return record
+
+    def put(self, key:str, record:Dict[str, Union[int, str]]) -> None:
+        """Stores the result record of a game, evicting the least recently used records if the cache is full
+
+        Args:
+            key (str): Key of the inputs (see input_key)
+            record (Dict[str, Union[int, str]]): Record ('P1', 'P2', 'result', 'text' and optionally 'decided_turn')
+        """
+        data = json.dumps({field: record.get(field) for field in ('P1', 'P2', 'result', 'text', 'decided_turn')}).encode()
+        if len(data) > self.__max_bytes:
+            return
+        # Written under a temporary name and renamed, so that concurrent readers never see a partial record
+        fd, tmp_path = tempfile.mkstemp(dir=self.__cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # The size of a replaced record is not counted twice
+        try:
+            replaced_size = self.__path(key).stat().st_size
+        except OSError:
+            replaced_size = 0
+        os.replace(tmp_path, self.__path(key))
+        self.__n_bytes += len(data) - replaced_size
+        if self.__n_bytes > self.__max_bytes:
+            self.__evict()
+
+    def __evict(self) -> None:
+        """Deletes the least recently used records until the cache is down to its low-water mark"""
+        entries = []
+        for path in self.__cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        self.__n_bytes = sum(size for (_, size, _) in entries)
+        low_water = self.__max_bytes * EVICTION_LOW_WATER
+        for (_, size, path) in entries:
+            if self.__n_bytes <= low_water:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self.__n_bytes -= size
+            self.counters['evictions'] += 1
+        logging.debug("Result cache evicted down to {n} bytes".format(n=self.__n_bytes))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters, and the size of the cache
+
+        Returns:
+            Dict[str, int]: 'hits', 'misses', 'evictions' and 'bytes'
+        """
+        return dict(self.counters, bytes=self.__n_bytes)
@@ -0,0 +1,139 @@
+"""This file contains the reader and writer of container files, which hold many Battleship games in one file.
+
+A container file is the 7-line input format repeated once per game, each game followed by a separator line ('---').
+Every line of a game is kept as it is (e.g. an empty move line), so a malformed game does not shift the games after it.
+The results are written as JSON lines, one record per game.
+"""
+
+from .simulator import Simulator, SimInputs
+from .player import Player
+from .engines import ENGINES
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+# Number of lines of a single game in the container, and the line following each game
+GAME_N_LINES = len(SimInputs)
+GAME_SEPARATOR = '---'
+
+def _trim_game(lines:List[str]) -> List[str]:
+    """Drops the blank lines after the last line of a game (e.g. before its separator)
+
+    Args:
+        lines (List[str]): Lines of the game
+
+    Returns:
+        List[str]: Lines of the game
+    """
+    while len(lines) > GAME_N_LINES and not lines[-1].strip():
+        lines.pop()
+    return lines
+
+def iter_games(f:TextIO) -> Iterator[Tuple[int, List[str]]]:
+    """Reads the games of a container file one after another. A game is every line up to its separator line,
+    so games with missing or extra lines are yielded as they are (see simulate_game).
+
+    Args:
+        f (TextIO): Container file opened in text mode
+
+    Yields:
+        Tuple[int, List[str]]: Index of the game in the container (starting from 0) and its lines
+    """
+    game_index = 0
+    lines = []
+    for line in f:
+        line = line.rstrip('\n')
+        if line.strip() != GAME_SEPARATOR:
+            lines.append(line)
+            continue
+        yield game_index, _trim_game(lines)
+        game_index += 1
+        lines = []
+    # The separator of the last game may be missing
+    if any(line.strip() for line in lines):
+        yield game_index, _trim_game(lines)
+
+def write_games(games:Iterable[List[str]], f:TextIO) -> None:
+    """Appends games to a container file
+
+    Args:
+        games (Iterable[List[str]]): Lines of each game (in the input text file format)
+        f (TextIO): Container file opened in text mode (for writing or appending)
+    """
+    for lines in games:
+        f.write('\n'.join(lines) + '\n' + GAME_SEPARATOR + '\n')
+
+def pack_files(input_paths:Iterable[Path], container_path:Path) -> int:
+    """Packs individual input files into a single container file
+
+    Args:
+        input_paths (Iterable[Path]): Input text files (one game each)
+        container_path (Path): Path of the container file to write
+
+    Returns:
+        int: Number of games packed into the container
+    """
+    n_games = 0
+    with open(container_path, 'w') as container:
+        for input_path in input_paths:
+            with open(input_path, 'r') as f:
+                lines = f.read().split('\n')[:GAME_N_LINES]
+            write_games([lines], container)
+            n_games += 1
+    return n_games
+
+def simulate_game(game_index:int, lines:List[str], engine:str='default',
+                    simulator:Optional[Simulator]=None) -> Dict[str, Union[int, str]]:
+    """Simulates one game of a container file
+
+    Args:
+        game_index (int): Index of the game in the container
+        lines (List[str]): Lines of the game
+        engine (str): Name of the game engine (see ENGINES)
+        simulator (Optional[Simulator]): Simulator reused from an earlier game (a new one is created if None)
+
+    Returns:
+        Dict[str, Union[int, str]]: Result record of the game, with either the scores and the result,
+            or the error message if the game inputs are invalid
+    """
+    if len(lines) != GAME_N_LINES:
+        return {'game': game_index, 'error': "Game {index} of the container has {n} lines instead of {n_lines}."
+                                                .format(index=game_index, n=len(lines), n_lines=GAME_N_LINES)}
+    s = simulator or Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+    try:
+        s.read_input_lines(lines, name='game-{index}'.format(index=game_index))
+        s.simulate()
+    except ValueError as e:
+        return {'game': game_index, 'error': str(e)}
+    (p1_score, p2_score, result) = s.get_scores()
+    return {'game': game_index, 'P1': p1_score, 'P2': p2_score, 'result': result}
+
+def simulate_container(container_path:Path, output_path:Path, engine:str='default') -> Tuple[int, int]:
+    """Simulates every game of a container file in a single pass, appending one JSON result record per game
+    to the output file. Only one game is held in memory at a time.
+
+    Args:
+        container_path (Path): Path of the container file
+        output_path (Path): Path of the results file (appended to, if it exists)
+        engine (str): Name of the game engine (see ENGINES)
+
+    Returns:
+        Tuple[int, int]: Number of games simulated and number of games with invalid inputs
+    """
+    n_games, n_errors = 0, 0
+    # One simulator (with its game, players and boards) is reused for all the games
+    s = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+    with open(container_path, 'r') as f, open(output_path, 'a') as out:
+        for game_index, lines in iter_games(f):
+            record = simulate_game(game_index, lines, engine, simulator=s)
+            out.write(json.dumps(record) + '\n')
+            n_games += 1
+            n_errors += 'error' in record
+
+    if n_errors:
+        logging.warning("{n} of {total} games in the container could not be simulated (see {path})"
+                            .format(n=n_errors, total=n_games, path=output_path))
+    logging.debug("Container results written in the file: {path}".format(path=output_path))
+    return n_games, n_errors
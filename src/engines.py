@@ -0,0 +1,17 @@
+"""This file contains the registry of game engines which can be selected for a simulation.
+"""
+
+from .game import Game
+from .numpy_game import NumpyGame
+from .sparse_game import SparseGame
+from .fleet import FleetGame
+from .packed import PackedGame
+
+# Game classes by engine name. All of them provide the same methods as the Game class.
+ENGINES = {
+    'default': Game,
+    'numpy': NumpyGame,
+    'sparse': SparseGame,
+    'fleet': FleetGame,
+    'packed': PackedGame,
+}
@@ -0,0 +1,308 @@
+"""This file contains the free-for-all game of Battleship: N players, each firing at an opponent of their choice
+with every move.
+
+Input text file format (4 + 2N lines) -
+    <Board size M>
+    <No. of players N>
+    <No. of ships available to each player>
+    <No. of moves i.e. missiles available to each player>
+    <Player k ship locations, separated by ',' and x-y coordinates separated by ':'>   (one line per player)
+    <Player k moves (in the given order), separated by ':', each as the targeted player, x and y separated by ','>
+                                                                                        (one line per player)
+Every turn, the players fire one missile each, in the order of their IDs. A player's score is the number of
+opponent ships they destroyed, and the players with the highest score win.
+"""
+
+from .game import Game
+from .board_pool import BoardPool
+from .sinks import ResultSink, TextFileSink
+from .simulator import DEFAULT_INPUT_DIR, DEFAULT_OUTPUT_DIR
+from .validator import InputValidator, InputValidationError
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+class FreeForAllGame():
+    # Exclusive upper bounds on the board size (M), number of missiles (T) and number of players (N)
+    max_board_size = Game.max_board_size
+    max_missiles = Game.max_missiles
+    max_players = 1000
+
+    def __init__(self, board_pool:Optional[BoardPool]=None) -> None:
+        """Class containing the boards of the N players of a free-for-all game, indexed by player ID. Moves only
+        touch the board of their target, so a turn takes time proportional to the number of players, whatever
+        the board size.
+
+        Args:
+            board_pool (Optional[BoardPool]): Pool the boards are taken from and returned to on reset
+                (defaults to a pool of this game only)
+        """
+        # Board, ship locations not destroyed yet and score of player k at index k - 1
+        self.__boards = []
+        self.__ships_left = []
+        self.__scores = []
+        self.__board_pool = board_pool if board_pool is not None else BoardPool(max_free=self.max_players)
+
+    def reset(self) -> None:
+        """Clears the game so that the object can be set up for another game. The boards are returned to the pool.
+        """
+        for board in self.__boards:
+            self.__board_pool.release(board)
+        self.__boards = []
+        self.__ships_left = []
+        self.__scores = []
+
+    def setup_boards(self, board_size:int, ships:Sequence[Sequence[Tuple[int, int]]]) -> None:
+        """Sets up the boards of the players
+
+        Args:
+            board_size (int): Size M of the (M x M) boards
+            ships (Sequence[Sequence[Tuple[int, int]]]): Locations of the ships of each player, in the order of the player IDs
+        """
+        self.reset()
+        for player_ships in ships:
+            board = self.__board_pool.acquire(board_size)
+            for (ship_loc_x, ship_loc_y) in player_ships:
+                board[ship_loc_x][ship_loc_y] = 'B'
+            self.__boards.append(board)
+            self.__ships_left.append(len(set(map(tuple, player_ships))))
+        self.__scores = [0] * len(self.__boards)
+
+    def get_n_players(self) -> int:
+        """Number of players of the game
+
+        Returns:
+            int: Number of players N
+        """
+        return len(self.__boards)
+
+    def __check_player_id(self, player_id:int) -> None:
+        """Checks a player ID
+
+        Args:
+            player_id (int): ID of a player
+
+        Raises:
+            ValueError: If the player ID is not between 1 and N
+        """
+        if not 1 <= player_id <= len(self.__boards):
+            raise ValueError("Player ID needs to be between 1 and {N}.".format(N=len(self.__boards)))
+
+    def register_player_move(self, player_id:int, target_id:int, hit_loc:Tuple[int, int]) -> bool:
+        """Registers a player move on the board of the targeted player
+
+        Args:
+            player_id (int): ID of the player making the move
+            target_id (int): ID of the player fired at
+            hit_loc (Tuple[int, int]): Location where the player is making the move. Either hits or misses.
+
+        Raises:
+            ValueError: If a player ID is not between 1 and N, or the player fires at their own board
+
+        Returns:
+            bool: True if the move hit a ship (a location can only be hit once)
+        """
+        self.__check_player_id(player_id)
+        self.__check_player_id(target_id)
+        if target_id == player_id:
+            raise ValueError("Player {k} cannot fire at their own board.".format(k=player_id))
+
+        (hit_loc_x, hit_loc_y) = hit_loc
+        row = self.__boards[target_id - 1][hit_loc_x]
+        if row[hit_loc_y] == 'B':
+            row[hit_loc_y] = 'X'
+            self.__ships_left[target_id - 1] -= 1
+            self.__scores[player_id - 1] += 1
+            return True
+        if row[hit_loc_y] == '_':
+            row[hit_loc_y] = 'O'
+        return False
+
+    def get_player_scores(self, player_id:int) -> int:
+        """Score of a player (number of opponent ships the player destroyed)
+
+        Args:
+            player_id (int): ID of the player
+
+        Returns:
+            int: Score of the player
+        """
+        self.__check_player_id(player_id)
+        return self.__scores[player_id - 1]
+
+    def get_scores(self) -> List[int]:
+        """Scores of all the players
+
+        Returns:
+            List[int]: Score of player k at index k - 1
+        """
+        return list(self.__scores)
+
+    def get_ships_left(self, player_id:int) -> int:
+        """Number of ship locations of a player which are not destroyed yet
+
+        Args:
+            player_id (int): ID of the player
+
+        Returns:
+            int: Number of ship locations left
+        """
+        self.__check_player_id(player_id)
+        return self.__ships_left[player_id - 1]
+
+    def get_player_board(self, player_id:int) -> List[List[str]]:
+        """Current state of a player's battleground board
+
+        Args:
+            player_id (int): ID of the player
+
+        Returns:
+            List[List[str]]: The board (list of list of chars) where each location is either '_', 'O', 'X' or 'B'
+        """
+        self.__check_player_id(player_id)
+        return self.__boards[player_id - 1]
+
+    def get_game_result(self) -> str:
+        """Returns the game result by comparing the players' scores
+
+        Returns:
+            str: "Player k wins", "It is a draw" (all the players have the same score), or
+                "It is a draw between Players i, j, ..." (for the players sharing the highest score)
+        """
+        best_score = max(self.__scores)
+        winners = [player_id for (player_id, score) in enumerate(self.__scores, start=1) if score == best_score]
+        if len(winners) == 1:
+            game_result = "Player {k} wins".format(k=winners[0])
+        elif len(winners) == len(self.__scores):
+            game_result = "It is a draw"
+        else:
+            game_result = "It is a draw between Players {ids}".format(ids=', '.join(map(str, winners)))
+        logging.debug("Game result: {result}".format(result=game_result))
+        return game_result
+
+class FreeForAllSimulator():
+    def __init__(self, g:FreeForAllGame, input_dir:Optional[Path]=None, output_dir:Optional[Path]=None) -> None:
+        """Simulator of free-for-all games (see the input format above)
+
+        Args:
+            g (FreeForAllGame): Game object corresponding to the game
+            input_dir (Optional[Path]): Directory containing the input files (defaults to ../data)
+            output_dir (Optional[Path]): Directory where the result files are written (defaults to ../out)
+        """
+        self.__game = g
+        self.__validator = InputValidator(max_board_size=g.max_board_size, max_missiles=g.max_missiles)
+        self.__sim_inputs = None
+        self.__simulated = False
+        self.__input_file_dir = Path(input_dir) if input_dir else DEFAULT_INPUT_DIR
+        self.__output_file_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+        self.__input_file_name = ""
+
+    def get_game(self) -> FreeForAllGame:
+        """Returns the Game object of the simulator
+
+        Returns:
+            FreeForAllGame: Game object
+        """
+        return self.__game
+
+    def get_sim_inputs(self) -> Dict:
+        """Returns the sanitized inputs of the game
+
+        Returns:
+            Dict: 'M', 'N', 'S', 'T', 'POS_SHIPS' (ship locations of each player) and 'MOVES' (targeted player
+                and location of each move of each player)
+        """
+        return self.__sim_inputs
+
+    def read_input_lines(self, lines:List[str], name:str) -> None:
+        """Reads the inputs of a game from its lines, performs the sanity checks and sets up the boards
+
+        Args:
+            lines (List[str]): Lines of the game in the free-for-all input format
+            name (str): Name of the game (used in the result file name)
+
+        Raises:
+            InputValidationError: With every error, if the inputs are invalid
+        """
+        self.__sim_inputs = None
+        self.__simulated = False
+        self.__input_file_name = name
+        (inputs, errors) = self.__validator.validate_free_for_all_lines(lines, max_players=self.__game.max_players)
+        if errors:
+            raise InputValidationError(errors)
+        self.__sim_inputs = inputs
+        self.__game.setup_boards(board_size=inputs['M'], ships=inputs['POS_SHIPS'])
+
+    def read_input(self, filename:str) -> None:
+        """Reads input from the input text file, performs the sanity checks and sets up the boards
+
+        Args:
+            filename (str): File name of the input file (relative to the input directory, or an absolute path)
+        """
+        with open(self.__input_file_dir / filename, 'r') as f:
+            self.read_input_lines(f.read().split('\n'), name=filename)
+
+    def simulate(self) -> None:
+        """Simulates the game: every turn, each player fires their next move at its target, in the order of the player IDs
+
+        Raises:
+            RuntimeError: If the method is called before the simulation inputs are read
+        """
+        if self.__sim_inputs is None:
+            raise RuntimeError('Simulation input file needs to be read before simulation.')
+        if self.__simulated:
+            return
+
+        register_player_move = self.__game.register_player_move
+        players = list(enumerate(self.__sim_inputs['MOVES'], start=1))
+        for turn in range(self.__sim_inputs['T']):
+            for (player_id, moves) in players:
+                (target_id, hit_loc) = moves[turn]
+                register_player_move(player_id, target_id, hit_loc)
+        self.__simulated = True
+
+    def render_result(self) -> str:
+        """Renders the result of the simulation (the boards, scores and the game result)
+
+        Returns:
+            str: Result text
+        """
+        parts = []
+        for player_id in range(1, self.__game.get_n_players() + 1):
+            parts.append('Player{k}\n'.format(k=player_id))
+            parts.extend(' '.join(row) + ' \n' for row in self.__game.get_player_board(player_id=player_id))
+            parts.append('\n\n\n')
+        for (player_id, score) in enumerate(self.__game.get_scores(), start=1):
+            parts.append('P{k}:{score}\n'.format(k=player_id, score=score))
+        parts.append(self.__game.get_game_result())
+        return ''.join(parts)
+
+    def get_result_record(self) -> dict:
+        """Result record of the simulated game
+
+        Returns:
+            dict: 'input' (input file name), 'scores' (score of player k at index k - 1), 'result' (game result)
+                and 'text' (result text)
+        """
+        return {
+            'input': self.__input_file_name,
+            'scores': self.__game.get_scores(),
+            'result': self.__game.get_game_result(),
+            'text': self.render_result(),
+        }
+
+    def write_result(self, sink:Optional[ResultSink]=None) -> Path:
+        """Writes the result in the output file, or in a result sink which takes records without the 'P1' and
+        'P2' fields (the text and append sinks)
+
+        Args:
+            sink (Optional[ResultSink]): Sink the result record is written to (defaults to a new text file
+                Result__<unix seconds>__<input name>.txt in the output directory)
+
+        Returns:
+            Path: Absolute path of the written output file (or of the file of the sink)
+        """
+        path = (sink or TextFileSink(self.__output_file_dir)).write(self.get_result_record())
+        logging.debug("Simulation result written in the file: {path}".format(path=path))
+        return path
@@ -0,0 +1,307 @@
+"""This file contains the fleet game class for a 2-player game of Battleship with multi-cell ships.
+
+Ships are placed with their first location, length and orientation ('H' along a row, 'V' along a column), and
+a player's score is the number of opponent ships sunk (all of their locations hit). Every board keeps an index from
+each location to the ship on it, and the number of locations of each ship which are not hit yet, so a shot finds
+out whether it sank a ship in constant time, whatever the size of the fleet and of the board.
+"""
+
+from .instrumentation import Instrumentation
+
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+class Ship(NamedTuple):
+    """Ship of a fleet: first location, length and orientation ('H' covers (x, y), (x, y + 1), ..., and 'V'
+    covers (x, y), (x + 1, y), ...)"""
+    x: int
+    y: int
+    length: int = 1
+    orientation: str = 'H'
+
+    def cells(self) -> List[Tuple[int, int]]:
+        """Locations covered by the ship
+
+        Returns:
+            List[Tuple[int, int]]: Locations as integer tuples
+        """
+        if self.orientation == 'H':
+            return [(self.x, self.y + i) for i in range(self.length)]
+        return [(self.x + i, self.y) for i in range(self.length)]
+
+def parse_ship(item:str) -> Ship:
+    """Parses a ship of the input text file: 'x:y' (single location ship) or 'x:y:length:orientation'
+
+    Args:
+        item (str): Ship item
+
+    Raises:
+        ValueError: If the item is in invalid format
+
+    Returns:
+        Ship: The ship
+    """
+    values = item.split(':')
+    if len(values) == 2:
+        return Ship(int(values[0]), int(values[1]))
+    if len(values) == 4 and values[3] in ('H', 'V') and int(values[2]) >= 1:
+        return Ship(int(values[0]), int(values[1]), int(values[2]), values[3])
+    raise ValueError("Ship needs to be 'x:y' or 'x:y:length:H|V': {item}".format(item=item))
+
+def fleet_cells(ships:Iterable[Sequence]) -> List[Tuple[int, int]]:
+    """Locations covered by a fleet
+
+    Args:
+        ships (Iterable[Sequence]): Ship tuples, or x-y locations of single location ships
+
+    Returns:
+        List[Tuple[int, int]]: Locations as integer tuples
+    """
+    return [cell for ship in ships for cell in Ship(*ship).cells()]
+
+def ship_lengths(ships:Iterable[Sequence]) -> List[int]:
+    """Lengths of the ships of a fleet
+
+    Args:
+        ships (Iterable[Sequence]): Ship tuples, or x-y locations of single location ships
+
+    Returns:
+        List[int]: Length of each ship
+    """
+    return [Ship(*ship).length for ship in ships]
+
+def index_fleet(ships:Sequence[Ship], board_size:Optional[int]) -> Tuple[Dict[Tuple[int, int], int], List[Tuple[int, Optional[int]]]]:
+    """Indexes the locations of a fleet, and finds the ships which do not fit on the board or overlap another ship
+
+    Args:
+        ships (Sequence[Ship]): Ships of the fleet
+        board_size (Optional[int]): Board size M (None if the bounds are not checked)
+
+    Returns:
+        Tuple[Dict[Tuple[int, int], int], List[Tuple[int, Optional[int]]]]: Location -> index of the ship on it, and
+            the conflicts as (index of the ship, index of the ship it overlaps, or None if it does not fit on the board)
+    """
+    cell_ships = {}
+    conflicts = []
+    for (index, ship) in enumerate(ships):
+        cells = ship.cells()
+        (last_x, last_y) = cells[-1]
+        if board_size is not None and (ship.x < 0 or ship.y < 0 or last_x >= board_size or last_y >= board_size):
+            conflicts.append((index, None))
+            continue
+        for cell in cells:
+            other = cell_ships.setdefault(cell, index)
+            if other != index:
+                conflicts.append((index, other))
+                break
+    return cell_ships, conflicts
+
+class FleetGame():
+    # Moves are registered one at a time with register_player_move
+    vectorized = False
+    # Ships can cover several locations (see Ship)
+    fleets = True
+    # Move lists are lists of tuples
+    packed = False
+    # The board size (M) and number of missiles (T) are not bounded, since nothing is allocated per board cell
+    max_board_size = None
+    max_missiles = None
+
+    def __init__(self) -> None:
+        """Class containing the player fleets as hashed location -> ship indexes. It provides the same methods as
+        the Game class (with scores counting sunk ships), and reports 'sunk' events to the instrumentation.
+        """
+        self.__board_size = None
+        # Fleet, location -> ship index, locations left per ship, shots and number of ships sunk,
+        # for the board of Player 1 at index 0 and the board of Player 2 at index 1
+        self.__fleets = (None, None)
+        self.__cell_ships = (None, None)
+        self.__cells_left = (None, None)
+        self.__shots = (None, None)
+        self.__ships_sunk = [0, 0]
+        self.__instrumentation = None
+
+    def reset(self) -> None:
+        """Clears the game so that the object can be set up for another game
+        """
+        self.__board_size = None
+        self.__fleets = (None, None)
+        self.__cell_ships = (None, None)
+        self.__cells_left = (None, None)
+        self.__shots = (None, None)
+        self.__ships_sunk = [0, 0]
+
+    def set_instrumentation(self, instrumentation:Optional[Instrumentation]) -> None:
+        """Sets the instrumentation which game events (shots, hits, misses and sunk ships) are reported to
+
+        Args:
+            instrumentation (Optional[Instrumentation]): Instrumentation of the run (None disables the events)
+        """
+        self.__instrumentation = instrumentation
+
+    def set_n_ships(self, n_ships:int) -> None:
+        """Sets the number of ships that players are allowed to place (kept for the Game interface; the fleets
+        set up with setup_boards define the ships)
+
+        Args:
+            n_ships (int): Number of ships
+        """
+
+    def setup_boards(self, n_ships:int, p1_ships:Iterable[Sequence], p2_ships:Iterable[Sequence],
+                        board_size:Optional[int]=None) -> None:
+        """Sets up the fleets of the players
+
+        Args:
+            n_ships (int): Number of ships the players are allowed to place
+            p1_ships (Iterable[Sequence]): Ships of Player 1 (Ship tuples, or x-y locations of single location ships)
+            p2_ships (Iterable[Sequence]): Ships of Player 2
+            board_size (Optional[int]): Size M of the (M x M) boards (defaults to the number of ships)
+
+        Raises:
+            ValueError: If a ship does not fit on the board, or overlaps another ship of the fleet
+        """
+        self.__board_size = board_size or n_ships
+        fleets, cell_ships = [], []
+        for (player_id, ships) in ((1, p1_ships), (2, p2_ships)):
+            fleet = [Ship(*ship) for ship in ships]
+            (index, conflicts) = index_fleet(fleet, self.__board_size)
+            if conflicts:
+                (ship, other) = conflicts[0]
+                raise ValueError("Ship {ship} of Player {k} {problem}.".format(ship=fleet[ship], k=player_id,
+                                    problem="does not fit on the board" if other is None else "overlaps ship {other}".format(other=fleet[other])))
+            fleets.append(fleet)
+            cell_ships.append(index)
+        self.__fleets = tuple(fleets)
+        self.__cell_ships = tuple(cell_ships)
+        self.__cells_left = tuple([ship.length for ship in fleet] for fleet in fleets)
+        self.__shots = ({}, {})
+        self.__ships_sunk = [0, 0]
+
+    def register_player_move(self, player_id:int, hit_loc:Tuple[int, int]) -> bool:
+        """Registers player move on the other player's battleground (board)
+
+        Args:
+            player_id (int): ID of the player making the move (either 1 or 2).
+            hit_loc (Tuple[int, int]): Location where the player is making the move. Either hits or misses.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            bool: True if the move hit a ship (a location can only be hit once)
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        # Player 1 fires at the board of Player 2 (index 1), and Player 2 at the board of Player 1 (index 0)
+        board = 2 - player_id
+        hit_loc = tuple(hit_loc)
+        shots = self.__shots[board]
+        outcome = None
+        sunk_ship = None
+        if hit_loc not in shots:
+            ship = self.__cell_ships[board].get(hit_loc)
+            if ship is None:
+                shots[hit_loc] = 'O'
+                outcome = 'miss'
+            else:
+                shots[hit_loc] = 'X'
+                outcome = 'hit'
+                cells_left = self.__cells_left[board]
+                cells_left[ship] -= 1
+                if cells_left[ship] == 0:
+                    self.__ships_sunk[board] += 1
+                    sunk_ship = self.__fleets[board][ship]
+
+        if self.__instrumentation is not None:
+            self.__instrumentation.emit('shot', player_id, hit_loc)
+            if outcome:
+                self.__instrumentation.emit(outcome, player_id, hit_loc)
+            if sunk_ship is not None:
+                self.__instrumentation.emit('sunk', player_id, sunk_ship)
+        return outcome == 'hit'
+
+    def get_player_scores(self, player_id:int) -> int:
+        """Gets the score of a player: the number of ships sunk on the other player's board
+
+        Args:
+            player_id (int): ID of the player. (Should be either 1 or 2)
+
+        Raises:
+            ValueError: If player ID is other than 1 or 2
+
+        Returns:
+            int: Player score
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        return self.__ships_sunk[2 - player_id]
+
+    def get_ships_left(self, player_id:int) -> List[Ship]:
+        """Ships of a player which are not sunk yet
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            List[Ship]: Ships with locations not hit yet
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        board = player_id - 1
+        return [ship for (ship, cells_left) in zip(self.__fleets[board], self.__cells_left[board]) if cells_left]
+
+    def get_occupied_cells(self, player_id:int) -> Dict[Tuple[int, int], str]:
+        """Locations of a player's board which are not empty, i.e. the ships and the shots fired at the board
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            Dict[Tuple[int, int], str]: Location -> either 'O', 'X' or 'B', sorted by location
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        cells = dict.fromkeys(self.__cell_ships[player_id - 1], 'B')
+        cells.update(self.__shots[player_id - 1])
+        return dict(sorted(cells.items()))
+
+    def get_player_board(self, player_id:int) -> List[List[str]]:
+        """Current state of a player's battleground board, expanded to a dense (M x M) list of lists.
+        This allocates the full grid; use get_occupied_cells for large boards.
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            List[List[str]]: The board (list of list of chars) where each location is either '_', 'O', 'X' or 'B'
+        """
+        board = [['_'] * self.__board_size for _ in range(self.__board_size)]
+        for (loc_x, loc_y), cell in self.get_occupied_cells(player_id).items():
+            board[loc_x][loc_y] = cell
+        return board
+
+    def get_game_result(self) -> str:
+        """Returns the game result by comparing the numbers of ships sunk
+
+        Returns:
+            str: Either "It is a draw", "Player 1 wins" or "Player 2 wins" depending on player scores
+        """
+        (p1_ships_sunk, p2_ships_sunk) = self.__ships_sunk
+        game_result = ''
+        if p1_ships_sunk == p2_ships_sunk:
+            game_result = "It is a draw"
+        elif p1_ships_sunk > p2_ships_sunk:
+            game_result = "Player 2 wins"
+        else:
+            game_result = "Player 1 wins"
+        logging.debug("Game result: {result}".format(result=game_result))
+        return game_result
@@ -2,18 +2,59 @@
 """
 
 
+from .instrumentation import Instrumentation
+from .board_pool import BoardPool
+
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 class Game():
-    def __init__(self) -> None:
+    __slots__ = ('__n_ships', '__p1_board', '__p2_board', '__p1_ships_destroyed', '__p2_ships_destroyed',
+                    '__instrumentation', '__board_pool')
+    # Moves are registered one at a time with register_player_move (see NumpyGame for whole-game resolution)
+    vectorized = False
+    # Ships cover a single location each (see FleetGame for multi-location ships)
+    fleets = False
+    # Move lists are lists of tuples (see PackedGame for packed locations)
+    packed = False
+    # Exclusive upper bounds on the board size (M) and number of missiles (T) accepted by the Simulator
+    max_board_size = 10
+    max_missiles = 100
+
+    def __init__(self, board_pool:Optional[BoardPool]=None) -> None:
         """Class containing members and methods for storing and manipulating player battlegrounds
+
+        Args:
+            board_pool (Optional[BoardPool]): Pool the boards are taken from and returned to on reset
+                (defaults to a pool of this game only, which is enough to reuse the boards of a reused game)
         """
         self.__n_ships = None
         self.__p1_board = None
         self.__p2_board = None
         self.__p1_ships_destroyed = 0
         self.__p2_ships_destroyed = 0
+        self.__instrumentation = None
+        self.__board_pool = board_pool if board_pool is not None else BoardPool(max_free=2)
+
+    def reset(self) -> None:
+        """Clears the game so that the object can be set up for another game. The boards are returned to the pool.
+        """
+        for board in (self.__p1_board, self.__p2_board):
+            if board is not None:
+                self.__board_pool.release(board)
+        self.__n_ships = None
+        self.__p1_board = None
+        self.__p2_board = None
+        self.__p1_ships_destroyed = 0
+        self.__p2_ships_destroyed = 0
+
+    def set_instrumentation(self, instrumentation:Optional[Instrumentation]) -> None:
+        """Sets the instrumentation which game events (shots, hits and misses) are reported to
+
+        Args:
+            instrumentation (Optional[Instrumentation]): Instrumentation of the run (None disables the events)
+        """
+        self.__instrumentation = instrumentation
     
     def set_n_ships(self, n_ships:int) -> None:
         """Sets the number of ships that players are allowed to place
@@ -23,26 +64,29 @@ class Game():
         """
         self.__n_ships = n_ships
 
-    def setup_boards(self, n_ships:int, p1_ships:List[Tuple[int, int]], p2_ships:List[Tuple[int, int]]) -> None:
+    def setup_boards(self, n_ships:int, p1_ships:List[Tuple[int, int]], p2_ships:List[Tuple[int, int]], 
+                        board_size:Optional[int]=None) -> None:
         """Sets up the battlegrounds ('player boards') in the form of list of lists for simulating the game
 
         Args:
             n_ships (int): Number of ships the players are allowed to place
             p1_ships (List[Tuple[int, int]]): Locations of the ships of Player 1
             p2_ships (List[Tuple[int, int]]): Locations of the ships of Player 2
+            board_size (Optional[int]): Size M of the (M x M) boards (defaults to the number of ships)
         """
         if not self.__n_ships:
             self.__n_ships = n_ships
+        board_size = board_size or self.__n_ships
         
         # Initialize the player boards
-        self.__p1_board = [['_'] * self.__n_ships for _ in range(self.__n_ships)]
+        self.__p1_board = self.__board_pool.acquire(board_size)
         for (ship_loc_x, ship_loc_y) in p1_ships:
             self.__p1_board[ship_loc_x][ship_loc_y] = 'B'
-        self.__p2_board = [['_'] * self.__n_ships for _ in range(self.__n_ships)]
+        self.__p2_board = self.__board_pool.acquire(board_size)
         for (ship_loc_x, ship_loc_y) in p2_ships:
             self.__p2_board[ship_loc_x][ship_loc_y] = 'B' 
     
-    def register_player_move(self, player_id:int, hit_loc:Tuple[int, int]) -> None:
+    def register_player_move(self, player_id:int, hit_loc:Tuple[int, int]) -> bool:
         """Registers player move on the other player's battleground (board)
 
         Args:
@@ -50,28 +94,39 @@ class Game():
             hit_loc (Tuple[int, int]): Location where the player is making the move. Either hits or misses.
 
         Raises:
-            ValueError: If the player ID is not 1 or 2. 
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            bool: True if the move hit a ship (a location can only be hit once)
         """
         (hit_loc_x, hit_loc_y) = hit_loc
+        outcome = None
         if player_id == 1:
             if self.__p2_board[hit_loc_x][hit_loc_y] == 'B':
                 self.__p2_board[hit_loc_x][hit_loc_y] = 'X'
-                logging.debug("Player 1 hit a missile at ({x},{y})".format(x=hit_loc_x, y=hit_loc_y))
                 self.__p2_ships_destroyed += 1
+                outcome = 'hit'
             elif self.__p2_board[hit_loc_x][hit_loc_y] == '_':
                 self.__p2_board[hit_loc_x][hit_loc_y] = 'O'
-                logging.debug("Player 1 missed a missile at ({x},{y})".format(x=hit_loc_x, y=hit_loc_y))
+                outcome = 'miss'
         elif player_id == 2:
             if self.__p1_board[hit_loc_x][hit_loc_y] == 'B':
                 self.__p1_board[hit_loc_x][hit_loc_y] = 'X'
-                logging.debug("Player 2 hit a missile at ({x},{y})".format(x=hit_loc_x, y=hit_loc_y))
                 self.__p1_ships_destroyed += 1
+                outcome = 'hit'
             elif self.__p1_board[hit_loc_x][hit_loc_y] == '_':
                 self.__p1_board[hit_loc_x][hit_loc_y] = 'O'
-                logging.debug("Player 2 missed a missile at ({x},{y})".format(x=hit_loc_x, y=hit_loc_y))
+                outcome = 'miss'
         else:
             raise ValueError("Player ID needs to be either 1 or 2.")
 
+        # Events are only built when instrumentation is enabled, to keep the hot path free of logging
+        if self.__instrumentation is not None:
+            self.__instrumentation.emit('shot', player_id, hit_loc)
+            if outcome:
+                self.__instrumentation.emit(outcome, player_id, hit_loc)
+        return outcome == 'hit'
+
     def get_player_scores(self, player_id:int) -> int:
         """Gets the score of a player depending on the current state of the other player's board
 
@@ -91,7 +146,6 @@ class Game():
             score = self.__p1_ships_destroyed
         else:
             raise ValueError("Player ID needs to be either 1 or 2.")
-        logging.debug("Player {id} score: {score}".format(id=player_id, score=score))
         return score
     
     def get_player_board(self, player_id:int) -> List[List[str]]:
@@ -113,7 +167,6 @@ class Game():
             board = self.__p2_board
         else:
             raise ValueError("Player ID needs to be either 1 or 2.")
-        logging.debug("Player {id} board returned.".format(id=player_id))
         return board
 
     def get_game_result(self) -> str:
@@ -0,0 +1,113 @@
+"""This file contains the instrumentation (event hooks, counters and per-phase timers) of the Battleship simulator.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# Game events which hooks can be added for, and the arguments the hooks are called with -
+#   shot (player_id, hit_loc), hit (player_id, hit_loc), miss (player_id, hit_loc),
+#   sunk (player_id, ship) (fleet games only), game_over (game_result, p1_score, p2_score)
+EVENTS = ('shot', 'hit', 'miss', 'sunk', 'game_over')
+
+# Phases of a simulation run which are timed, in the order they happen
+PHASES = ('parse', 'validate', 'setup', 'simulate', 'render', 'write')
+
+class Instrumentation():
+    def __init__(self) -> None:
+        """Class containing the event hooks, event counters and per-phase timers of a simulation run.
+        The simulator classes only call into it when one is given to them, so it costs nothing when disabled.
+        """
+        self.__hooks = {event: [] for event in EVENTS}
+        self.counters = Counter()
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self.phase_calls = Counter()
+
+    def add_hook(self, event:str, hook:Callable) -> None:
+        """Adds a hook which is called whenever the event happens
+
+        Args:
+            event (str): Name of the event (see EVENTS)
+            hook (Callable): Function called with the arguments of the event
+
+        Raises:
+            ValueError: If the event name is not one of EVENTS
+        """
+        if event not in self.__hooks:
+            raise ValueError("Event needs to be one of {events}.".format(events=', '.join(EVENTS)))
+        self.__hooks[event].append(hook)
+
+    def has_hooks(self, *events:str) -> bool:
+        """Whether any hook is added for (any of) the events
+
+        Args:
+            events (str): Names of the events
+
+        Returns:
+            bool: True if at least one of the events has a hook
+        """
+        return any(self.__hooks[event] for event in events)
+
+    def count(self, event:str, n_events:int) -> None:
+        """Counts several occurrences of an event at once, without calling its hooks (for game engines resolving
+        many shots at once, when the event has no hooks; see has_hooks)
+
+        Args:
+            event (str): Name of the event (see EVENTS)
+            n_events (int): Number of occurrences
+        """
+        self.counters[event] += n_events
+
+    def emit(self, event:str, *args) -> None:
+        """Counts an event and calls its hooks
+
+        Args:
+            event (str): Name of the event (see EVENTS)
+            args: Arguments of the event
+        """
+        self.counters[event] += 1
+        for hook in self.__hooks[event]:
+            hook(*args)
+
+    @contextmanager
+    def phase(self, name:str) -> Iterator[None]:
+        """Context manager timing a phase of the simulation run (the time of repeated phases adds up)
+
+        Args:
+            name (str): Name of the phase (see PHASES)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+            self.phase_calls[name] += 1
+
+    def add_log_hooks(self) -> None:
+        """Adds hooks logging every game event as a debug message
+        """
+        self.add_hook('hit', lambda player_id, hit_loc: logging.debug("Player {id} hit a missile at ({x},{y})"
+                                                                        .format(id=player_id, x=hit_loc[0], y=hit_loc[1])))
+        self.add_hook('miss', lambda player_id, hit_loc: logging.debug("Player {id} missed a missile at ({x},{y})"
+                                                                        .format(id=player_id, x=hit_loc[0], y=hit_loc[1])))
+        self.add_hook('sunk', lambda player_id, ship: logging.debug("Player {id} sank the ship at ({x},{y})"
+                                                                        .format(id=player_id, x=ship[0], y=ship[1])))
+        self.add_hook('game_over', lambda game_result, p1_score, p2_score: logging.debug("Game result: {result} (P1:{p1}, P2:{p2})"
+                                                                        .format(result=game_result, p1=p1_score, p2=p2_score)))
+
+    def report(self) -> str:
+        """Per-phase breakdown of the timings, and the event counters
+
+        Returns:
+            str: Printable report, one line per phase
+        """
+        total = sum(self.timings.values())
+        lines = ['{phase:<10}{calls:>8}{ms:>14}{share:>9}'.format(phase='Phase', calls='Calls', ms='Time (ms)', share='Share')]
+        for (name, seconds) in self.timings.items():
+            lines.append('{phase:<10}{calls:>8}{ms:>14.3f}{share:>8.1f}%'.format(
+                phase=name, calls=self.phase_calls[name], ms=seconds * 1e3, share=100 * seconds / total if total else 0.0))
+        lines.append('{phase:<10}{calls:>8}{ms:>14.3f}'.format(phase='total', calls='', ms=total * 1e3))
+        lines.append('Events: ' + ' '.join('{event}={n}'.format(event=event, n=self.counters[event]) for event in EVENTS))
+        return '\n'.join(lines)
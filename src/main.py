@@ -3,10 +3,25 @@
 
 from .simulator import Simulator
 from .player import Player
-from .game import Game
+from .engines import ENGINES
+from . import batch
+from . import container
+from .binary_format import BINARY_SUFFIX
+from .instrumentation import Instrumentation
+from . import monte_carlo
+from .strategies import STRATEGIES
+from .sinks import SINKS, open_sink
+from .cache import ResultCache, DEFAULT_MAX_BYTES
+from .replay import REPLAY_SUFFIX
+from .ffa import FreeForAllGame, FreeForAllSimulator
+from .salvo import SalvoSimulator
+from .aggregate import HeatmapAggregator
+from .spectator import Spectator, DEFAULT_FPS
 
 import argparse
 import logging
+from datetime import datetime
+from pathlib import Path
 
 # Command line argument parser
 parser = argparse.ArgumentParser()
@@ -23,25 +38,235 @@ parser.add_argument(
 )
 parser.add_argument(
     '-i', '--input',
-    help="Simulation input file name",
+    help="Simulation input file name (binary game files are read if the name ends with {})".format(BINARY_SUFFIX),
     dest="filename",
     default="sample-data-1.txt",
 )
+parser.add_argument(
+    '-e', '--engine',
+    help="Game engine used for the simulation ('numpy' resolves whole move lists at once)",
+    dest="engine", choices=sorted(ENGINES),
+    default="default",
+)
+parser.add_argument(
+    '-p', '--profile',
+    help="Print a per-phase timing breakdown and the game event counters of the simulation",
+    action="store_true", dest="profile",
+)
+parser.add_argument(
+    '--p1-strategy',
+    help="Live shooting strategy of Player 1 (replaces the moves of the input file)",
+    dest="p1_strategy", choices=sorted(STRATEGIES),
+    default=None,
+)
+parser.add_argument(
+    '--p2-strategy',
+    help="Live shooting strategy of Player 2 (replaces the moves of the input file)",
+    dest="p2_strategy", choices=sorted(STRATEGIES),
+    default=None,
+)
+parser.add_argument(
+    '--early-exit',
+    help="Stop firing as soon as the game result can no longer change (the result boards do not show the remaining moves)",
+    action="store_true", dest="early_exit",
+)
+parser.add_argument(
+    '--replay',
+    help="Record the shots of the game with periodic board snapshots, and save them in a replay file "
+            "(conventionally with the {} suffix)".format(REPLAY_SUFFIX),
+    dest="replay_path",
+    default=None,
+)
+parser.add_argument(
+    '--watch',
+    help="Draw the boards live in the terminal while the game is simulated",
+    action="store_true", dest="watch",
+)
+parser.add_argument(
+    '--fps',
+    help="Frames drawn per second by --watch",
+    dest="fps", type=float,
+    default=DEFAULT_FPS,
+)
+parser.add_argument(
+    '--free-for-all',
+    help="The input file is a free-for-all game of N players, each firing at an opponent of their choice",
+    action="store_true", dest="free_for_all",
+)
+parser.add_argument(
+    '--salvo',
+    help="The input file is a salvo game, where each player fires a volley of shots every turn",
+    action="store_true", dest="salvo",
+)
+parser.add_argument(
+    '-s', '--stream',
+    help="Parse the player moves lazily from the input file while simulating (constant memory for any T)",
+    action="store_true", dest="stream",
+)
+parser.add_argument(
+    '-b', '--batch',
+    help="Simulate all the input files in a directory (or matching a glob pattern) over a process pool",
+    dest="batch",
+    default=None,
+)
+parser.add_argument(
+    '--aggregate',
+    help="With --batch, aggregate the per-location hit, miss and ship survival counts and the score distributions "
+            "of all the games, and write them to PATH (a .npz archive, or CSV files for any other suffix)",
+    dest="aggregate_path", metavar="PATH",
+    default=None,
+)
+parser.add_argument(
+    '-c', '--container',
+    help="Simulate all the games of a container file one after another, writing one result record per game",
+    dest="container",
+    default=None,
+)
+parser.add_argument(
+    '-m', '--monte-carlo',
+    help="Simulate N games with the ship layouts of the input file and random move lists, and print the result distribution",
+    dest="monte_carlo", type=int, metavar="N",
+    default=None,
+)
+parser.add_argument(
+    '--seed',
+    help="Seed of the random move lists for --monte-carlo, and of the player strategies",
+    dest="seed", type=int,
+    default=None,
+)
+parser.add_argument(
+    '-w', '--workers',
+    help="Number of worker processes for --batch (defaults to the number of CPUs)",
+    dest="workers", type=int,
+    default=None,
+)
+parser.add_argument(
+    '--chunksize',
+    help="Number of input files handed to a worker at once for --batch",
+    dest="chunksize", type=int,
+    default=None,
+)
+parser.add_argument(
+    '--sink',
+    help="Where results are written: a text file per game ('text'), one JSON line per game in one file ('append') "
+            "or a SQLite table ('sqlite')",
+    dest="sink", choices=SINKS,
+    default="text",
+)
+parser.add_argument(
+    '--sink-path',
+    help="Results file of the 'append' sink or database file of the 'sqlite' sink (defaults to a file in the output directory)",
+    dest="sink_path",
+    default=None,
+)
+parser.add_argument(
+    '--cache',
+    help="Directory of the result cache: games whose inputs were already simulated are not simulated again",
+    dest="cache_dir",
+    default=None,
+)
+parser.add_argument(
+    '--cache-size',
+    help="Size limit of the result cache in MB (least recently used results are evicted)",
+    dest="cache_size", type=float,
+    default=DEFAULT_MAX_BYTES / 2**20,
+)
+parser.add_argument(
+    '-o', '--output-dir',
+    help="Directory for the result files (defaults to out/)",
+    dest="output_dir",
+    default=str(Path(__file__).parent.resolve() / '..' / 'out'),
+)
 args = parser.parse_args()
+if args.free_for_all and args.sink == 'sqlite':
+    # The SQLite table holds the scores of 2-player games only
+    parser.error("--sink=sqlite is not available for --free-for-all games (use text or append)")
 
 # Logging level as mentioned in the command-line arguments 
 # (Can be set to --debug for the verbose debug messages)
 logging.basicConfig(level=args.loglevel)
 
-if __name__ == "__main__":
+if __name__ == "__main__" and args.batch:
+    # Simulate every input file of the batch over a pool of worker processes and summarize the results
+    aggregator = HeatmapAggregator() if args.aggregate_path else None
+    cache_stats = {}
+    rows = batch.run_batch(batch.collect_input_files(args.batch), Path(args.output_dir).resolve(),
+                            workers=args.workers, chunksize=args.chunksize, engine=args.engine,
+                            sink=args.sink, sink_path=args.sink_path, cache_dir=args.cache_dir,
+                            cache_max_bytes=int(args.cache_size * 2**20), cache_stats=cache_stats, aggregator=aggregator)
+    batch.write_summary(rows, Path(args.output_dir).resolve())
+    if cache_stats:
+        logging.info("Result cache: {stats}".format(stats=cache_stats))
+    if aggregator is not None:
+        aggregator.save(Path(args.aggregate_path))
+elif __name__ == "__main__" and args.container:
+    # Simulate the games of the container file in a single pass, appending a JSON result record per game
+    output_path = Path(args.output_dir).resolve() / ('Result__' + str(int(datetime.now().timestamp())) + '__' 
+                                                        + Path(args.container).name.split('.')[0] + '.jsonl')
+    container.simulate_container(Path(args.container), output_path, engine=args.engine)
+elif __name__ == "__main__" and args.free_for_all:
+    # Simulate the N-player game and write its boards, scores and result
+    s = FreeForAllSimulator(g=FreeForAllGame(), output_dir=Path(args.output_dir).resolve())
+    s.read_input(args.filename)
+    s.simulate()
+    with open_sink(args.sink, Path(args.output_dir).resolve(), args.sink_path) as sink:
+        s.write_result(sink)
+elif __name__ == "__main__" and args.salvo:
+    # Simulate the volleys of the game with the selected engine and write its boards, scores and result
+    s = SalvoSimulator(g=ENGINES[args.engine](), output_dir=Path(args.output_dir).resolve())
+    s.read_input(args.filename)
+    s.simulate()
+    with open_sink(args.sink, Path(args.output_dir).resolve(), args.sink_path) as sink:
+        s.write_result(sink)
+elif __name__ == "__main__" and args.monte_carlo:
+    # Simulate N games of the scenario (ship layouts, board size, number of missiles) of the input file at once
+    s = Simulator(p1=Player(), p2=Player(), g=ENGINES[args.engine]())
+    s.read_input(args.filename)
+    inputs = s.get_sim_inputs()
+    distribution = monte_carlo.estimate_outcomes(inputs['M'], inputs['P1_POS_SHIPS'], inputs['P2_POS_SHIPS'], 
+                                                    inputs['T'], args.monte_carlo, seed=args.seed)
+    for (result, n_games) in distribution.items():
+        print("{result:<15}{n:>12}{share:>9.2%}".format(result=result, n=n_games, share=n_games / args.monte_carlo))
+elif __name__ == "__main__":
+    # Instrumentation is only enabled for profiling, to watch the game, or to log every game event in debug mode
+    instrumentation = None
+    if args.profile or args.watch or args.loglevel == logging.DEBUG:
+        instrumentation = Instrumentation()
+        if args.loglevel == logging.DEBUG:
+            instrumentation.add_log_hooks()
+
     # Create a Simulator class object and pass it two Player objects and a Game object 
-    s = Simulator(p1=Player(), p2=Player(), g=Game())
+    # The strategies of the players are seeded differently, so that they do not draw the same random numbers
+    players = [Player(strategy=STRATEGIES[strategy](seed=None if args.seed is None else args.seed + player_n) if strategy else None)
+                for (player_n, strategy) in enumerate((args.p1_strategy, args.p2_strategy))]
+    cache = ResultCache(Path(args.cache_dir), max_bytes=int(args.cache_size * 2**20)) if args.cache_dir else None
+    s = Simulator(p1=players[0], p2=players[1], g=ENGINES[args.engine](), output_dir=Path(args.output_dir).resolve(),
+                    instrumentation=instrumentation, cache=cache, early_exit=args.early_exit,
+                    replay=args.replay_path is not None)
     
     # Read input from a file (if not given a command-line argument, defaults to sampel-data-1.txt)
-    s.read_input(args.filename)
+    if args.filename.endswith(BINARY_SUFFIX):
+        s.read_binary_input(args.filename)
+    else:
+        s.read_input(args.filename, streaming=args.stream)
 
-    # Simulate using the data given in the file
-    s.simulate()
+    # Simulate using the data given in the file (drawing the boards live with --watch)
+    if args.watch:
+        spectator = Spectator.from_simulator(s, fps=args.fps)
+        spectator.attach(instrumentation)
+        with spectator:
+            s.simulate()
+    else:
+        s.simulate()
+    logging.info("Game result decided after turn {turn} of {n}".format(turn=s.get_decided_turn(), n=s.get_sim_inputs()['T']))
+    if args.replay_path:
+        s.get_replay().save(Path(args.replay_path))
+
+    # Writes the result of the simulation in the currospondingly named file in out/ (or in the selected sink)
+    with open_sink(args.sink, Path(args.output_dir).resolve(), args.sink_path) as sink:
+        s.write_result(sink)
 
-    # Writes the result of the simulation in the currospondingly named file in out/
-    s.write_result()
\ No newline at end of file
+    if args.profile:
+        print(instrumentation.report())
+    if cache is not None:
+        logging.info("Result cache: {stats}".format(stats=cache.get_stats()))
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""This file contains the batched Monte Carlo engine, which simulates N games of the same scenario as one tensor.
+"""
+
+from .fleet import Ship, fleet_cells
+
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Result codes of the batched games, and the game results (as in Game.get_game_result) they correspond to
+DRAW, P1_WINS, P2_WINS = 0, 1, 2
+RESULT_STRINGS = ("It is a draw", "Player 1 wins", "Player 2 wins")
+
+# Number of games held in memory at once (boards take chunk_size x M x M bytes per player)
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+def random_moves(rng:'np.random.Generator', n_games:int, n_missiles:int, board_size:int) -> 'np.ndarray':
+    """Draws uniformly random move lists for a batch of games
+
+    Args:
+        rng (np.random.Generator): Random number generator
+        n_games (int): Number of games N
+        n_missiles (int): Number of missiles T of each game
+        board_size (int): Board size M
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Returns:
+        np.ndarray: (N, T, 2) array of move locations
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the Monte Carlo engine.")
+    return rng.integers(0, board_size, size=(n_games, n_missiles, 2), dtype=np.intp)
+
+def _count_hits(ship_cells:'np.ndarray', moves:'np.ndarray', board_size:int) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Number of ships hit by each game's move list on the same board. Shot t of all the games is applied
+    in one vectorized step, and only the first shot at a location can hit.
+
+    Args:
+        ship_cells (np.ndarray): (M * M,) boolean mask of the ship locations on the (flattened) board
+        moves (np.ndarray): (N, T, 2) array of move locations
+        board_size (int): Board size M
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N,) number of hits of each game, and (N, M * M) mask of the locations
+            shot in each game
+    """
+    (n_games, n_missiles, _) = moves.shape
+    games = np.arange(n_games)
+    shot = np.zeros((n_games, board_size * board_size), dtype=bool)
+    hits = np.zeros(n_games, dtype=np.int64)
+    flat_moves = moves[:, :, 0] * board_size + moves[:, :, 1]
+    for t in range(n_missiles):
+        cells = flat_moves[:, t]
+        hits += ship_cells[cells] & ~shot[games, cells]
+        shot[games, cells] = True
+    return hits, shot
+
+def _count_sunk(ships:Sequence[Sequence], shot:'np.ndarray', board_size:int) -> 'np.ndarray':
+    """Number of ships of a fleet sunk (all of their locations shot) in each game
+
+    Args:
+        ships (Sequence[Sequence]): Ship tuples of the fleet
+        shot (np.ndarray): (N, M * M) mask of the locations shot in each game
+        board_size (int): Board size M
+
+    Returns:
+        np.ndarray: (N,) number of sunk ships of each game
+    """
+    if not len(ships):
+        return np.zeros(len(shot), dtype=np.int64)
+    ship_cells = [Ship(*ship).cells() for ship in ships]
+    cells = np.array([loc_x * board_size + loc_y for cells in ship_cells for (loc_x, loc_y) in cells], dtype=np.intp)
+    starts = np.cumsum([0] + [len(cells) for cells in ship_cells[:-1]])
+    return np.logical_and.reduceat(shot[:, cells], starts, axis=1).sum(axis=1)
+
+def simulate_batch(board_size:int, p1_ships:Sequence[Tuple[int, int]], p2_ships:Sequence[Tuple[int, int]],
+                    p1_moves:'np.ndarray', p2_moves:'np.ndarray',
+                    chunk_size:int=DEFAULT_CHUNK_SIZE) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Simulates N games with the same ship layouts and different move lists at once.
+    Gives the same scores and results as simulating each game with the Simulator. Fleets of multi-location ships
+    (Ship tuples) are scored by their sunk ships, as by the fleet game engine.
+
+    Args:
+        board_size (int): Board size M
+        p1_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 1 (or Ship tuples of its fleet)
+        p2_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 2 (or Ship tuples of its fleet)
+        p1_moves (np.ndarray): (N, T, 2) array of the moves of Player 1 in each game
+        p2_moves (np.ndarray): (N, T, 2) array of the moves of Player 2 in each game
+        chunk_size (int): Number of games held in memory at once
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If the move arrays of the players do not have the same shape
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (N,) arrays of the scores of Player 1, the scores of Player 2
+            and the result codes (DRAW, P1_WINS or P2_WINS) of the games
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the Monte Carlo engine.")
+    p1_moves = np.asarray(p1_moves, dtype=np.intp)
+    p2_moves = np.asarray(p2_moves, dtype=np.intp)
+    if p1_moves.shape != p2_moves.shape or p1_moves.ndim != 3:
+        raise ValueError("Move arrays of both players need to have the same (N, T, 2) shape.")
+
+    ship_cells = []
+    fleets = []
+    for ships in (p1_ships, p2_ships):
+        # Single location ships score a point per hit, and the ships of fleets a point when they are sunk
+        fleets.append(ships if any(len(ship) != 2 for ship in ships) else None)
+        locations = np.asarray(fleet_cells(ships) if fleets[-1] else ships, dtype=np.intp).reshape(-1, 2)
+        cells = np.zeros(board_size * board_size, dtype=bool)
+        cells[locations[:, 0] * board_size + locations[:, 1]] = True
+        ship_cells.append(cells)
+
+    n_games = len(p1_moves)
+    p1_scores = np.empty(n_games, dtype=np.int64)
+    p2_scores = np.empty(n_games, dtype=np.int64)
+    for start in range(0, n_games, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        # Player 1 fires at the board of Player 2, and vice versa
+        for (scores, moves, opponent) in ((p1_scores, p1_moves, 1), (p2_scores, p2_moves, 0)):
+            (hits, shot) = _count_hits(ship_cells[opponent], moves[chunk], board_size)
+            scores[chunk] = hits if fleets[opponent] is None else _count_sunk(fleets[opponent], shot, board_size)
+
+    results = np.where(p1_scores > p2_scores, P1_WINS, np.where(p1_scores < p2_scores, P2_WINS, DRAW))
+    return p1_scores, p2_scores, results
+
+def estimate_outcomes(board_size:int, p1_ships:Sequence[Tuple[int, int]], p2_ships:Sequence[Tuple[int, int]],
+                        n_missiles:int, n_games:int, seed:Optional[int]=None,
+                        chunk_size:int=DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+    """Estimates the win, loss and draw distribution of ship layouts against uniformly random move lists
+
+    Args:
+        board_size (int): Board size M
+        p1_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 1 (or Ship tuples of its fleet)
+        p2_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 2 (or Ship tuples of its fleet)
+        n_missiles (int): Number of missiles T of each player
+        n_games (int): Number of games N to simulate
+        seed (Optional[int]): Seed of the random move lists
+        chunk_size (int): Number of games simulated at once
+
+    Raises:
+        ImportError: If NumPy is not installed
+
+    Returns:
+        Dict[str, int]: Number of games per result ("Player 1 wins", "Player 2 wins" and "It is a draw")
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the Monte Carlo engine.")
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(len(RESULT_STRINGS), dtype=np.int64)
+    for start in range(0, n_games, chunk_size):
+        n_chunk_games = min(chunk_size, n_games - start)
+        (_, _, results) = simulate_batch(board_size, p1_ships, p2_ships,
+                                            random_moves(rng, n_chunk_games, n_missiles, board_size),
+                                            random_moves(rng, n_chunk_games, n_missiles, board_size),
+                                            chunk_size=chunk_size)
+        counts += np.bincount(results, minlength=len(RESULT_STRINGS))
+    return {RESULT_STRINGS[code]: int(counts[code]) for code in (P1_WINS, P2_WINS, DRAW)}
@@ -0,0 +1,299 @@
+"""This file contains the NumPy-backed game class for a 2-player game of Battleship.
+"""
+
+from .instrumentation import Instrumentation
+
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Cell states of the NumPy boards, and the characters they correspond to on the 'list of lists' boards
+EMPTY, SHIP, MISS, HIT = 0, 1, 2, 3
+CELL_CHARS = ('_', 'B', 'O', 'X')
+
+class NumpyGame():
+    # Tells the Simulator to resolve all the moves of a player at once with register_player_moves
+    vectorized = True
+    # Ships cover a single location each
+    fleets = False
+    # Move lists are lists of tuples
+    packed = False
+    # Exclusive upper bound on the board size (M) (boards take M x M bytes); the number of missiles (T) is not bounded
+    max_board_size = 1 << 12
+    max_missiles = None
+
+    def __init__(self) -> None:
+        """Class containing the player battlegrounds as NumPy arrays, which resolves whole move lists in one pass.
+        Provides the same methods (and results) as the Game class.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for the 'numpy' game engine.")
+        self.__n_ships = None
+        self.__p1_board = None
+        self.__p2_board = None
+        self.__p1_ships_destroyed = 0
+        self.__p2_ships_destroyed = 0
+        self.__instrumentation = None
+
+    def reset(self) -> None:
+        """Clears the game so that the object can be set up for another game. The board arrays are kept, and
+        cleared in place by setup_boards if the next game has the same board size.
+        """
+        self.__n_ships = None
+        self.__p1_ships_destroyed = 0
+        self.__p2_ships_destroyed = 0
+
+    def set_instrumentation(self, instrumentation:Optional[Instrumentation]) -> None:
+        """Sets the instrumentation which game events (shots, hits and misses) are reported to
+
+        Args:
+            instrumentation (Optional[Instrumentation]): Instrumentation of the run (None disables the events)
+        """
+        self.__instrumentation = instrumentation
+
+    def set_n_ships(self, n_ships:int) -> None:
+        """Sets the number of ships that players are allowed to place
+
+        Args:
+            n_ships (int): Number of ships
+        """
+        self.__n_ships = n_ships
+
+    def setup_boards(self, n_ships:int, p1_ships:Sequence[Tuple[int, int]], p2_ships:Sequence[Tuple[int, int]], 
+                        board_size:Optional[int]=None) -> None:
+        """Sets up the battlegrounds ('player boards') in the form of uint8 arrays by scattering the ships
+
+        Args:
+            n_ships (int): Number of ships the players are allowed to place
+            p1_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 1
+            p2_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 2
+            board_size (Optional[int]): Size M of the (M x M) boards (defaults to the number of ships)
+        """
+        if not self.__n_ships:
+            self.__n_ships = n_ships
+        board_size = board_size or self.__n_ships
+
+        if self.__p1_board is not None and self.__p1_board.shape == (board_size, board_size):
+            self.__p1_board.fill(EMPTY)
+            self.__p2_board.fill(EMPTY)
+        else:
+            self.__p1_board = np.zeros((board_size, board_size), dtype=np.uint8)
+            self.__p2_board = np.zeros((board_size, board_size), dtype=np.uint8)
+        for board, ships in ((self.__p1_board, p1_ships), (self.__p2_board, p2_ships)):
+            ships = np.asarray(ships, dtype=np.intp).reshape(-1, 2)
+            board[ships[:, 0], ships[:, 1]] = SHIP
+
+    def __target_board(self, player_id:int) -> 'np.ndarray':
+        """Board of the opponent of the given player (i.e. the board the player fires at)
+
+        Args:
+            player_id (int): ID of the player making the moves (either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            np.ndarray: Opponent's board
+        """
+        if player_id == 1:
+            return self.__p2_board
+        elif player_id == 2:
+            return self.__p1_board
+        raise ValueError("Player ID needs to be either 1 or 2.")
+
+    def register_player_moves(self, player_id:int, hit_locs:Sequence[Tuple[int, int]]) -> None:
+        """Registers a whole list of player moves on the other player's battleground (board) in one pass.
+        A location shot more than once counts (at most) one hit, like in Game.register_player_move.
+
+        Args:
+            player_id (int): ID of the player making the moves (either 1 or 2).
+            hit_locs (Sequence[Tuple[int, int]]): Locations where the player is making the moves, in any order.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+        """
+        board = self.__target_board(player_id)
+        hit_locs = np.asarray(hit_locs, dtype=np.intp).reshape(-1, 2)
+        if not len(hit_locs):
+            return
+
+        # Gather the state of every distinct location shot at, then scatter the hits and misses back
+        flat_board = board.reshape(-1)
+        # Distinct locations by sorting (much faster than the hashing of np.unique on long move lists)
+        shot_cells = np.sort(hit_locs[:, 0] * board.shape[1] + hit_locs[:, 1])
+        shot_cells = shot_cells[np.concatenate(([True], shot_cells[1:] != shot_cells[:-1]))]
+        shot_states = flat_board[shot_cells]
+        hit_cells = shot_cells[shot_states == SHIP]
+        flat_board[hit_cells] = HIT
+        flat_board[shot_cells[shot_states == EMPTY]] = MISS
+
+        if player_id == 1:
+            self.__p2_ships_destroyed += len(hit_cells)
+        else:
+            self.__p1_ships_destroyed += len(hit_cells)
+
+        if self.__instrumentation is not None:
+            if self.__instrumentation.has_hooks('shot', 'hit', 'miss'):
+                self.__emit_events(player_id, hit_locs, shot_states)
+            else:
+                # Only the counters are updated, without a Python call per shot
+                self.__instrumentation.count('shot', len(hit_locs))
+                self.__instrumentation.count('hit', len(hit_cells))
+                self.__instrumentation.count('miss', int(np.count_nonzero(shot_states == EMPTY)))
+
+    def __emit_events(self, player_id:int, hit_locs:'np.ndarray', shot_states:'np.ndarray') -> None:
+        """Reports the events of a resolved move list to the instrumentation, one shot at a time (in move order). 
+        Only the first shot at a location can hit or miss, like in Game.register_player_move.
+
+        Args:
+            player_id (int): ID of the player who made the moves
+            hit_locs (np.ndarray): Locations of the moves, in order
+            shot_states (np.ndarray): States of the distinct locations shot at (sorted by location) before the moves
+        """
+        flat_locs = hit_locs[:, 0] * self.__target_board(player_id).shape[1] + hit_locs[:, 1]
+        (_, first_shots, shot_index) = np.unique(flat_locs, return_index=True, return_inverse=True)
+        outcomes = {SHIP: 'hit', EMPTY: 'miss'}
+        for (move_n, hit_loc) in enumerate(map(tuple, hit_locs.tolist())):
+            self.__instrumentation.emit('shot', player_id, hit_loc)
+            cell_n = shot_index[move_n]
+            if first_shots[cell_n] == move_n and shot_states[cell_n] in outcomes:
+                self.__instrumentation.emit(outcomes[shot_states[cell_n]], player_id, hit_loc)
+
+    def register_player_volley(self, player_id:int, hit_locs:Sequence[Tuple[int, int]]) -> int:
+        """Registers the volley of a salvo turn (shots resolving at the same moment) as one bulk update. Locations 
+        targeted more than once are dropped after their first shot.
+
+        Args:
+            player_id (int): ID of the player firing the volley (either 1 or 2).
+            hit_locs (Sequence[Tuple[int, int]]): Locations of the shots of the volley.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            int: Number of shots which hit a ship
+        """
+        hit_locs = np.asarray(hit_locs, dtype=np.intp).reshape(-1, 2)
+        flat_locs = hit_locs[:, 0] * self.__target_board(player_id).shape[1] + hit_locs[:, 1]
+        (_, first_shots) = np.unique(flat_locs, return_index=True)
+        score = self.get_player_scores(player_id)
+        self.register_player_moves(player_id, hit_locs[np.sort(first_shots)])
+        return self.get_player_scores(player_id) - score
+
+    def register_player_move(self, player_id:int, hit_loc:Tuple[int, int]) -> bool:
+        """Registers player move on the other player's battleground (board)
+
+        Args:
+            player_id (int): ID of the player making the move (either 1 or 2).
+            hit_loc (Tuple[int, int]): Location where the player is making the move. Either hits or misses.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            bool: True if the move hit a ship (a location can only be hit once)
+        """
+        # A single move indexes the board directly, without the array conversions of register_player_moves
+        board = self.__target_board(player_id)
+        (hit_loc_x, hit_loc_y) = hit_loc
+        state = board[hit_loc_x, hit_loc_y]
+        if state == SHIP:
+            board[hit_loc_x, hit_loc_y] = HIT
+            if player_id == 1:
+                self.__p2_ships_destroyed += 1
+            else:
+                self.__p1_ships_destroyed += 1
+        elif state == EMPTY:
+            board[hit_loc_x, hit_loc_y] = MISS
+        if self.__instrumentation is not None:
+            hit_loc = (int(hit_loc_x), int(hit_loc_y))
+            self.__instrumentation.emit('shot', player_id, hit_loc)
+            if state == SHIP:
+                self.__instrumentation.emit('hit', player_id, hit_loc)
+            elif state == EMPTY:
+                self.__instrumentation.emit('miss', player_id, hit_loc)
+        return bool(state == SHIP)
+
+    def get_player_scores(self, player_id:int) -> int:
+        """Gets the score of a player depending on the current state of the other player's board
+
+        Args:
+            player_id (int): ID of the player. (Should be either 1 or 2)
+
+        Raises:
+            ValueError: If player ID is other than 1 or 2
+
+        Returns:
+            int: Player score
+        """
+        score = None
+        if player_id == 1:
+            score = self.__p2_ships_destroyed
+        elif player_id == 2:
+            score = self.__p1_ships_destroyed
+        else:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        return score
+
+    def get_player_board(self, player_id:int) -> List[List[str]]:
+        """Current state of a player's battleground board.
+        Unlike Game.get_player_board, the returned board is a copy which does not reflect later moves.
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            List[List[str]]: The board (list of list of chars) where each location is either '_', 'O', 'X' or 'B'
+        """
+        board = None
+        if player_id == 1:
+            board = self.__p1_board
+        elif player_id == 2:
+            board = self.__p2_board
+        else:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        return np.array(CELL_CHARS)[board].tolist()
+
+    def get_board_codes(self, player_id:int) -> 'np.ndarray':
+        """Copy of a player's board as location codes (EMPTY, SHIP, MISS or HIT), without building the lists of chars
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            np.ndarray: (M, M) uint8 array of location codes
+        """
+        if player_id == 1:
+            return self.__p1_board.copy()
+        elif player_id == 2:
+            return self.__p2_board.copy()
+        raise ValueError("Player ID needs to be either 1 or 2.")
+
+    def get_game_result(self) -> str:
+        """Returns the game result by comparing players' scores
+
+        Returns:
+            str: Either "It is a draw", "Player 1 wins" or "Player 2 wins" depending on player scores
+        """
+        game_result = ''
+        if self.__p1_ships_destroyed == self.__p2_ships_destroyed:
+            game_result = "It is a draw"
+        elif self.__p1_ships_destroyed > self.__p2_ships_destroyed:
+            game_result = "Player 2 wins"
+        elif self.__p1_ships_destroyed < self.__p2_ships_destroyed:
+            game_result = "Player 1 wins"
+        logging.debug("Game result: {result}".format(result=game_result))
+        return game_result
@@ -0,0 +1,374 @@
+"""This file contains the packed representation of board locations, and the packed game class for a 2-player game of
+Battleship.
+
+A location (x, y) of an (M x M) board is packed as the single integer x * M + y, and location lists are kept as
+typed arrays of these integers (2 bytes per location up to M = 256, then 4 bytes), instead of lists of tuples (which
+take ~70 bytes per location). The validator packs the move lists of packed game engines, and the packed game resolves
+them on flat boards (one byte per location) without building a tuple per move. Long move lists and volleys are resolved
+with one NumPy update of the board when NumPy is installed, and with a loop over the moves otherwise.
+"""
+
+from .instrumentation import Instrumentation
+
+import logging
+from array import array
+from collections import abc
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Location codes of the flat boards, and their characters on the 'list of lists' boards
+EMPTY, SHIP, MISS, HIT = range(4)
+_CELL_CHARS = bytes.maketrans(bytes(range(4)), b'_BOX')
+# Shot lists at least this long are resolved with one NumPy update of the board (when NumPy is installed)
+BULK_MIN_SHOTS = 64
+
+def packed_typecode(board_size:int) -> str:
+    """Smallest array typecode holding the packed locations of a board
+
+    Args:
+        board_size (int): Board size M
+
+    Returns:
+        str: 'H' (2 bytes) up to M = 256, 'I' (4 bytes) up to M = 65536, and 'Q' (8 bytes) beyond
+    """
+    n_cells = board_size * board_size
+    if n_cells <= 1 << 16:
+        return 'H'
+    return 'I' if n_cells <= 1 << 32 else 'Q'
+
+class PackedLocations(abc.Sequence):
+    __slots__ = ('cells', 'board_size')
+
+    def __init__(self, cells:Union[array, memoryview], board_size:int) -> None:
+        """Read-only sequence of locations over packed integers (x * M + y). Indexing returns integer tuples,
+        like the lists of tuples of the validated inputs, and the packed values are in cells.
+
+        Args:
+            cells (Union[array, memoryview]): Packed locations
+            board_size (int): Board size M
+        """
+        self.cells = cells
+        self.board_size = board_size
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index:Union[int, slice]) -> Union[Tuple[int, int], 'PackedLocations']:
+        if isinstance(index, slice):
+            # Slices are views of the packed values
+            return PackedLocations(memoryview(self.cells)[index], self.board_size)
+        return divmod(self.cells[index], self.board_size)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return PackedIterator(self)
+
+class PackedIterator():
+    __slots__ = ('__locations', '__index')
+
+    def __init__(self, locations:PackedLocations) -> None:
+        """Iterator over PackedLocations, which can also hand out the next locations as a (zero-copy) slice
+
+        Args:
+            locations (PackedLocations): Locations to iterate over
+        """
+        self.__locations = locations
+        self.__index = 0
+
+    def __iter__(self) -> 'PackedIterator':
+        return self
+
+    def __next__(self) -> Tuple[int, int]:
+        if self.__index >= len(self.__locations.cells):
+            raise StopIteration
+        self.__index += 1
+        return divmod(self.__locations.cells[self.__index - 1], self.__locations.board_size)
+
+    def take(self, n_items:int) -> PackedLocations:
+        """Returns the next n_items locations at once
+
+        Args:
+            n_items (int): Number of locations to return
+
+        Returns:
+            PackedLocations: Slice of the next locations (may be shorter than n_items at the end)
+        """
+        items = self.__locations[self.__index:self.__index + n_items]
+        self.__index += len(items)
+        return items
+
+def _distinct_cells(cells:'np.ndarray') -> 'np.ndarray':
+    """Distinct packed locations of an array, sorted (sorting is much faster than the hashing of np.unique here)
+
+    Args:
+        cells (np.ndarray): Packed locations
+
+    Returns:
+        np.ndarray: Each location once, in increasing order
+    """
+    cells = np.sort(cells)
+    return cells[np.concatenate(([True], cells[1:] != cells[:-1]))]
+
+def pack_locations(locations:Iterable[Sequence[int]], board_size:int) -> Union[array, memoryview]:
+    """Packed integers of a list of locations (without a copy if they are already packed for the board size)
+
+    Args:
+        locations (Iterable[Sequence[int]]): Locations as x-y pairs, or PackedLocations
+        board_size (int): Board size M
+
+    Returns:
+        Union[array, memoryview]: Packed locations
+    """
+    if isinstance(locations, PackedLocations) and locations.board_size == board_size:
+        return locations.cells
+    return array(packed_typecode(board_size), [loc_x * board_size + loc_y for (loc_x, loc_y) in locations])
+
+class PackedGame():
+    __slots__ = ('__n_ships', '__board_size', '__boards', '__ships_destroyed', '__instrumentation')
+    # Tells the Simulator to resolve all the moves of a player at once with register_player_moves
+    vectorized = True
+    # Ships cover a single location each
+    fleets = False
+    # Tells the validator to pack the move lists (see PackedLocations)
+    packed = True
+    # Exclusive upper bound on the board size (M) (boards take M x M bytes); the number of missiles (T) is not bounded
+    max_board_size = 1 << 12
+    max_missiles = None
+
+    def __init__(self) -> None:
+        """Class containing the player battlegrounds as flat bytearrays indexed by packed locations (x * M + y).
+        Provides the same methods (and results) as the Game class, and resolves packed move lists without
+        unpacking them.
+        """
+        self.__n_ships = None
+        self.__board_size = None
+        # Board of Player 1 at index 0 and Player 2 at index 1, and the number of ships destroyed on each
+        self.__boards = (None, None)
+        self.__ships_destroyed = [0, 0]
+        self.__instrumentation = None
+
+    def reset(self) -> None:
+        """Clears the game so that the object can be set up for another game
+        """
+        self.__n_ships = None
+        self.__board_size = None
+        self.__boards = (None, None)
+        self.__ships_destroyed = [0, 0]
+
+    def set_instrumentation(self, instrumentation:Optional[Instrumentation]) -> None:
+        """Sets the instrumentation which game events (shots, hits and misses) are reported to
+
+        Args:
+            instrumentation (Optional[Instrumentation]): Instrumentation of the run (None disables the events)
+        """
+        self.__instrumentation = instrumentation
+
+    def set_n_ships(self, n_ships:int) -> None:
+        """Sets the number of ships that players are allowed to place
+
+        Args:
+            n_ships (int): Number of ships
+        """
+        self.__n_ships = n_ships
+
+    def setup_boards(self, n_ships:int, p1_ships:Iterable[Tuple[int, int]], p2_ships:Iterable[Tuple[int, int]],
+                        board_size:Optional[int]=None) -> None:
+        """Sets up the battlegrounds ('player boards') as flat bytearrays of location codes
+
+        Args:
+            n_ships (int): Number of ships the players are allowed to place
+            p1_ships (Iterable[Tuple[int, int]]): Locations of the ships of Player 1
+            p2_ships (Iterable[Tuple[int, int]]): Locations of the ships of Player 2
+            board_size (Optional[int]): Size M of the (M x M) boards (defaults to the number of ships)
+        """
+        if not self.__n_ships:
+            self.__n_ships = n_ships
+        self.__board_size = M = board_size or self.__n_ships
+        boards = (bytearray(M * M), bytearray(M * M))
+        for (board, ships) in zip(boards, (p1_ships, p2_ships)):
+            for cell in pack_locations(ships, M):
+                board[cell] = SHIP
+        self.__boards = boards
+        self.__ships_destroyed = [0, 0]
+
+    def register_packed_moves(self, player_id:int, cells:Iterable[int]) -> int:
+        """Registers packed player moves on the other player's battleground (board), in order
+
+        Args:
+            player_id (int): ID of the player making the moves (either 1 or 2).
+            cells (Iterable[int]): Packed locations of the moves (x * M + y)
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            int: Number of moves which hit a ship
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        # Player 1 fires at the board of Player 2 (index 1), and Player 2 at the board of Player 1 (index 0)
+        board = self.__boards[2 - player_id]
+        (n_shots, n_hits, n_misses) = (0, 0, 0)
+        instrumentation = self.__instrumentation
+        if instrumentation is None or not instrumentation.has_hooks('shot', 'hit', 'miss'):
+            if np is not None and isinstance(cells, (array, memoryview, np.ndarray)) and len(cells) >= BULK_MIN_SHOTS:
+                # Without hooks the order of the moves does not matter, only the distinct locations shot at
+                n_shots = len(cells)
+                (n_hits, n_misses) = self.__resolve_bulk(board, np.asarray(cells))
+            else:
+                for cell in cells:
+                    n_shots += 1
+                    state = board[cell]
+                    if state == SHIP:
+                        board[cell] = HIT
+                        n_hits += 1
+                    elif state == EMPTY:
+                        board[cell] = MISS
+                        n_misses += 1
+            if instrumentation is not None:
+                # Only the counters are updated when the events have no hooks
+                instrumentation.count('shot', n_shots)
+                instrumentation.count('hit', n_hits)
+                instrumentation.count('miss', n_misses)
+        else:
+            emit = self.__instrumentation.emit
+            for cell in cells:
+                hit_loc = divmod(cell, self.__board_size)
+                emit('shot', player_id, hit_loc)
+                state = board[cell]
+                if state == SHIP:
+                    board[cell] = HIT
+                    n_hits += 1
+                    emit('hit', player_id, hit_loc)
+                elif state == EMPTY:
+                    board[cell] = MISS
+                    emit('miss', player_id, hit_loc)
+        self.__ships_destroyed[2 - player_id] += n_hits
+        return n_hits
+
+    @staticmethod
+    def __resolve_bulk(board:bytearray, cells:'np.ndarray') -> Tuple[int, int]:
+        """Resolves shots with one NumPy update of a board: the states of the distinct locations shot at are gathered,
+        and the hits and misses scattered back (the board and counts are the same as with the shots one by one)
+
+        Args:
+            board (bytearray): Board shot at (updated in place)
+            cells (np.ndarray): Packed locations of the shots
+
+        Returns:
+            Tuple[int, int]: Number of shots which hit a ship, and which missed (first shots at empty locations)
+        """
+        flat_board = np.frombuffer(board, dtype=np.uint8)
+        shot_cells = _distinct_cells(cells)
+        states = flat_board[shot_cells]
+        hit_cells = shot_cells[states == SHIP]
+        miss_cells = shot_cells[states == EMPTY]
+        flat_board[hit_cells] = HIT
+        flat_board[miss_cells] = MISS
+        return len(hit_cells), len(miss_cells)
+
+    def register_player_moves(self, player_id:int, hit_locs:Sequence[Tuple[int, int]]) -> None:
+        """Registers a whole list of player moves on the other player's battleground (board).
+        Packed move lists (see PackedLocations) are resolved without unpacking them.
+
+        Args:
+            player_id (int): ID of the player making the moves (either 1 or 2).
+            hit_locs (Sequence[Tuple[int, int]]): Locations where the player is making the moves, in order.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+        """
+        self.register_packed_moves(player_id, pack_locations(hit_locs, self.__board_size))
+
+    def register_player_volley(self, player_id:int, hit_locs:Sequence[Tuple[int, int]]) -> int:
+        """Registers the volley of a salvo turn (shots resolving at the same moment) in one call. Locations 
+        targeted more than once are dropped after their first shot. Volleys of at least BULK_MIN_SHOTS shots are
+        resolved with one NumPy update of the board (unless the game events have hooks, which see the shots in order).
+
+        Args:
+            player_id (int): ID of the player firing the volley (either 1 or 2).
+            hit_locs (Sequence[Tuple[int, int]]): Locations of the shots of the volley (or PackedLocations).
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            int: Number of shots which hit a ship
+        """
+        cells = pack_locations(hit_locs, self.__board_size)
+        instrumentation = self.__instrumentation
+        if np is not None and len(cells) >= BULK_MIN_SHOTS \
+                and (instrumentation is None or not instrumentation.has_hooks('shot', 'hit', 'miss')):
+            return self.register_packed_moves(player_id, _distinct_cells(np.asarray(cells)))
+        return self.register_packed_moves(player_id, dict.fromkeys(cells))
+
+    def register_player_move(self, player_id:int, hit_loc:Tuple[int, int]) -> bool:
+        """Registers player move on the other player's battleground (board)
+
+        Args:
+            player_id (int): ID of the player making the move (either 1 or 2).
+            hit_loc (Tuple[int, int]): Location where the player is making the move. Either hits or misses.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            bool: True if the move hit a ship (a location can only be hit once)
+        """
+        (hit_loc_x, hit_loc_y) = hit_loc
+        return self.register_packed_moves(player_id, (hit_loc_x * self.__board_size + hit_loc_y,)) == 1
+
+    def get_player_scores(self, player_id:int) -> int:
+        """Gets the score of a player depending on the current state of the other player's board
+
+        Args:
+            player_id (int): ID of the player. (Should be either 1 or 2)
+
+        Raises:
+            ValueError: If player ID is other than 1 or 2
+
+        Returns:
+            int: Player score
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        return self.__ships_destroyed[2 - player_id]
+
+    def get_player_board(self, player_id:int) -> List[List[str]]:
+        """Current state of a player's battleground board.
+        Unlike Game.get_player_board, the returned board is a copy which does not reflect later moves.
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            List[List[str]]: The board (list of list of chars) where each location is either '_', 'O', 'X' or 'B'
+        """
+        if player_id != 1 and player_id != 2:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        M = self.__board_size
+        text = self.__boards[player_id - 1].translate(_CELL_CHARS).decode()
+        return [list(text[start:start + M]) for start in range(0, M * M, M)]
+
+    def get_game_result(self) -> str:
+        """Returns the game result by comparing players' scores
+
+        Returns:
+            str: Either "It is a draw", "Player 1 wins" or "Player 2 wins" depending on player scores
+        """
+        (p1_ships_destroyed, p2_ships_destroyed) = self.__ships_destroyed
+        game_result = ''
+        if p1_ships_destroyed == p2_ships_destroyed:
+            game_result = "It is a draw"
+        elif p1_ships_destroyed > p2_ships_destroyed:
+            game_result = "Player 2 wins"
+        else:
+            game_result = "Player 1 wins"
+        logging.debug("Game result: {result}".format(result=game_result))
+        return game_result
@@ -2,13 +2,55 @@
 """
 
 
-from typing import List, Tuple
+from .strategies import Strategy
+
+from itertools import islice
+from typing import List, Optional, Sequence, Tuple
 
 class Player():
-    def __init__(self) -> None:
+    __slots__ = ('__moves_list', '__strategy')
+
+    def __init__(self, strategy:Optional[Strategy]=None) -> None:
         """Class containing player moves and a method to return the next move
+
+        Args:
+            strategy (Optional[Strategy]): Live shooting strategy of the player. If given, the moves are chosen by 
+                the strategy (from the feedback on earlier moves) instead of being replayed from the move list.
         """
         self.__moves_list = None
+        self.__strategy = strategy
+
+    def reset(self) -> None:
+        """Clears the move list so that the object can be used for another game (the strategy, if any, is 
+        reset for the new board by set_board_size)
+        """
+        self.__moves_list = None
+
+    def has_strategy(self) -> bool:
+        """Whether the moves of the player are chosen by a live strategy (and need feedback after each move)
+
+        Returns:
+            bool: True if the player has a strategy
+        """
+        return self.__strategy is not None
+
+    def set_ship_lengths(self, ship_lengths:Sequence[int]) -> None:
+        """Passes the lengths of the opponent's ships to the strategy (if any), before set_board_size
+
+        Args:
+            ship_lengths (Sequence[int]): Length of each ship of the opponent
+        """
+        if self.__strategy is not None:
+            self.__strategy.set_ship_lengths(ship_lengths)
+
+    def set_board_size(self, board_size:int) -> None:
+        """Sets the size of the board the player fires at (starts a new game for the strategy, if any)
+
+        Args:
+            board_size (int): Board size M
+        """
+        if self.__strategy is not None:
+            self.__strategy.reset(board_size)
     
     def set_moves_list(self, moves:List[Tuple[int, int]]) -> None:
         """Sets the move list (ideally from the input file) for the player
@@ -27,5 +69,34 @@ class Player():
         Returns:
             Tuple[int, int]: Next move of the player which is a location on the board (i.e. integer tuple)
         """
+        if self.__strategy is not None:
+            return self.__strategy.next_move()
         # Raises StopIteration error if called more than the number of items 
-        return next(self.__moves_list)
\ No newline at end of file
+        return next(self.__moves_list)
+
+    def register_feedback(self, hit_loc:Tuple[int, int], hit:bool) -> None:
+        """Passes the outcome of the player's last move to the strategy (if any)
+
+        Args:
+            hit_loc (Tuple[int, int]): Location of the move
+            hit (bool): True if the move hit a ship
+        """
+        if self.__strategy is not None:
+            self.__strategy.register_feedback(hit_loc, hit)
+
+    def next_moves(self, n_moves:int) -> Sequence[Tuple[int, int]]:
+        """Returns the next n_moves moves of the player at once.
+
+        Args:
+            n_moves (int): Number of moves to return
+
+        Returns:
+            Sequence[Tuple[int, int]]: Next moves of the player, in order
+        """
+        # Move iterators which can hand out a slice of their moves (e.g. of binary game files) avoid the copy
+        take = getattr(self.__moves_list, 'take', None)
+        moves = take(n_moves) if take else list(islice(self.__moves_list, n_moves))
+        # Same as calling next_move more than the number of items 
+        if len(moves) < n_moves:
+            raise StopIteration
+        return moves
@@ -0,0 +1,295 @@
+"""This file contains the replay log of a game: the shots of both players and their outcomes, with periodic board
+snapshots, so that the boards after any turn can be rebuilt without simulating the game again from the start.
+
+A replay file is a fixed header followed by packed arrays -
+    Header: magic b'BRPL', format version (uint16), reserved (uint16), M, the numbers of ship locations S1 and S2
+        of Player 1 and Player 2, number of shots N and the snapshot interval (uint32 each)
+    Player 1 ship locations, Player 2 ship locations (S1 and S2 x-y pairs, uint32)
+    Shots (N x-y pairs, uint32), alternating Player 1 and Player 2 (2 shots per turn)
+    Hits (N bytes, 1 if the shot hit a ship)
+    Points (N bytes, the score the shot added for its player, e.g. 0 for a hit which does not sink a fleet ship)
+All the values are little-endian. Snapshots are not stored; they are rebuilt when the file is loaded. Replay files
+of version 1 have a single number of ship locations S for both players in their header, and no points (every hit
+scores a point).
+"""
+
+import argparse
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+REPLAY_MAGIC = b'BRPL'
+REPLAY_VERSION = 2
+REPLAY_SUFFIX = '.brpl'
+_HEADER = struct.Struct('<4sHHIIIII')
+_HEADER_V1 = struct.Struct('<4sHHIIII')
+
+# Minimum number of turns between two snapshots (the interval grows with the board size, see ReplayLog)
+DEFAULT_SNAPSHOT_INTERVAL = 64
+# Largest board (in locations) a replay log is kept for
+MAX_REPLAY_CELLS = 1 << 24
+
+# Location codes of the replay boards, and their characters on the game boards
+_EMPTY, _SHIP, _MISS, _HIT = range(4)
+_CELL_CHARS = bytes.maketrans(bytes(range(4)), b'_BOX')
+
+class ReplayLog():
+    def __init__(self, board_size:int, p1_ships:Sequence[Tuple[int, int]], p2_ships:Sequence[Tuple[int, int]],
+                    snapshot_interval:int=None) -> None:
+        """Event log of the shots of a game and their outcomes, with a snapshot of both boards every snapshot_interval
+        turns. The boards after turn k are rebuilt from the last snapshot before it, so seeking to any turn replays
+        at most snapshot_interval turns.
+
+        Args:
+            board_size (int): Board size M
+            p1_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 1
+            p2_ships (Sequence[Tuple[int, int]]): Locations of the ships of Player 2
+            snapshot_interval (int): Number of turns between two snapshots (defaults to 64, or to M^2 / 64 on larger
+                boards, so that the snapshots never take more than about 2 bytes per shot)
+
+        Raises:
+            ValueError: If the board has more than MAX_REPLAY_CELLS locations
+        """
+        n_cells = board_size * board_size
+        if n_cells > MAX_REPLAY_CELLS:
+            raise ValueError("Board size {M} is too large for a replay log (at most {n} locations).".format(M=board_size, n=MAX_REPLAY_CELLS))
+        self.board_size = board_size
+        self.snapshot_interval = snapshot_interval or max(DEFAULT_SNAPSHOT_INTERVAL, n_cells // 64)
+        self.p1_ships = [tuple(loc) for loc in p1_ships]
+        self.p2_ships = [tuple(loc) for loc in p2_ships]
+
+        # Shots as flat x, y values, alternating Player 1 and Player 2, whether each of them hit, and the points
+        # each of them scored
+        self.__shots = array('I')
+        self.__hits = bytearray()
+        self.__points = bytearray()
+
+        # Current boards of Player 1 and Player 2 (one byte per location, row by row) and scores
+        self.__boards = (bytearray(n_cells), bytearray(n_cells))
+        for (board, ships) in zip(self.__boards, (self.p1_ships, self.p2_ships)):
+            for (loc_x, loc_y) in ships:
+                board[loc_x * board_size + loc_y] = _SHIP
+        self.__scores = [0, 0]
+        # Boards and scores after turns 0, snapshot_interval, 2 * snapshot_interval, ...
+        self.__snapshots = [self.__snapshot()]
+
+    def __snapshot(self) -> Tuple[bytes, bytes, int, int]:
+        """Copy of the current boards and scores
+
+        Returns:
+            Tuple[bytes, bytes, int, int]: Boards of Player 1 and Player 2, and the scores of Player 1 and Player 2
+        """
+        return (bytes(self.__boards[0]), bytes(self.__boards[1]), self.__scores[0], self.__scores[1])
+
+    def record(self, player_id:int, hit_loc:Tuple[int, int], hit:bool, score:Optional[int]=None) -> None:
+        """Records a shot. Shots have to be recorded in the order of the game: Player 1, then Player 2, every turn.
+
+        Args:
+            player_id (int): ID of the player making the move (either 1 or 2)
+            hit_loc (Tuple[int, int]): Location of the shot
+            hit (bool): Whether the shot hit a ship (as returned by Game.register_player_move)
+            score (Optional[int]): Score of the player after the shot, as counted by the game engine (defaults to one
+                point per hit; e.g. fleet games only score a point for each sunk ship)
+        """
+        (loc_x, loc_y) = hit_loc
+        points = int(hit) if score is None else score - self.__scores[player_id - 1]
+        self.__shots.append(loc_x)
+        self.__shots.append(loc_y)
+        self.__hits.append(hit)
+        self.__points.append(points)
+        self.__apply(self.__boards[2 - player_id], self.__scores, player_id, loc_x * self.board_size + loc_y, hit, points)
+        if len(self.__hits) % (2 * self.snapshot_interval) == 0:
+            self.__snapshots.append(self.__snapshot())
+
+    @staticmethod
+    def __apply(board:bytearray, scores:List[int], player_id:int, index:int, hit:bool, points:int) -> None:
+        """Marks a shot on the board of the other player
+
+        Args:
+            board (bytearray): Board shot at
+            scores (List[int]): Scores of Player 1 and Player 2 (updated)
+            player_id (int): ID of the player making the move
+            index (int): Index of the location on the board
+            hit (bool): Whether the shot hit a ship
+            points (int): Points the shot scored
+        """
+        scores[player_id - 1] += points
+        if hit:
+            board[index] = _HIT
+        elif board[index] == _EMPTY:
+            board[index] = _MISS
+
+    def get_n_turns(self) -> int:
+        """Number of recorded turns (the last turn is not counted until both players have shot)
+
+        Returns:
+            int: Number of turns
+        """
+        return len(self.__hits) // 2
+
+    def __state_at(self, turn:int) -> Tuple[bytearray, bytearray, List[int]]:
+        """Boards and scores after a turn, rebuilt from the last snapshot before it
+
+        Args:
+            turn (int): Turn (0 for the boards before the first move)
+
+        Raises:
+            ValueError: If the turn is not between 0 and the number of recorded turns
+
+        Returns:
+            Tuple[bytearray, bytearray, List[int]]: Boards of Player 1 and Player 2, and the scores
+        """
+        if not 0 <= turn <= self.get_n_turns():
+            raise ValueError("Turn needs to be between 0 and {n}.".format(n=self.get_n_turns()))
+        (p1_board, p2_board, p1_score, p2_score) = self.__snapshots[turn // self.snapshot_interval]
+        boards = (bytearray(p1_board), bytearray(p2_board))
+        scores = [p1_score, p2_score]
+        for shot in range(turn // self.snapshot_interval * self.snapshot_interval * 2, 2 * turn):
+            player_id = shot % 2 + 1
+            index = self.__shots[2 * shot] * self.board_size + self.__shots[2 * shot + 1]
+            self.__apply(boards[2 - player_id], scores, player_id, index, self.__hits[shot], self.__points[shot])
+        return (boards[0], boards[1], scores)
+
+    def get_boards(self, turn:int) -> Tuple[List[List[str]], List[List[str]]]:
+        """Boards of both players after a turn, as the game boards ('_', 'B', 'O' and 'X' locations)
+
+        Args:
+            turn (int): Turn (0 for the boards before the first move)
+
+        Returns:
+            Tuple[List[List[str]], List[List[str]]]: Boards of Player 1 and Player 2
+        """
+        (p1_board, p2_board, _) = self.__state_at(turn)
+        M = self.board_size
+        boards = []
+        for board in (p1_board, p2_board):
+            text = board.translate(_CELL_CHARS).decode()
+            boards.append([list(text[start:start + M]) for start in range(0, M * M, M)])
+        return (boards[0], boards[1])
+
+    def get_scores(self, turn:int) -> Tuple[int, int]:
+        """Scores of both players after a turn
+
+        Args:
+            turn (int): Turn (0 for the scores before the first move)
+
+        Returns:
+            Tuple[int, int]: Scores of Player 1 and Player 2
+        """
+        (_, _, scores) = self.__state_at(turn)
+        return (scores[0], scores[1])
+
+    def events(self, start_turn:int=1, stop_turn:int=None) -> Iterator[Tuple[int, int, Tuple[int, int], bool]]:
+        """Iterates over the recorded shots of a range of turns
+
+        Args:
+            start_turn (int): First turn
+            stop_turn (int): Last turn (defaults to the last recorded turn)
+
+        Yields:
+            Tuple[int, int, Tuple[int, int], bool]: Turn, ID of the player, location of the shot and whether it hit
+        """
+        stop_turn = self.get_n_turns() if stop_turn is None else stop_turn
+        for shot in range(2 * (start_turn - 1), 2 * stop_turn):
+            yield (shot // 2 + 1, shot % 2 + 1, (self.__shots[2 * shot], self.__shots[2 * shot + 1]), bool(self.__hits[shot]))
+
+    def render(self, turn:int) -> str:
+        """Renders the boards and scores after a turn, as in the result files
+
+        Args:
+            turn (int): Turn (0 for the boards before the first move)
+
+        Returns:
+            str: Boards and scores
+        """
+        (p1_board, p2_board) = self.get_boards(turn)
+        (p1_score, p2_score) = self.get_scores(turn)
+        return ''.join([
+            'Turn ', str(turn), '\n',
+            'Player1\n',
+            ''.join(' '.join(row) + ' \n' for row in p1_board),
+            '\n\n\n',
+            'Player2\n',
+            ''.join(' '.join(row) + ' \n' for row in p2_board),
+            '\n',
+            'P1:', str(p1_score), '\n',
+            'P2:', str(p2_score), '\n',
+        ])
+
+    def save(self, file_path:Path) -> None:
+        """Writes the replay log as a replay file (see the format above)
+
+        Args:
+            file_path (Path): Path of the replay file
+        """
+        n_shots = 2 * self.get_n_turns()
+        with open(file_path, 'wb') as f:
+            f.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, 0, self.board_size, len(self.p1_ships),
+                                    len(self.p2_ships), n_shots, self.snapshot_interval))
+            for values in (array('I', (v for loc in self.p1_ships for v in loc)),
+                            array('I', (v for loc in self.p2_ships for v in loc)), self.__shots[:2 * n_shots]):
+                if sys.byteorder != 'little':
+                    values = array('I', values)
+                    values.byteswap()
+                f.write(values.tobytes())
+            f.write(self.__hits[:n_shots])
+            f.write(self.__points[:n_shots])
+
+    @classmethod
+    def load(cls, file_path:Path) -> 'ReplayLog':
+        """Reads a replay file, and rebuilds its snapshots
+
+        Args:
+            file_path (Path): Path of the replay file
+
+        Raises:
+            ValueError: If the file is not a replay file, or is truncated
+
+        Returns:
+            ReplayLog: Replay log of the game
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER_V1.size:
+            raise ValueError("Replay file is truncated. ({path})".format(path=file_path))
+        (magic, version) = struct.unpack_from('<4sH', data)
+        if magic != REPLAY_MAGIC or version not in (1, REPLAY_VERSION):
+            raise ValueError("Not a replay file (version {version}). ({path})".format(version=REPLAY_VERSION, path=file_path))
+        if version == 1:
+            header = _HEADER_V1
+            (_, _, _, M, S1, n_shots, snapshot_interval) = header.unpack_from(data)
+            (S2, n_shot_bytes) = (S1, n_shots)
+        else:
+            header = _HEADER
+            if len(data) < header.size:
+                raise ValueError("Replay file is truncated. ({path})".format(path=file_path))
+            (_, _, _, M, S1, S2, n_shots, snapshot_interval) = header.unpack_from(data)
+            n_shot_bytes = 2 * n_shots
+        if len(data) != header.size + 4 * (2 * S1 + 2 * S2 + 2 * n_shots) + n_shot_bytes:
+            raise ValueError("Replay file does not match its header. ({path})".format(path=file_path))
+
+        values = array('I', data[header.size:len(data) - n_shot_bytes])
+        if sys.byteorder != 'little':
+            values.byteswap()
+        hits = data[len(data) - n_shot_bytes:len(data) - n_shot_bytes + n_shots]
+        points = hits if version == 1 else data[len(data) - n_shots:]
+        n_ship_values = 2 * (S1 + S2)
+        replay = cls(M, list(zip(values[0:2 * S1:2], values[1:2 * S1:2])),
+                        list(zip(values[2 * S1:n_ship_values:2], values[2 * S1 + 1:n_ship_values:2])), snapshot_interval=snapshot_interval)
+        scores = [0, 0]
+        for shot in range(n_shots):
+            scores[shot % 2] += points[shot]
+            replay.record(shot % 2 + 1, (values[n_ship_values + 2 * shot], values[n_ship_values + 2 * shot + 1]), hits[shot],
+                            score=scores[shot % 2])
+        return replay
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prints the boards of a replayed Battleship game after the given turns")
+    parser.add_argument('replay_path', help="Replay file (conventionally with the {} suffix)".format(REPLAY_SUFFIX))
+    parser.add_argument('turns', nargs='*', type=int, help="Turns to print (defaults to the last turn)")
+    args = parser.parse_args()
+    replay = ReplayLog.load(Path(args.replay_path))
+    for turn in args.turns or [replay.get_n_turns()]:
+        print(replay.render(turn))
@@ -0,0 +1,189 @@
+"""This file contains the salvo variant of the 2-player game of Battleship: every turn, each player fires a volley of
+shots which all resolve at the same moment.
+
+Input text file format (8 lines) -
+    <Board size M>
+    <No. of ships available to each player>
+    <Player 1 ship locations, separated by ',' and x-y coordinates separated by ':'>
+    <Player 2 ship locations, separated by ',' and x-y coordinates separated by ':'>
+    <No. of turns T>
+    <Salvo size K: the number of shots per volley, or 'ships' for the number of ships the player has left>
+    <Player 1 volleys (one per turn) separated by ';', shots separated by ':' and x-y coordinates separated by ','>
+    <Player 2 volleys (one per turn) separated by ';', shots separated by ':' and x-y coordinates separated by ','>
+A volley holds at most K shots (S with the 'ships' salvo size), and only its first K shots are fired (the first
+'number of ships left' shots, counted at the start of the turn). A location targeted more than once in a volley is
+fired at once. Scores and the game result are those of the game engine (e.g. the number of hits).
+"""
+
+from .game import Game
+from .sinks import ResultSink, TextFileSink
+from .simulator import DEFAULT_INPUT_DIR, DEFAULT_OUTPUT_DIR
+from .validator import InputValidator, InputValidationError, SALVO_SHIPS
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+class SalvoSimulator():
+    def __init__(self, g:Game, input_dir:Optional[Path]=None, output_dir:Optional[Path]=None) -> None:
+        """Simulator of salvo games (see the input format above). The volleys of vectorized game engines are resolved
+        with one register_player_volley call each, and the volleys of the others shot by shot.
+
+        Args:
+            g (Game): Game object corresponding to the game (any game engine)
+            input_dir (Optional[Path]): Directory containing the input files (defaults to ../data)
+            output_dir (Optional[Path]): Directory where the result files are written (defaults to ../out)
+        """
+        self.__game = g
+        self.__validator = InputValidator(max_board_size=g.max_board_size, fleets=g.fleets, packed=g.packed)
+        self.__sim_inputs = None
+        self.__simulated = False
+        self.__input_file_dir = Path(input_dir) if input_dir else DEFAULT_INPUT_DIR
+        self.__output_file_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+        self.__input_file_name = ""
+
+    def get_game(self) -> Game:
+        """Returns the Game object of the simulator
+
+        Returns:
+            Game: Game object
+        """
+        return self.__game
+
+    def get_sim_inputs(self) -> Dict:
+        """Returns the sanitized inputs of the game
+
+        Returns:
+            Dict: 'M', 'S', 'T', 'K' (salvo size, or SALVO_SHIPS), 'P1_POS_SHIPS', 'P2_POS_SHIPS', and 'P1_VOLLEYS'
+                and 'P2_VOLLEYS' (the shot locations of each turn)
+        """
+        return self.__sim_inputs
+
+    def read_input_lines(self, lines:List[str], name:str) -> None:
+        """Reads the inputs of a game from its lines, performs the sanity checks and sets up the boards
+
+        Args:
+            lines (List[str]): Lines of the game in the salvo input format
+            name (str): Name of the game (used in the result file name)
+
+        Raises:
+            InputValidationError: With every error, if the inputs are invalid
+        """
+        self.__sim_inputs = None
+        self.__simulated = False
+        self.__input_file_name = name
+        self.__game.reset()
+        (inputs, errors) = self.__validator.validate_salvo_lines(lines)
+        if errors:
+            raise InputValidationError(errors)
+        self.__sim_inputs = inputs
+        self.__game.set_n_ships(inputs['S'])
+        self.__game.setup_boards(n_ships=inputs['S'], p1_ships=inputs['P1_POS_SHIPS'], p2_ships=inputs['P2_POS_SHIPS'],
+                                    board_size=inputs['M'])
+
+    def read_input(self, filename:str) -> None:
+        """Reads input from the input text file, performs the sanity checks and sets up the boards
+
+        Args:
+            filename (str): File name of the input file (relative to the input directory, or an absolute path)
+        """
+        with open(self.__input_file_dir / filename, 'r') as f:
+            self.read_input_lines(f.read().split('\n'), name=filename)
+
+    def get_salvo_size(self, player_id:int) -> int:
+        """Number of shots a player fires this turn
+
+        Args:
+            player_id (int): ID of the player (either 1 or 2)
+
+        Returns:
+            int: Salvo size K, or with the 'ships' salvo size, the number of ships of the player which are not
+                destroyed yet (S minus the score of the other player)
+        """
+        if self.__sim_inputs['K'] != SALVO_SHIPS:
+            return self.__sim_inputs['K']
+        return self.__sim_inputs['S'] - self.__game.get_player_scores(player_id=3 - player_id)
+
+    def simulate(self) -> None:
+        """Simulates the game: every turn, the salvo sizes of both players are counted, and then both volleys are fired
+
+        Raises:
+            RuntimeError: If the method is called before the simulation inputs are read
+        """
+        if self.__sim_inputs is None:
+            raise RuntimeError('Simulation input file needs to be read before simulation.')
+        if self.__simulated:
+            return
+
+        game = self.__game
+        volleys = (self.__sim_inputs['P1_VOLLEYS'], self.__sim_inputs['P2_VOLLEYS'])
+        for turn in range(self.__sim_inputs['T']):
+            # The shots of a turn resolve at the same moment, so neither volley changes the other's size
+            salvo_sizes = (self.get_salvo_size(player_id=1), self.get_salvo_size(player_id=2))
+            for player_id in (1, 2):
+                volley = volleys[player_id - 1][turn][:salvo_sizes[player_id - 1]]
+                if not len(volley):
+                    continue
+                if game.vectorized:
+                    game.register_player_volley(player_id, volley)
+                else:
+                    for hit_loc in dict.fromkeys(map(tuple, volley)):
+                        game.register_player_move(player_id=player_id, hit_loc=hit_loc)
+        self.__simulated = True
+
+    def render_result(self) -> str:
+        """Renders the result of the simulation (the boards, scores and the game result), like the Simulator
+
+        Returns:
+            str: Result text
+        """
+        parts = []
+        for player_id in (1, 2):
+            parts.append('Player{k}\n'.format(k=player_id))
+            if hasattr(self.__game, 'get_occupied_cells'):
+                parts.extend('{x}:{y} {cell}\n'.format(x=loc_x, y=loc_y, cell=cell)
+                                for ((loc_x, loc_y), cell) in self.__game.get_occupied_cells(player_id=player_id).items())
+            else:
+                parts.extend(' '.join(row) + ' \n' for row in self.__game.get_player_board(player_id=player_id))
+            parts.append('\n\n\n' if player_id == 1 else '\n')
+        (p1_score, p2_score, game_result) = self.get_scores()
+        parts.append('P1:{p1}\nP2:{p2}\n{result}'.format(p1=p1_score, p2=p2_score, result=game_result))
+        return ''.join(parts)
+
+    def get_scores(self) -> Tuple[int, int, str]:
+        """Returns the scores and the result of the simulated game
+
+        Returns:
+            Tuple[int, int, str]: Score of Player 1, score of Player 2 and the game result
+        """
+        return (self.__game.get_player_scores(player_id=1), self.__game.get_player_scores(player_id=2),
+                self.__game.get_game_result())
+
+    def get_result_record(self) -> dict:
+        """Result record of the simulated game, as written in result sinks
+
+        Returns:
+            dict: 'input' (input file name), 'P1' and 'P2' (scores), 'result' (game result) and 'text' (result text)
+        """
+        (p1_score, p2_score, game_result) = self.get_scores()
+        return {
+            'input': self.__input_file_name,
+            'P1': p1_score,
+            'P2': p2_score,
+            'result': game_result,
+            'text': self.render_result(),
+        }
+
+    def write_result(self, sink:Optional[ResultSink]=None) -> Path:
+        """Writes the result in the output file, or in a result sink
+
+        Args:
+            sink (Optional[ResultSink]): Sink the result record is written to (defaults to a new text file
+                Result__<unix seconds>__<input name>.txt in the output directory)
+
+        Returns:
+            Path: Absolute path of the written output file (or of the file of the sink)
+        """
+        path = (sink or TextFileSink(self.__output_file_dir)).write(self.get_result_record())
+        logging.debug("Simulation result written in the file: {path}".format(path=path))
+        return path
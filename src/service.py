@@ -0,0 +1,301 @@
+"""This file contains the local simulation service: a long-running asyncio server which simulates games sent over
+a socket on a pool of pre-started worker processes, so that each request does not pay for interpreter startup,
+imports and output file creation.
+
+Protocol: one JSON object per line in both directions.
+    Request:  {"input": "<the 7 lines of the game>", "engine": "default"}   (engine is optional)
+    Response: {"result": ..., "P1": ..., "P2": ..., "boards": "<the result text>", "ms": ...}
+              or {"error": "<message>"} if the input is invalid, the server is busy or the request timed out
+    Request:  {"metrics": true}
+    Response: request counters, the number of pending requests and the p50/p99 latencies (ms) of the recent requests
+"""
+
+from .simulator import Simulator
+from .player import Player
+from .engines import ENGINES
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
+
+# Number of recent request latencies the percentiles are computed over
+LATENCY_WINDOW = 10000
+
+# Simulators of a worker process by engine name, reused for all the requests the worker serves
+_simulators = {}
+
+def simulate_request(text:str, engine:str='default') -> Dict[str, Union[int, str]]:
+    """Simulates the game of a request (runs in a worker process)
+
+    Args:
+        text (str): Lines of the game in the input text file format
+        engine (str): Name of the game engine (see ENGINES)
+
+    Returns:
+        Dict[str, Union[int, str]]: Scores, result and rendered boards of the game, or the error message
+            if the game inputs are invalid
+    """
+    if engine not in ENGINES:
+        return {'error': "Unknown engine: {engine}".format(engine=engine)}
+    if engine not in _simulators:
+        _simulators[engine] = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+    s = _simulators[engine]
+    try:
+        s.read_input_lines(text.split('\n'), name='request')
+        s.simulate()
+    except ValueError as e:
+        return {'error': str(e)}
+    (p1_score, p2_score, result) = s.get_scores()
+    return {'result': result, 'P1': p1_score, 'P2': p2_score, 'boards': s.render_result()}
+
+def _warm_up() -> int:
+    """Runs a small game in a worker process, so that its imports and first-call costs are paid before the first request
+
+    Returns:
+        int: Process ID of the worker
+    """
+    simulate_request('2\n1\n0:0\n1:1\n1\n0,0\n1,1')
+    return os.getpid()
+
+class LatencyMetrics():
+    def __init__(self, window:int=LATENCY_WINDOW) -> None:
+        """Request counters, and the latencies of the most recent requests
+
+        Args:
+            window (int): Number of recent latencies kept for the percentiles
+        """
+        self.__latencies = deque(maxlen=window)
+        self.counters = {'requests': 0, 'errors': 0, 'rejected': 0, 'timeouts': 0}
+
+    def record(self, seconds:float) -> None:
+        """Records the latency of a served request
+
+        Args:
+            seconds (float): Time from receiving the request to sending the response
+        """
+        self.__latencies.append(seconds)
+
+    def percentile(self, q:float) -> Optional[float]:
+        """Latency percentile (nearest rank) over the recent requests
+
+        Args:
+            q (float): Percentile, between 0 and 100
+
+        Returns:
+            Optional[float]: Latency in seconds (None if no request was served yet)
+        """
+        if not self.__latencies:
+            return None
+        latencies = sorted(self.__latencies)
+        return latencies[max(0, math.ceil(q / 100 * len(latencies)) - 1)]
+
+    def snapshot(self) -> Dict[str, Union[int, float, None]]:
+        """Current counters and p50/p99 latencies
+
+        Returns:
+            Dict[str, Union[int, float, None]]: Counters, and the latencies in milliseconds
+        """
+        snapshot = dict(self.counters)
+        for q in (50, 99):
+            seconds = self.percentile(q)
+            snapshot['p{q}_ms'.format(q=q)] = None if seconds is None else round(seconds * 1e3, 3)
+        return snapshot
+
+class SimulationService():
+    def __init__(self, workers:Optional[int]=None, max_pending:Optional[int]=None, timeout:float=10.0) -> None:
+        """Asyncio front end of the simulation service. The games are simulated on a pool of worker processes
+        which are started (and warmed up) once, in start().
+
+        Args:
+            workers (Optional[int]): Number of worker processes (defaults to the number of CPUs)
+            max_pending (Optional[int]): Number of requests simulated or queued at once (defaults to 4 per worker).
+                Requests beyond it are rejected right away with a "Server busy" error (backpressure).
+            timeout (float): Seconds after which a request gets a timeout error
+        """
+        self.__workers = workers or os.cpu_count() or 1
+        self.__max_pending = max_pending or self.__workers * 4
+        self.__timeout = timeout
+        self.__executor = None
+        self.__server = None
+        self.__n_pending = 0
+        # Executor futures of the games submitted and not finished yet
+        self.__futures = set()
+        self.metrics = LatencyMetrics()
+
+    async def start(self, host:str='127.0.0.1', port:int=0) -> int:
+        """Starts the worker processes and the socket server
+
+        Args:
+            host (str): Address to listen on
+            port (int): Port to listen on (0 picks a free port)
+
+        Returns:
+            int: Port the server listens on
+        """
+        loop = asyncio.get_running_loop()
+        self.__executor = ProcessPoolExecutor(max_workers=self.__workers)
+        pids = await asyncio.gather(*(loop.run_in_executor(self.__executor, _warm_up) for _ in range(self.__workers)))
+        logging.info("Started {n} worker processes: {pids}".format(n=len(set(pids)), pids=sorted(set(pids))))
+        self.__server = await asyncio.start_server(self.__handle_connection, host, port)
+        port = self.__server.sockets[0].getsockname()[1]
+        logging.info("Simulation service listening on {host}:{port}".format(host=host, port=port))
+        return port
+
+    async def serve_forever(self) -> None:
+        """Serves requests until the service is closed"""
+        async with self.__server:
+            await self.__server.serve_forever()
+
+    async def close(self) -> None:
+        """Stops the socket server and the worker processes"""
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+        if self.__executor is not None:
+            # Games no worker picked up yet are dropped; the running ones are waited for off the event loop
+            for future in list(self.__futures):
+                future.cancel()
+            await asyncio.get_running_loop().run_in_executor(None, self.__executor.shutdown, True)
+
+    async def handle_request(self, request:Dict) -> Dict:
+        """Serves one request
+
+        Args:
+            request (Dict): Decoded request
+
+        Returns:
+            Dict: Response
+        """
+        if request.get('metrics'):
+            return dict(self.metrics.snapshot(), pending=self.__n_pending)
+
+        self.metrics.counters['requests'] += 1
+        if self.__n_pending >= self.__max_pending:
+            self.metrics.counters['rejected'] += 1
+            return {'error': "Server busy: {n} requests pending".format(n=self.__n_pending)}
+        if not isinstance(request.get('input'), str):
+            self.metrics.counters['errors'] += 1
+            return {'error': "Request needs the game lines as the 'input' string."}
+
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self.__executor.submit(simulate_request, request['input'], request.get('engine', 'default'))
+            self.__n_pending += 1
+            self.__futures.add(future)
+            # A timed out game keeps its worker busy until it finishes, so its slot is only released when the worker
+            # is done with it (the callback runs in a thread of the executor)
+            future.add_done_callback(lambda f: loop.call_soon_threadsafe(self.__release, f))
+            response = await asyncio.wait_for(asyncio.wrap_future(future), self.__timeout)
+        except asyncio.TimeoutError:
+            self.metrics.counters['timeouts'] += 1
+            return {'error': "Request timed out after {t} s".format(t=self.__timeout)}
+        except Exception as e:
+            # Any other failure of the worker (e.g. a request field of the wrong type) is the response of the request,
+            # so that the connection keeps serving the next requests
+            self.metrics.counters['errors'] += 1
+            logging.debug("Request failed: {error!r}".format(error=e))
+            return {'error': "Request failed: {type}: {error}".format(type=type(e).__name__, error=e)}
+
+        seconds = time.perf_counter() - start
+        self.metrics.record(seconds)
+        if 'error' in response:
+            self.metrics.counters['errors'] += 1
+        response['ms'] = round(seconds * 1e3, 3)
+        return response
+
+    def __release(self, future:Future) -> None:
+        """Releases the pending slot of a game once its worker is done with it (or it was cancelled)
+
+        Args:
+            future (Future): Executor future of the game
+        """
+        self.__futures.discard(future)
+        self.__n_pending -= 1
+
+    async def __handle_connection(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter) -> None:
+        """Serves the requests of a client connection, one per line, in order
+
+        Args:
+            reader (asyncio.StreamReader): Reader of the connection
+            writer (asyncio.StreamWriter): Writer of the connection
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                if isinstance(request, dict):
+                    response = await self.handle_request(request)
+                else:
+                    self.metrics.counters['errors'] += 1
+                    response = {'error': "Request needs to be a JSON object on one line."}
+                writer.write(json.dumps(response).encode() + b'\n')
+                # Waits for the client to read the responses when its socket buffer is full
+                await writer.drain()
+        except ConnectionError:
+            logging.debug("Client disconnected")
+        finally:
+            writer.close()
+
+async def request(host:str, port:int, requests:List[Dict]) -> List[Dict]:
+    """Client helper: sends requests over one connection and reads their responses
+
+    Args:
+        host (str): Address of the service
+        port (int): Port of the service
+        requests (List[Dict]): Requests to send
+
+    Returns:
+        List[Dict]: Responses, in the order of the requests
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        responses = []
+        for req in requests:
+            writer.write(json.dumps(req).encode() + b'\n')
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        return responses
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+async def _serve(args:argparse.Namespace) -> None:
+    """Runs the service with the command line options until interrupted
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
+    service = SimulationService(workers=args.workers, max_pending=args.max_pending, timeout=args.timeout)
+    await service.start(args.host, args.port)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serves Battleship simulations over a local socket")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Number of worker processes")
+    parser.add_argument('--max-pending', type=int, default=None, help="Requests in flight before new ones are rejected")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Request timeout in seconds")
+    parser.add_argument('-v', '--verbose', action="store_const", dest="loglevel", const=logging.INFO, default=logging.WARNING)
+    args = parser.parse_args()
+    logging.basicConfig(level=args.loglevel)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
@@ -3,12 +3,26 @@
 
 from .player import Player
 from .game import Game
+from .streaming import skip_line, stream_list_input
+from .binary_format import load_binary
+from .instrumentation import Instrumentation
+from .sinks import ResultSink, TextFileSink
+from .cache import ResultCache, input_key
+from .validator import InputValidator, duplicate_locations
+from .replay import ReplayLog
+from .fleet import fleet_cells, ship_lengths
 
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
-from datetime import datetime
 from enum import Enum
+from contextlib import nullcontext
+
+# Default input and output directories (resolved once, not for every Simulator)
+DEFAULT_INPUT_DIR = Path(__file__).parent.resolve() / '..' / 'data'
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.resolve() / '..' / 'out'
+# Moves handed to vectorized game engines at a time (bounds the memory taken by streamed move lists)
+MOVE_CHUNK_SIZE = 1 << 16
 
 class SimInputs(Enum):
     """Enum class representing different inputs present in the input file 
@@ -23,30 +37,116 @@ class SimInputs(Enum):
     P2_MOVES = 6
 
 class Simulator():
-    def __init__(self, p1:Player, p2:Player, g:Game) -> None:
+    __slots__ = ('__player_1', '__player_2', '__game', '__validator', '__sim_inputs', '__sim_input_read_complete',
+                    '__early_exit', '__decided_turn', '__n_ship_locations', '__record_replay', '__snapshot_interval',
+                    '__replay', '__cache', '__cache_key', '__result_record', '__input_file_dir', '__output_file_dir',
+                    '__input_file_name', '__instrumentation', '__phase', 'output_file_name')
+
+    def __init__(self, p1:Player, p2:Player, g:Game, input_dir:Optional[Path]=None, output_dir:Optional[Path]=None,
+                    instrumentation:Optional[Instrumentation]=None, cache:Optional[ResultCache]=None,
+                    early_exit:bool=False, replay:bool=False, snapshot_interval:Optional[int]=None) -> None:
         """Simulator class to perform the simulation using the provided input file
 
         Args:
             p1 (Player): Player object corresponding to Player 1
             p2 (Player): Player object corresponding to Player 2
             g (Game): Game object corresponding to the game (player boards and game related actions)
+            input_dir (Optional[Path]): Directory containing the input files (defaults to ../data)
+            output_dir (Optional[Path]): Directory where the result files are written (defaults to ../out)
+            instrumentation (Optional[Instrumentation]): Event hooks, counters and phase timers of the run (disabled if None)
+            cache (Optional[ResultCache]): Cache of the results of earlier games. If the inputs of a game hit the cache,
+                simulate() does nothing and the cached result is written instead (disabled if None).
+            early_exit (bool): If True, simulate() stops firing as soon as the game result can no longer change,
+                so the final boards do not show the remaining moves. If False, all the T missiles are fired.
+            replay (bool): If True, simulate() records a replay log of the shots of the game (see get_replay).
+                Games are then simulated move by move, and the result cache is bypassed.
+            snapshot_interval (Optional[int]): Number of turns between two board snapshots of the replay log
+                (defaults to ReplayLog's interval for the board size)
         """
         # Game-specific objects
         self.__player_1 = p1
         self.__player_2 = p2
         self.__game = g
+        self.__validator = InputValidator(max_board_size=g.max_board_size, max_missiles=g.max_missiles, fleets=g.fleets,
+                                            packed=g.packed)
 
         # Game-specific attributes
         self.__sim_inputs = None
         self.__sim_input_read_complete = False
 
+        # Early exit, and the turn after which the result of the current game can no longer change
+        self.__early_exit = early_exit
+        self.__decided_turn = None
+        self.__n_ship_locations = None
+
+        # Replay log of the current game (only recorded if enabled)
+        self.__record_replay = replay
+        self.__snapshot_interval = snapshot_interval
+        self.__replay = None
+
+        # Result cache, and the key and result record of the current game (the record is only kept once it is final)
+        self.__cache = cache
+        self.__cache_key = None
+        self.__result_record = None
+
         # IO files / directories 
-        _this_dir = Path(__file__).parent.resolve()
-        self.__input_file_dir = _this_dir / '..' / 'data'
-        self.__output_file_dir = _this_dir / '..' / 'out'
+        self.__input_file_dir = Path(input_dir) if input_dir else DEFAULT_INPUT_DIR
+        self.__output_file_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
         self.__input_file_name = ""
+
+        # Instrumentation (the phase timers do nothing if it is disabled)
+        self.__instrumentation = instrumentation
+        self.__phase = instrumentation.phase if instrumentation is not None else nullcontext
+        if instrumentation is not None:
+            self.__game.set_instrumentation(instrumentation)
     
-    def __numeric_input_sanity_check(self, _raw_input:str, _input_name:str, _line_n:int, _lower:int, _upper:int) -> int:
+    def reset(self) -> None:
+        """Clears the inputs of the last game and resets the Game and Player objects, so that the simulator can be 
+        reused for another game without allocating new objects. The input methods call it before reading.
+        """
+        self.__sim_inputs = None
+        self.__sim_input_read_complete = False
+        self.__input_file_name = ""
+        self.__cache_key = None
+        self.__result_record = None
+        self.__decided_turn = None
+        self.__replay = None
+        self.__game.reset()
+        self.__player_1.reset()
+        self.__player_2.reset()
+
+    def get_game(self) -> Game:
+        """Returns the Game object of the simulator (e.g. to get the scores of the simulated game)
+
+        Returns:
+            Game: Game object
+        """
+        return self.__game
+
+    def get_replay(self) -> Optional[ReplayLog]:
+        """Returns the replay log of the simulated game
+
+        Returns:
+            Optional[ReplayLog]: Replay log, or None if replays are disabled (or the game is not simulated yet)
+        """
+        return self.__replay
+
+    def __cache_lookup(self) -> None:
+        """Looks up the result of the game in the cache (if enabled). Games of players with live strategies, 
+        games with streamed moves and recorded games are not cached.
+        """
+        if self.__cache is None or self.__record_replay or self.__player_1.has_strategy() or self.__player_2.has_strategy():
+            return
+        # Early exit games end with other boards, so they are cached apart
+        engine = type(self.__game).__name__ + ('+early-exit' if self.__early_exit else '')
+        self.__cache_key = input_key(self.__sim_inputs, engine)
+        if self.__cache_key is not None:
+            self.__result_record = self.__cache.get(self.__cache_key)
+            if self.__result_record is not None:
+                self.__decided_turn = self.__result_record.pop('decided_turn', None)
+                logging.debug("Result cache hit: {key}".format(key=self.__cache_key))
+
+    def __numeric_input_sanity_check(self, _raw_input:str, _input_name:str, _line_n:int, _lower:int, _upper:Optional[int]) -> int:
         """Performs sanity check on the numeric inputs in the input text file to the simulator
 
         Args:
@@ -54,7 +154,7 @@ class Simulator():
             _input_name (str): Input name for the debug messages
             _line_n (int): Line no. of the input in the file
             _lower (int): Lower bound of the numeric input
-            _upper (int): Upper bound of the numeric input
+            _upper (Optional[int]): Upper bound of the numeric input (None if unbounded)
 
         Raises:
             ValueError: If the input is present in the file in an invalid format
@@ -75,100 +175,35 @@ class Simulator():
             if __input <= _lower:
                 raise ValueError('{name} must be greater than {bound}. (Battleship input file: Line {line_n})'
                                 .format(name=_input_name, bound=_lower, line_n=_line_n))
-            if __input >= _upper:
+            if _upper is not None and __input >= _upper:
                 raise ValueError('{name} must be less than {bound}. (Battleship input file: Line {line_n})'
                                 .format(name=_input_name, bound=_upper, line_n=_line_n))
         return __input
     
-    def __list_input_sanity_check(self, _raw_input:str, _input_name:str, _line_n:int, _listsep:str, _item_sep:str, 
-                                    _list_len:int, _list_item_lower:int, _list_item_upper:int) -> List[Tuple[int, int]]:
-        """Performs sanity checks on the list type inputs from the input text file to the simulator
+    def __input_sanity_check(self, _inputs:List[str], _stream_from:Optional[Path]=None) -> dict:
+        """Validates the input lines of the simulator in bulk (see InputValidator), reporting every error at once
 
         Args:
-            _raw_input (str): Raw value of the input present in the file
-            _input_name (str): Name of the input for debugging messages
-            _line_n (int): Line no. of the input in the file
-            _listsep (str): Separator character using which the list items are separated
-            _item_sep (str): Separator character using which the item components are separated (coordinate values, in this case)
-            _list_len (int): Length of the list (no. of list items that should be present)
-            _list_item_lower (int): Lower bound for the coordinate values
-            _list_item_upper (int): Upper bound for the coordinate values
+            _inputs (List[str]): Raw lines of the input text file
+            _stream_from (Optional[Path]): If given, the move inputs are the byte offsets of their lines in this file,
+                and the moves are parsed and sanity checked lazily (as generators) while they are consumed
 
         Raises:
-            ValueError: If one or more list items are in invalid format
-            ValueError: If the number of list items does not match to the _list_len parameter
-            ValueError: If one or more list items fall outside the range given be _list_item_lower and _list_item_upper
-
-        Returns:
-            List[Tuple[int, int]]: List of tuples, where the sanitized coordinates are integer tuples
-        """
-        __input_list = []
-        try:
-            __input_list_split = _raw_input.split(_listsep)
-            for __list_item in __input_list_split:
-                input = tuple(map(int, __list_item.split(_item_sep)))
-                __input_list.append(input)
-        except ValueError:
-            raise ValueError("One or more inputs in {name} is in invalid format. (Battleship input file: Line {line})"
-                                .format(name=_input_name, line=_line_n))
-        except:
-            raise
-        else:
-            if len(__input_list) != _list_len:
-                raise ValueError("Number of inputs in {name} must match {list_len}. (Battleship input file: Line {line})"
-                                .format(name=_input_name, line=_line_n, list_len=_list_len))
-            for [in_x, in_y] in __input_list:
-                if in_x <= _list_item_lower or in_x >= _list_item_upper or in_y <= _list_item_lower or in_y >= _list_item_upper:
-                    raise ValueError("One or more input item in {name} is not in the range [{lower}, {upper}]. (Battleship input file: Line {line})"
-                                .format(name=_input_name, line=_line_n, lower=_list_item_lower+1, upper=_list_item_upper-1))
-        return __input_list
-
-    def __input_sanity_check(self, _inputs:str) -> None:
-        """Calls sanity check on individual input items present in the input text file to the simulator
-
-        Args:
-            _inputs (str): Raw contents of the input text file
+            InputValidationError: With every error found in the inputs (it is a ValueError, and its message starts
+                with the message of the first error)
 
         Returns:
-            None
+            dict: Sanitized inputs ('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES')
         """
-        inputs_dict = {}
-        for input in SimInputs:
-            # Call sanity checks on inputs depending on what they are (either numeric type or list type)
-            if input == SimInputs.BATTLEGROUND_SIZE:
-                __M_raw = _inputs[input.value]
-                logging.debug("M (raw) = {}".format(__M_raw))
-                inputs_dict['M'] = self.__numeric_input_sanity_check(__M_raw, 'Battleground size input (M)', 1, 0, 10)
-            elif input == SimInputs.N_SHIPS:
-                __S_raw = _inputs[input.value]
-                logging.debug("S (raw) = {}".format(__S_raw))
-                inputs_dict['S'] = self.__numeric_input_sanity_check(__S_raw, 'Number of ships (S)', 2, 0, int(inputs_dict['M']**2/2))
-            elif input == SimInputs.P1_POS_SHIPS:
-                __P1_POS_SHIPS_raw = _inputs[input.value]
-                logging.debug("P1_POS_SHIPS (raw) = {}".format(__P1_POS_SHIPS_raw))
-                inputs_dict['P1_POS_SHIPS'] = self.__list_input_sanity_check(__P1_POS_SHIPS_raw, 'Player 1 ship positions', 
-                                                                                3, ',', ':', inputs_dict['S'], -1, inputs_dict['M'])
-            elif input == SimInputs.P2_POS_SHIPS:
-                __P2_POS_SHIPS_raw = _inputs[input.value]
-                logging.debug("P2_POS_SHIPS (raw) = {}".format(__P2_POS_SHIPS_raw))
-                inputs_dict['P2_POS_SHIPS'] = self.__list_input_sanity_check(__P2_POS_SHIPS_raw, 'Player 2 ship positions', 
-                                                                                4, ',', ':', inputs_dict['S'], -1, inputs_dict['M'])
-            elif input == SimInputs.N_MISSILES:
-                __T_raw = _inputs[input.value]
-                logging.debug("T (raw) = {}".format(__T_raw))
-                inputs_dict['T'] = self.__numeric_input_sanity_check(__T_raw, 'Number of missiles (T)', 5, 0, 100)
-            elif input == SimInputs.P1_MOVES:
-                __P1_MOVES_raw = _inputs[input.value]
-                logging.debug("P1_MOVES (raw) = {}".format(__P1_MOVES_raw))
-                inputs_dict['P1_MOVES'] = self.__list_input_sanity_check(__P1_MOVES_raw, 'Player 1 moves', 
-                                                                                6, ':', ',', inputs_dict['T'], -1, inputs_dict['M'])
-            elif input == SimInputs.P2_MOVES:
-                __P2_MOVES_raw = _inputs[input.value]
-                logging.debug("P2_MOVES (raw) = {}".format(__P2_MOVES_raw))
-                inputs_dict['P2_MOVES'] = self.__list_input_sanity_check(__P2_MOVES_raw, 'Player 2 moves', 
-                                                                                7, ':', ',', inputs_dict['T'], -1, inputs_dict['M'])
+        inputs_dict = self.__validator.validate(_inputs, moves=_stream_from is None)
+        if _stream_from:
+            inputs_dict['P1_MOVES'] = stream_list_input(_stream_from, _inputs[SimInputs.P1_MOVES.value], 'Player 1 moves', 
+                                                            6, ':', ',', inputs_dict['T'], -1, inputs_dict['M'])
+            inputs_dict['P2_MOVES'] = stream_list_input(_stream_from, _inputs[SimInputs.P2_MOVES.value], 'Player 2 moves', 
+                                                            7, ':', ',', inputs_dict['T'], -1, inputs_dict['M'])
         
-        logging.debug("Sanitized inputs: {}".format(str(inputs_dict)))
+        # Lazily formatted, since the inputs can be large
+        logging.debug("Sanitized inputs: %s", inputs_dict)
         return inputs_dict
     
     def __game_setup(self) -> None:
@@ -177,31 +212,115 @@ class Simulator():
         self.__game.set_n_ships(self.__sim_inputs['S'])
         self.__game.setup_boards(n_ships=self.__sim_inputs['S'], 
                                     p1_ships=self.__sim_inputs['P1_POS_SHIPS'],
-                                    p2_ships=self.__sim_inputs['P2_POS_SHIPS'])
+                                    p2_ships=self.__sim_inputs['P2_POS_SHIPS'],
+                                    board_size=self.__sim_inputs['M'])
 
     def __player_setup(self) -> None:
         """Sets up the internal members of the Player objects
         """
         self.__player_1.set_moves_list(self.__sim_inputs['P1_MOVES'])
         self.__player_2.set_moves_list(self.__sim_inputs['P2_MOVES'])
+        # Strategies know the lengths of the ships they fire at (Player 1 fires at the ships of Player 2)
+        if self.__player_1.has_strategy():
+            self.__player_1.set_ship_lengths(ship_lengths(self.__sim_inputs['P2_POS_SHIPS']))
+        if self.__player_2.has_strategy():
+            self.__player_2.set_ship_lengths(ship_lengths(self.__sim_inputs['P1_POS_SHIPS']))
+        self.__player_1.set_board_size(self.__sim_inputs['M'])
+        self.__player_2.set_board_size(self.__sim_inputs['M'])
+
+    def __is_result_decided(self, n_shots_left:int) -> bool:
+        """Whether the game result can no longer change, i.e. neither player can catch up with (or, for a draw, 
+        overtake) the other with the shots left. A player can score at most one hit per shot, and at most one 
+        per opponent ship location not destroyed yet.
+
+        Args:
+            n_shots_left (int): Number of shots each player has left
+
+        Returns:
+            bool: True if the result of the game is decided
+        """
+        p1_score = self.__game.get_player_scores(player_id=1)
+        p2_score = self.__game.get_player_scores(player_id=2)
+        p1_max = p1_score + min(n_shots_left, self.__n_ship_locations[1] - p1_score)
+        p2_max = p2_score + min(n_shots_left, self.__n_ship_locations[0] - p2_score)
+        return p1_score > p2_max or p2_score > p1_max or (p1_score == p1_max and p2_score == p2_max)
 
     def simulate(self) -> None:
-        """Simulates the game of Battleship using the inputs provided in the inputs text file
+        """Simulates the game of Battleship using the inputs provided in the inputs text file.
+        Unless the game engine is vectorized (and early exit and replays are disabled), the turn after which the result was 
+        decided is tracked (see get_decided_turn).
 
         Raises:
             RuntimeError: If the method is called before the simulation inputs are read from an input file
+            ValueError: If replays are enabled and the board is too large for a replay log
         """
         if not self.__sim_input_read_complete:
             raise RuntimeError('Simulation input file needs to be read before simulation.')
+
+        if self.__result_record is not None:
+            # Cache hit (or already simulated game with the cache enabled): the result is known
+            if self.__instrumentation is not None:
+                self.__instrumentation.emit('game_over', self.__result_record['result'], 
+                                            self.__result_record['P1'], self.__result_record['P2'])
+            return
         
-        for _ in range(self.__sim_inputs['T']):
-            p1_move = self.__player_1.next_move()
-            logging.debug("Player 1 moves: ({x},{y})".format(x=p1_move[0],y=p1_move[1]))
-            self.__game.register_player_move(player_id=1, hit_loc=p1_move)
+        n_missiles = self.__sim_inputs['T']
+        with self.__phase('simulate'):
+            # Distinct ship locations of Player 1 and Player 2 (duplicated locations can only be hit once)
+            self.__n_ship_locations = (len(set(map(tuple, self.__sim_inputs['P1_POS_SHIPS']))), 
+                                        len(set(map(tuple, self.__sim_inputs['P2_POS_SHIPS']))))
+            self.__decided_turn = 0 if self.__is_result_decided(n_missiles) else None
+            if self.__record_replay:
+                self.__replay = ReplayLog(self.__sim_inputs['M'], fleet_cells(self.__sim_inputs['P1_POS_SHIPS']), 
+                                            fleet_cells(self.__sim_inputs['P2_POS_SHIPS']), snapshot_interval=self.__snapshot_interval)
+            replay = self.__replay
+
+            if self.__early_exit and self.__decided_turn is not None:
+                logging.debug("Game result decided before the first move")
+            elif self.__player_1.has_strategy() or self.__player_2.has_strategy():
+                # Live strategies choose each move from the outcome of their earlier moves
+                for turn in range(1, n_missiles + 1):
+                    for (player_id, player) in ((1, self.__player_1), (2, self.__player_2)):
+                        move = player.next_move()
+                        hit = self.__game.register_player_move(player_id=player_id, hit_loc=move)
+                        player.register_feedback(move, hit)
+                        if replay is not None:
+                            replay.record(player_id, move, hit, score=self.__game.get_player_scores(player_id=player_id))
+                    if self.__decided_turn is None and self.__is_result_decided(n_missiles - turn):
+                        self.__decided_turn = turn
+                        if self.__early_exit:
+                            break
+            elif self.__game.vectorized and not self.__early_exit and replay is None:
+                # Both move lists are fully known up front, so the game resolves each of them in passes of 
+                # MOVE_CHUNK_SIZE moves (slices of the parsed move lists, or moves read from the file when streamed)
+                for (player_id, player) in ((1, self.__player_1), (2, self.__player_2)):
+                    for start in range(0, n_missiles, MOVE_CHUNK_SIZE):
+                        self.__game.register_player_moves(player_id=player_id,
+                                                            hit_locs=player.next_moves(min(MOVE_CHUNK_SIZE, n_missiles - start)))
+            else:
+                # The result is checked after every turn until it is decided (and not anymore in full mode)
+                for turn in range(1, n_missiles + 1):
+                    if replay is None:
+                        self.__game.register_player_move(player_id=1, hit_loc=self.__player_1.next_move())
+                        self.__game.register_player_move(player_id=2, hit_loc=self.__player_2.next_move())
+                    else:
+                        for (player_id, player) in ((1, self.__player_1), (2, self.__player_2)):
+                            move = player.next_move()
+                            hit = self.__game.register_player_move(player_id=player_id, hit_loc=move)
+                            replay.record(player_id, move, hit, score=self.__game.get_player_scores(player_id=player_id))
+                    if self.__decided_turn is None and self.__is_result_decided(n_missiles - turn):
+                        self.__decided_turn = turn
+                        if self.__early_exit:
+                            break
+
+        if self.__instrumentation is not None:
+            self.__instrumentation.emit('game_over', self.__game.get_game_result(), 
+                                        self.__game.get_player_scores(player_id=1), self.__game.get_player_scores(player_id=2))
 
-            p2_move = self.__player_2.next_move()
-            logging.debug("Player 2 moves: ({x},{y})".format(x=p2_move[0],y=p2_move[1]))
-            self.__game.register_player_move(player_id=2, hit_loc=p2_move)
+        if self.__cache_key is not None:
+            with self.__phase('render'):
+                self.__result_record = self.get_result_record()
+            self.__cache.put(self.__cache_key, dict(self.__result_record, decided_turn=self.__decided_turn))
 
     def get_result(self) -> str:
         """Returns result of the game
@@ -210,59 +329,216 @@ class Simulator():
             str: Either "It is a draw" or "Player 1 wins" or "Player 2 wins"
         """
         self.simulate()
-        return self.__game.get_game_result()
+        return self.get_scores()[2]
+
+    def get_decided_turn(self) -> Optional[int]:
+        """Returns the turn after which the result of the simulated game could no longer change (turn t is the 
+        t-th move of both players, and 0 if the result was decided before the first move)
+
+        Returns:
+            Optional[int]: Turn, or None if the game was resolved by a vectorized game engine (without early exit)
+        """
+        return self.__decided_turn
+
+    def get_scores(self) -> Tuple[int, int, str]:
+        """Returns the scores and the result of the simulated game (taken from the cache on a cache hit)
+
+        Returns:
+            Tuple[int, int, str]: Score of Player 1, score of Player 2 and the game result
+        """
+        if self.__result_record is not None:
+            return (self.__result_record['P1'], self.__result_record['P2'], self.__result_record['result'])
+        return (self.__game.get_player_scores(player_id=1), self.__game.get_player_scores(player_id=2), 
+                self.__game.get_game_result())
     
-    def read_input(self, filename: str) -> None:
+    def read_input(self, filename: str, streaming:bool=False) -> None:
         """Reads input from the input text file, performs sanity checks and stores them in the usable format
 
         Args:
-            filename (str): File name of the input file (must be present in ../data directory)
+            filename (str): File name of the input file (relative to the input directory, or an absolute path)
+            streaming (bool): If True, the player moves are not read here. They are parsed and sanity checked 
+                lazily from the file while simulate() consumes them (so invalid moves raise errors from simulate()).
         """
+        self.reset()
         self.__input_file_name = filename
         _input_file_abs_path = self.__input_file_dir / self.__input_file_name
         
-        with open(_input_file_abs_path, 'r') as f:
-            _contents = f.read().split('\n')
-            
+        if streaming:
+            with self.__phase('parse'), open(_input_file_abs_path, 'rb') as f:
+                # Read the lines before the moves as they are, and only locate the lines of the moves
+                _contents = [f.readline().decode().rstrip('\n') for _ in range(SimInputs.P1_MOVES.value)]
+                _contents.append(f.tell())
+                skip_line(f)
+                _contents.append(f.tell())
+
+            # Sanity check and store sim inputs (moves are generators reading from the file)
+            with self.__phase('validate'):
+                self.__sim_inputs = self.__input_sanity_check(_contents, _stream_from=_input_file_abs_path)
+        else:
+            with self.__phase('parse'), open(_input_file_abs_path, 'r') as f:
+                _contents = f.read().split('\n')
+                
             # Sanity check and store sim inputs 
-            self.__sim_inputs = self.__input_sanity_check(_contents)
+            with self.__phase('validate'):
+                self.__sim_inputs = self.__input_sanity_check(_contents)
         
         # Set up the internal game and player objects 
-        self.__game_setup()
-        self.__player_setup()
+        with self.__phase('setup'):
+            self.__game_setup()
+            self.__player_setup()
 
         logging.debug("Inputs read from the file: {path}".format(path=_input_file_abs_path))
+        self.__cache_lookup()
         self.__sim_input_read_complete = True
 
-    def write_result(self) -> None:
-        """Writes result in the output file.
+    def read_binary_input(self, filename:str) -> None:
+        """Reads input from a binary game file (memory-mapped, without copying the coordinate arrays), 
+        performs sanity checks and stores them in the usable format
+
+        Args:
+            filename (str): File name of the binary game file (relative to the input directory, or an absolute path)
+
+        Raises:
+            ValueError: If the file is not a valid binary game file
+            ValueError: If the board size, number of ships or number of missiles is out of bounds
+            ValueError: If one or more coordinates fall outside the board
+            ValueError: If a player has more than one ship at the same position
         """
-        self.output_file_name = 'Result__' \
-            + str(int(datetime.now().timestamp())) \
-            + '__' \
-            + self.__input_file_name.split('.')[0] + '.txt'
-        _output_file_abs_path = self.__output_file_dir / self.output_file_name
-
-        # Construct the result string
-        result = ''
-
-        result += 'Player1\n'
-        for board_line in self.__game.get_player_board(player_id=1):
-            for line_item in board_line:
-                result += line_item + ' '
-            result += '\n'
-        result += '\n\n\n'
-        result += 'Player2\n'
-        for board_line in self.__game.get_player_board(player_id=2):
-            for line_item in board_line:
-                result += line_item + ' '
-            result += '\n'
-        result += '\n'
-        result += 'P1:' + str(self.__game.get_player_scores(player_id=1)) + '\n'
-        result += 'P2:' + str(self.__game.get_player_scores(player_id=2)) + '\n'
-        result += self.__game.get_game_result()
-
-        with open(_output_file_abs_path, 'w') as f:
-            f.write(result)
-        
-        logging.debug("Simulation result written in the file: {path}".format(path=_output_file_abs_path))
\ No newline at end of file
+        self.reset()
+        self.__input_file_name = filename
+        _input_file_abs_path = self.__input_file_dir / self.__input_file_name
+        with self.__phase('parse'):
+            inputs = load_binary(_input_file_abs_path)
+
+        with self.__phase('validate'):
+            self.__numeric_input_sanity_check(inputs['M'], 'Battleground size input (M)', 1, 0, self.__game.max_board_size)
+            self.__numeric_input_sanity_check(inputs['S'], 'Number of ships (S)', 2, 0, int(inputs['M']**2/2))
+            self.__numeric_input_sanity_check(inputs['T'], 'Number of missiles (T)', 5, 0, self.__game.max_missiles)
+            for (name, input_name, line_n) in (('P1_POS_SHIPS', 'Player 1 ship positions', 3), ('P2_POS_SHIPS', 'Player 2 ship positions', 4),
+                                                ('P1_MOVES', 'Player 1 moves', 6), ('P2_MOVES', 'Player 2 moves', 7)):
+                # Coordinates are unsigned, so only the upper bound needs to be checked
+                if inputs[name].max_value() >= inputs['M']:
+                    raise ValueError("One or more input item in {name} is not in the range [{lower}, {upper}]. (Battleship input file: Line {line})"
+                                        .format(name=input_name, line=line_n, lower=0, upper=inputs['M']-1))
+                if name.endswith('_SHIPS'):
+                    for (index, first_index) in duplicate_locations(inputs[name]):
+                        (loc_x, loc_y) = inputs[name][index]
+                        raise ValueError("Position {x}:{y} in {name} is duplicated (first at item {first}). (Battleship input file: Line {line})"
+                                            .format(x=loc_x, y=loc_y, name=input_name, first=first_index + 1, line=line_n))
+        self.__sim_inputs = inputs
+
+        # Set up the internal game and player objects 
+        with self.__phase('setup'):
+            self.__game_setup()
+            self.__player_setup()
+
+        logging.debug("Inputs read from the binary file: {path}".format(path=_input_file_abs_path))
+        self.__cache_lookup()
+        self.__sim_input_read_complete = True
+
+    def get_sim_inputs(self) -> dict:
+        """Returns the sanitized simulation inputs
+
+        Raises:
+            RuntimeError: If the method is called before the simulation inputs are read
+
+        Returns:
+            dict: Sanitized inputs ('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES')
+        """
+        if not self.__sim_input_read_complete:
+            raise RuntimeError('Simulation input file needs to be read before getting the inputs.')
+        return self.__sim_inputs
+
+    def read_input_lines(self, lines:List[str], name:str) -> None:
+        """Performs sanity checks on the lines of an input (in the input text file format, e.g. one game of a 
+        container file) and stores them in the usable format
+
+        Args:
+            lines (List[str]): Lines of the input, without line endings
+            name (str): Name of the input (used as the input file name for the result file)
+        """
+        self.reset()
+        self.__input_file_name = name
+        with self.__phase('validate'):
+            self.__sim_inputs = self.__input_sanity_check(lines)
+
+        # Set up the internal game and player objects 
+        with self.__phase('setup'):
+            self.__game_setup()
+            self.__player_setup()
+        self.__cache_lookup()
+        self.__sim_input_read_complete = True
+
+    def __render_board(self, player_id:int) -> str:
+        """Renders a player's board for the result file. Boards of sparse games are rendered as the list of their 
+        occupied locations ('x:y C', one per line) instead of the full grid.
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Returns:
+            str: Rendered board, one line per board row (or per occupied location)
+        """
+        if hasattr(self.__game, 'get_occupied_cells'):
+            return ''.join('{x}:{y} {cell}\n'.format(x=loc_x, y=loc_y, cell=cell) 
+                            for (loc_x, loc_y), cell in self.__game.get_occupied_cells(player_id=player_id).items())
+
+        # Each row is joined once (every location followed by a space), instead of concatenating cell by cell
+        return ''.join(' '.join(board_line) + ' \n' for board_line in self.__game.get_player_board(player_id=player_id))
+
+    def render_result(self) -> str:
+        """Renders the result of the simulation (the boards, scores and the game result) as it is written in the output file
+
+        Returns:
+            str: Result text
+        """
+        if self.__result_record is not None:
+            return self.__result_record['text']
+        return ''.join([
+            'Player1\n',
+            self.__render_board(player_id=1),
+            '\n\n\n',
+            'Player2\n',
+            self.__render_board(player_id=2),
+            '\n',
+            'P1:', str(self.__game.get_player_scores(player_id=1)), '\n',
+            'P2:', str(self.__game.get_player_scores(player_id=2)), '\n',
+            self.__game.get_game_result(),
+        ])
+
+    def get_result_record(self) -> dict:
+        """Result record of the simulated game, as written in result sinks
+
+        Returns:
+            dict: 'input' (input file name), 'P1' and 'P2' (scores), 'result' (game result) and 'text' (result text)
+        """
+        if self.__result_record is not None:
+            return dict(self.__result_record, input=self.__input_file_name)
+        return {
+            'input': self.__input_file_name,
+            'P1': self.__game.get_player_scores(player_id=1),
+            'P2': self.__game.get_player_scores(player_id=2),
+            'result': self.__game.get_game_result(),
+            'text': self.render_result(),
+        }
+
+    def write_result(self, sink:Optional[ResultSink]=None) -> Path:
+        """Writes result in the output file, or in a result sink.
+
+        Args:
+            sink (Optional[ResultSink]): Sink the result record is written to (defaults to a new text file 
+                Result__<unix seconds>__<input name>.txt in the output directory)
+
+        Returns:
+            Path: Absolute path of the written output file (or of the file of the sink)
+        """
+        # Construct the result record
+        with self.__phase('render'):
+            record = self.get_result_record()
+
+        with self.__phase('write'):
+            _output_file_abs_path = (sink or TextFileSink(self.__output_file_dir)).write(record)
+        self.output_file_name = _output_file_abs_path.name
+
+        logging.debug("Simulation result written in the file: {path}".format(path=_output_file_abs_path))
+        return _output_file_abs_path
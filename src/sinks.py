@@ -0,0 +1,212 @@
+"""This file contains the result sinks which the Simulator writes the results of its games to.
+
+A sink takes one result record per game: the name of the input, the scores, the game result and the rendered result
+text (boards, scores and game result, as in the result files). Sinks which hold records in memory write them out
+in batches, and when they are closed.
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Union
+
+# Fields of a result record
+RECORD_FIELDS = ['input', 'P1', 'P2', 'result', 'text']
+
+class ResultSink():
+    """Base class of the result sinks. Sinks can be used as context managers, which close them on exit."""
+
+    def write(self, record:Dict[str, Union[int, str]]) -> Path:
+        """Writes (or buffers) the result record of a game
+
+        Args:
+            record (Dict[str, Union[int, str]]): Result record (see RECORD_FIELDS)
+
+        Returns:
+            Path: Path of the file the record is (or will be) written in
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Writes out the buffered records"""
+
+    def close(self) -> None:
+        """Writes out the buffered records and releases the file"""
+        self.flush()
+
+    def __enter__(self) -> 'ResultSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class TextFileSink(ResultSink):
+    def __init__(self, output_dir:Path) -> None:
+        """Writes the result text of every game in its own file, Result__<unix seconds>__<input name>.txt.
+        If the file already exists (same input in the same second), a counter is appended to the name
+        instead of overwriting it.
+
+        Args:
+            output_dir (Path): Directory of the result files
+        """
+        self.__output_dir = Path(output_dir)
+
+    def write(self, record:Dict[str, Union[int, str]]) -> Path:
+        """Writes the result text of a game in a new file
+
+        Args:
+            record (Dict[str, Union[int, str]]): Result record (see RECORD_FIELDS)
+
+        Returns:
+            Path: Path of the written result file
+        """
+        stem = 'Result__' + str(int(datetime.now().timestamp())) + '__' + Path(record['input']).name.split('.')[0]
+        path = self.__output_dir / (stem + '.txt')
+        n = 1
+        while True:
+            try:
+                # Exclusive creation, so that two runs never write in the same file
+                with open(path, 'x') as f:
+                    f.write(record['text'])
+                return path
+            except FileExistsError:
+                n += 1
+                path = self.__output_dir / '{stem}_{n}.txt'.format(stem=stem, n=n)
+
+class AppendFileSink(ResultSink):
+    def __init__(self, path:Path, buffer_size:int=1000) -> None:
+        """Appends one JSON result record per game (per line) to a single file. Records are buffered and
+        written with one write call per buffer_size games.
+
+        Args:
+            path (Path): Path of the results file (appended to, if it exists)
+            buffer_size (int): Number of records buffered before they are written
+        """
+        self.__path = Path(path)
+        self.__buffer_size = buffer_size
+        self.__buffer = []
+        self.__file = open(self.__path, 'a')
+
+    def write(self, record:Dict[str, Union[int, str]]) -> Path:
+        """Buffers the result record of a game
+
+        Args:
+            record (Dict[str, Union[int, str]]): Result record (see RECORD_FIELDS)
+
+        Returns:
+            Path: Path of the results file
+        """
+        self.__buffer.append(json.dumps(record))
+        if len(self.__buffer) >= self.__buffer_size:
+            self.flush()
+        return self.__path
+
+    def flush(self) -> None:
+        """Writes out the buffered records"""
+        if self.__buffer:
+            self.__file.write('\n'.join(self.__buffer) + '\n')
+            self.__file.flush()
+            self.__buffer = []
+
+    def close(self) -> None:
+        """Writes out the buffered records and closes the file"""
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+class SQLiteSink(ResultSink):
+    def __init__(self, path:Path, batch_size:int=1000, table:str='results') -> None:
+        """Inserts the result records in a table of a local SQLite database, batch_size records per transaction
+
+        Args:
+            path (Path): Path of the database file (created if it does not exist)
+            batch_size (int): Number of records inserted per transaction
+            table (str): Name of the table (created if it does not exist)
+        """
+        self.__path = Path(path)
+        self.__batch_size = batch_size
+        self.__batch = []
+        # Waits for the locks of other processes writing in the same database (e.g. batch workers)
+        self.__connection = sqlite3.connect(str(self.__path), timeout=60)
+        self.__insert = 'INSERT INTO "{table}" (input, p1, p2, result, text) VALUES (?, ?, ?, ?, ?)'.format(table=table)
+        with self.__connection:
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS "{table}" (id INTEGER PRIMARY KEY, input TEXT, '
+                                        'p1 INTEGER, p2 INTEGER, result TEXT, text TEXT)'.format(table=table))
+
+    def write(self, record:Dict[str, Union[int, str]]) -> Path:
+        """Buffers the result record of a game
+
+        Args:
+            record (Dict[str, Union[int, str]]): Result record (see RECORD_FIELDS)
+
+        Returns:
+            Path: Path of the database file
+        """
+        self.__batch.append(tuple(record[field] for field in RECORD_FIELDS))
+        if len(self.__batch) >= self.__batch_size:
+            self.flush()
+        return self.__path
+
+    def flush(self) -> None:
+        """Inserts the buffered records in one transaction"""
+        if self.__batch:
+            with self.__connection:
+                self.__connection.executemany(self.__insert, self.__batch)
+            logging.debug("Inserted {n} result records in {path}".format(n=len(self.__batch), path=self.__path))
+            self.__batch = []
+
+    def close(self) -> None:
+        """Inserts the buffered records and closes the database connection"""
+        if self.__connection is not None:
+            self.flush()
+            self.__connection.close()
+            self.__connection = None
+
+# Sink kinds by name, for the command line
+SINKS = ['text', 'append', 'sqlite']
+
+def open_sink(kind:str, output_dir:Path, path:Union[Path, str, None]=None) -> ResultSink:
+    """Opens a result sink
+
+    Args:
+        kind (str): Kind of the sink (see SINKS)
+        output_dir (Path): Directory of the result files
+        path (Union[Path, str, None]): Results file of the 'append' sink, or database file of the 'sqlite' sink
+            (defaults to results.jsonl or results.sqlite in output_dir)
+
+    Raises:
+        ValueError: If the kind of sink is unknown
+
+    Returns:
+        ResultSink: The sink
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if kind == 'text':
+        return TextFileSink(output_dir)
+    elif kind == 'append':
+        return AppendFileSink(Path(path) if path else Path(output_dir) / 'results.jsonl')
+    elif kind == 'sqlite':
+        return SQLiteSink(Path(path) if path else Path(output_dir) / 'results.sqlite')
+    raise ValueError("Unknown result sink: {kind}. (Expected one of {kinds})".format(kind=kind, kinds=', '.join(SINKS)))
+
+def read_records(sink_path:Path) -> List[Dict[str, Union[int, str]]]:
+    """Reads back the records of an 'append' results file or a 'sqlite' database (e.g. for tests and reports)
+
+    Args:
+        sink_path (Path): Results file (.jsonl) or database file
+
+    Returns:
+        List[Dict[str, Union[int, str]]]: Records, in the order they were written
+    """
+    sink_path = Path(sink_path)
+    if sink_path.suffix == '.jsonl':
+        with open(sink_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    connection = sqlite3.connect(str(sink_path))
+    try:
+        rows = connection.execute('SELECT input, p1, p2, result, text FROM results ORDER BY id').fetchall()
+    finally:
+        connection.close()
+    return [dict(zip(RECORD_FIELDS, row)) for row in rows]
@@ -0,0 +1,200 @@
+"""This file contains the sparse game class for a 2-player game of Battleship on large boards.
+"""
+
+from .instrumentation import Instrumentation
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class SparseGame():
+    # Moves are registered one at a time with register_player_move
+    vectorized = False
+    # Ships cover a single location each
+    fleets = False
+    # Move lists are lists of tuples
+    packed = False
+    # The board size (M) and number of missiles (T) are not bounded, since nothing is allocated per board cell
+    max_board_size = None
+    max_missiles = None
+
+    def __init__(self) -> None:
+        """Class containing the player battlegrounds as hashed coordinate indexes instead of dense grids.
+        Memory grows with the number of ships and shots (not with M x M), and the class provides the same
+        methods as the Game class.
+        """
+        self.__n_ships = None
+        self.__board_size = None
+        self.__p1_ships = None
+        self.__p2_ships = None
+        # Shots recorded as deltas over the initial boards: location -> 'O' (miss) or 'X' (hit)
+        self.__p1_shots = None
+        self.__p2_shots = None
+        self.__p1_ships_destroyed = 0
+        self.__p2_ships_destroyed = 0
+        self.__instrumentation = None
+
+    def reset(self) -> None:
+        """Clears the game so that the object can be set up for another game
+        """
+        self.__n_ships = None
+        self.__board_size = None
+        self.__p1_ships = None
+        self.__p2_ships = None
+        self.__p1_shots = None
+        self.__p2_shots = None
+        self.__p1_ships_destroyed = 0
+        self.__p2_ships_destroyed = 0
+
+    def set_instrumentation(self, instrumentation:Optional[Instrumentation]) -> None:
+        """Sets the instrumentation which game events (shots, hits and misses) are reported to
+
+        Args:
+            instrumentation (Optional[Instrumentation]): Instrumentation of the run (None disables the events)
+        """
+        self.__instrumentation = instrumentation
+
+    def set_n_ships(self, n_ships:int) -> None:
+        """Sets the number of ships that players are allowed to place
+
+        Args:
+            n_ships (int): Number of ships
+        """
+        self.__n_ships = n_ships
+
+    def setup_boards(self, n_ships:int, p1_ships:Iterable[Tuple[int, int]], p2_ships:Iterable[Tuple[int, int]],
+                        board_size:Optional[int]=None) -> None:
+        """Sets up the battlegrounds ('player boards') in the form of hashed sets of ship locations
+
+        Args:
+            n_ships (int): Number of ships the players are allowed to place
+            p1_ships (Iterable[Tuple[int, int]]): Locations of the ships of Player 1
+            p2_ships (Iterable[Tuple[int, int]]): Locations of the ships of Player 2
+            board_size (Optional[int]): Size M of the (M x M) boards (defaults to the number of ships)
+        """
+        if not self.__n_ships:
+            self.__n_ships = n_ships
+        self.__board_size = board_size or self.__n_ships
+
+        self.__p1_ships = set(map(tuple, p1_ships))
+        self.__p2_ships = set(map(tuple, p2_ships))
+        self.__p1_shots = {}
+        self.__p2_shots = {}
+
+    def register_player_move(self, player_id:int, hit_loc:Tuple[int, int]) -> bool:
+        """Registers player move on the other player's battleground (board)
+
+        Args:
+            player_id (int): ID of the player making the move (either 1 or 2).
+            hit_loc (Tuple[int, int]): Location where the player is making the move. Either hits or misses.
+
+        Raises:
+            ValueError: If the player ID is not 1 or 2.
+
+        Returns:
+            bool: True if the move hit a ship (a location can only be hit once)
+        """
+        hit_loc = tuple(hit_loc)
+        outcome = None
+        if player_id == 1:
+            if hit_loc not in self.__p2_shots:
+                if hit_loc in self.__p2_ships:
+                    self.__p2_shots[hit_loc] = 'X'
+                    self.__p2_ships_destroyed += 1
+                    outcome = 'hit'
+                else:
+                    self.__p2_shots[hit_loc] = 'O'
+                    outcome = 'miss'
+        elif player_id == 2:
+            if hit_loc not in self.__p1_shots:
+                if hit_loc in self.__p1_ships:
+                    self.__p1_shots[hit_loc] = 'X'
+                    self.__p1_ships_destroyed += 1
+                    outcome = 'hit'
+                else:
+                    self.__p1_shots[hit_loc] = 'O'
+                    outcome = 'miss'
+        else:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+
+        if self.__instrumentation is not None:
+            self.__instrumentation.emit('shot', player_id, hit_loc)
+            if outcome:
+                self.__instrumentation.emit(outcome, player_id, hit_loc)
+        return outcome == 'hit'
+
+    def get_player_scores(self, player_id:int) -> int:
+        """Gets the score of a player depending on the current state of the other player's board
+
+        Args:
+            player_id (int): ID of the player. (Should be either 1 or 2)
+
+        Raises:
+            ValueError: If player ID is other than 1 or 2
+
+        Returns:
+            int: Player score
+        """
+        score = None
+        if player_id == 1:
+            score = self.__p2_ships_destroyed
+        elif player_id == 2:
+            score = self.__p1_ships_destroyed
+        else:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        return score
+
+    def get_occupied_cells(self, player_id:int) -> Dict[Tuple[int, int], str]:
+        """Locations of a player's board which are not empty, i.e. the ships and the shots fired at the board
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            Dict[Tuple[int, int], str]: Location -> either 'O', 'X' or 'B', sorted by location
+        """
+        if player_id == 1:
+            ships, shots = self.__p1_ships, self.__p1_shots
+        elif player_id == 2:
+            ships, shots = self.__p2_ships, self.__p2_shots
+        else:
+            raise ValueError("Player ID needs to be either 1 or 2.")
+        cells = dict.fromkeys(ships, 'B')
+        cells.update(shots)
+        return dict(sorted(cells.items()))
+
+    def get_player_board(self, player_id:int) -> List[List[str]]:
+        """Current state of a player's battleground board, expanded to a dense (M x M) list of lists.
+        This allocates the full grid; use get_occupied_cells for large boards.
+
+        Args:
+            player_id (int): ID of the player (should be either 1 or 2)
+
+        Raises:
+            ValueError: If the player ID is other than 1 or 2
+
+        Returns:
+            List[List[str]]: The board (list of list of chars) where each location is either '_', 'O', 'X' or 'B'
+        """
+        board = [['_'] * self.__board_size for _ in range(self.__board_size)]
+        for (loc_x, loc_y), cell in self.get_occupied_cells(player_id).items():
+            board[loc_x][loc_y] = cell
+        return board
+
+    def get_game_result(self) -> str:
+        """Returns the game result by comparing players' scores
+
+        Returns:
+            str: Either "It is a draw", "Player 1 wins" or "Player 2 wins" depending on player scores
+        """
+        game_result = ''
+        if self.__p1_ships_destroyed == self.__p2_ships_destroyed:
+            game_result = "It is a draw"
+        elif self.__p1_ships_destroyed > self.__p2_ships_destroyed:
+            game_result = "Player 2 wins"
+        elif self.__p1_ships_destroyed < self.__p2_ships_destroyed:
+            game_result = "Player 1 wins"
+        logging.debug("Game result: {result}".format(result=game_result))
+        return game_result
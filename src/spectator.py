@@ -0,0 +1,209 @@
+"""This file contains the live spectator view of a game, drawn in an ANSI terminal while the game is simulated.
+
+The spectator follows the game through the hit and miss events of the instrumentation. The event hooks only queue
+the shots, and a render thread draws frames at a fixed rate, independent of the simulation speed: every frame redraws
+only the locations changed since the previous frame (with cursor-addressed writes), or the cached string of a whole
+board row when that is shorter. Only the top-left view of large boards is drawn; the scores count all the shots.
+"""
+
+from .instrumentation import Instrumentation
+from .fleet import fleet_cells
+
+import sys
+import threading
+from collections import deque
+from typing import List, Optional, Sequence, TextIO, Tuple
+
+DEFAULT_FPS = 10.0
+# Largest number of rows and columns of each board which are drawn
+DEFAULT_VIEW_SIZE = 32
+
+# ANSI escape sequences
+_CLEAR_SCREEN = '\x1b[2J'
+_CLEAR_LINE = '\x1b[K'
+_MOVE_TO = '\x1b[{row};{column}H'
+# Length of a cursor move, above which a changed row is drawn whole instead of location by location
+_MOVE_LENGTH = len(_MOVE_TO.format(row=10, column=10))
+
+class Spectator():
+    def __init__(self, board_size:int, p1_ships:Sequence[Tuple[int, int]], p2_ships:Sequence[Tuple[int, int]],
+                    stream:Optional[TextIO]=None, fps:float=DEFAULT_FPS, view_size:int=DEFAULT_VIEW_SIZE) -> None:
+        """Live terminal view of the boards and scores of a game (see attach and start)
+
+        Args:
+            board_size (int): Board size M
+            p1_ships (Sequence[Tuple[int, int]]): Ship locations of Player 1
+            p2_ships (Sequence[Tuple[int, int]]): Ship locations of Player 2
+            stream (Optional[TextIO]): Terminal the frames are written to (defaults to the standard output)
+            fps (float): Number of frames drawn per second
+            view_size (int): Number of rows and columns drawn of each board
+
+        Raises:
+            ValueError: If the frame rate is not positive
+        """
+        if fps <= 0:
+            raise ValueError("Frame rate needs to be positive.")
+        self.__stream = stream or sys.stdout
+        self.__frame_interval = 1 / fps
+        self.__view = min(board_size, view_size)
+
+        # Drawn locations of the board of Player 1 (index 0) and Player 2 (index 1), and the cached row strings
+        self.__cells = []
+        for ships in (p1_ships, p2_ships):
+            cells = [['_'] * self.__view for _ in range(self.__view)]
+            for (loc_x, loc_y) in ships:
+                if loc_x < self.__view and loc_y < self.__view:
+                    cells[loc_x][loc_y] = 'B'
+            self.__cells.append(cells)
+        self.__rows = [[self.__row_string(cells) for cells in board] for board in self.__cells]
+
+        # Shots queued by the event hooks (appending to a deque is atomic, so the hooks take no lock)
+        self.__pending = deque()
+        self.__hits = [0, 0]
+        self.__result = None
+        self.__drawn = False
+
+        self.__stopped = threading.Event()
+        self.__thread = None
+
+    @classmethod
+    def from_simulator(cls, s, **kwargs) -> 'Spectator':
+        """Spectator of the game of a simulator, once its input is read
+
+        Args:
+            s (Simulator): Simulator of the game
+            kwargs: Other arguments of the Spectator
+
+        Returns:
+            Spectator: Spectator of the game
+        """
+        inputs = s.get_sim_inputs()
+        return cls(inputs['M'], fleet_cells(inputs['P1_POS_SHIPS']), fleet_cells(inputs['P2_POS_SHIPS']), **kwargs)
+
+    @staticmethod
+    def __row_string(cells:List[str]) -> str:
+        """Row as written in the result files (every location followed by a space)
+
+        Args:
+            cells (List[str]): Locations of the row
+
+        Returns:
+            str: Row string
+        """
+        return ' '.join(cells) + ' '
+
+    def attach(self, instrumentation:Instrumentation) -> None:
+        """Adds the hooks queuing the shots and the game result
+
+        Args:
+            instrumentation (Instrumentation): Instrumentation of the simulator
+        """
+        pending = self.__pending
+        # Player 1 fires at the board of Player 2 (index 1), and Player 2 at the board of Player 1 (index 0)
+        instrumentation.add_hook('hit', lambda player_id, hit_loc: pending.append((2 - player_id, hit_loc, 'X')))
+        instrumentation.add_hook('miss', lambda player_id, hit_loc: pending.append((2 - player_id, hit_loc, 'O')))
+        instrumentation.add_hook('game_over', lambda game_result, p1_score, p2_score: pending.append((None, None, game_result)))
+
+    def __screen_line(self, board:int, loc_x:int=-1) -> int:
+        """Terminal line of a board row (1-based)
+
+        Args:
+            board (int): Index of the board (0 for Player 1, 1 for Player 2)
+            loc_x (int): Row of the board (-1 for the title of the board)
+
+        Returns:
+            int: Line number
+        """
+        return board * (self.__view + 3) + loc_x + 2
+
+    def render_frame(self) -> str:
+        """Applies the queued shots and draws them: the whole screen on the first frame, and then only the changed
+        locations (or rows), and the status line
+
+        Returns:
+            str: Text written to the terminal
+        """
+        changed = {}
+        n_events = len(self.__pending)
+        for _ in range(n_events):
+            (board, hit_loc, cell) = self.__pending.popleft()
+            if board is None:
+                self.__result = cell
+                continue
+            if cell == 'X':
+                self.__hits[1 - board] += 1
+            (loc_x, loc_y) = hit_loc
+            if loc_x < self.__view and loc_y < self.__view and self.__cells[board][loc_x][loc_y] != cell:
+                self.__cells[board][loc_x][loc_y] = cell
+                changed.setdefault((board, loc_x), set()).add(loc_y)
+
+        parts = []
+        if not self.__drawn:
+            parts.append(_CLEAR_SCREEN)
+            for board in (0, 1):
+                parts.append(_MOVE_TO.format(row=self.__screen_line(board), column=1))
+                parts.append('Player{k}'.format(k=board + 1))
+                for (loc_x, row) in enumerate(self.__rows[board]):
+                    parts.append(_MOVE_TO.format(row=self.__screen_line(board, loc_x), column=1))
+                    parts.append(row)
+            self.__drawn = True
+        for ((board, loc_x), columns) in changed.items():
+            row = self.__rows[board][loc_x] = self.__row_string(self.__cells[board][loc_x])
+            line = self.__screen_line(board, loc_x)
+            if len(columns) * _MOVE_LENGTH > len(row):
+                parts.append(_MOVE_TO.format(row=line, column=1))
+                parts.append(row)
+            else:
+                for loc_y in sorted(columns):
+                    parts.append(_MOVE_TO.format(row=line, column=2 * loc_y + 1))
+                    parts.append(row[2 * loc_y])
+        if n_events or len(parts) > 1:
+            parts.append(_MOVE_TO.format(row=self.__screen_line(2), column=1))
+            parts.append('P1 hits: {p1}  P2 hits: {p2}  {result}'.format(p1=self.__hits[0], p2=self.__hits[1], 
+                                                                            result=self.__result or ''))
+            parts.append(_CLEAR_LINE)
+
+        frame = ''.join(parts)
+        if frame:
+            self.__stream.write(frame)
+            self.__stream.flush()
+        return frame
+
+    def get_cells(self) -> Tuple[List[List[str]], List[List[str]]]:
+        """Drawn locations of both boards (the top-left view of the boards)
+
+        Returns:
+            Tuple[List[List[str]], List[List[str]]]: Locations of the boards of Player 1 and Player 2
+        """
+        return (self.__cells[0], self.__cells[1])
+
+    def __run(self) -> None:
+        """Draws a frame every frame interval until the spectator is stopped
+        """
+        while not self.__stopped.wait(self.__frame_interval):
+            self.render_frame()
+
+    def start(self) -> None:
+        """Starts the render thread
+        """
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run, name='spectator', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stops the render thread, draws the last frame and moves the cursor below the view
+        """
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        self.render_frame()
+        self.__stream.write(_MOVE_TO.format(row=self.__screen_line(2) + 1, column=1))
+        self.__stream.flush()
+
+    def __enter__(self) -> 'Spectator':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
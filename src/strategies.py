@@ -0,0 +1,262 @@
+"""This file contains the live shooting strategies for the players of a 2-player game of Battleship.
+
+Unlike a fixed move list, a strategy chooses each move from the feedback (hit or miss) on the earlier moves.
+"""
+
+import heapq
+import random
+from typing import Iterator, Optional, Sequence, Tuple
+
+class Strategy():
+    def __init__(self, seed:Optional[int]=None) -> None:
+        """Base class of the shooting strategies
+
+        Args:
+            seed (Optional[int]): Seed of the random choices of the strategy
+        """
+        self._rng = random.Random(seed)
+        self._board_size = None
+
+    def reset(self, board_size:int) -> None:
+        """Starts a new game on a (board_size x board_size) board
+
+        Args:
+            board_size (int): Board size M
+        """
+        self._board_size = board_size
+
+    def set_ship_lengths(self, ship_lengths:Sequence[int]) -> None:
+        """Takes the lengths of the opponent's ships (known from the game inputs) into account, before reset
+
+        Args:
+            ship_lengths (Sequence[int]): Length of each ship of the opponent
+        """
+
+    def next_move(self) -> Tuple[int, int]:
+        """Chooses the next move
+
+        Returns:
+            Tuple[int, int]: Location on the opponent's board
+        """
+        raise NotImplementedError
+
+    def register_feedback(self, hit_loc:Tuple[int, int], hit:bool) -> None:
+        """Takes the outcome of the last move into account
+
+        Args:
+            hit_loc (Tuple[int, int]): Location of the move
+            hit (bool): True if the move hit a ship
+        """
+
+class RandomStrategy(Strategy):
+    def reset(self, board_size:int) -> None:
+        """Starts a new game on a (board_size x board_size) board
+
+        Args:
+            board_size (int): Board size M
+        """
+        super().reset(board_size)
+        # Lazy Fisher-Yates shuffle of the board cells: only the swapped positions are stored
+        self.__n_remaining = board_size * board_size
+        self.__swapped = {}
+
+    def next_move(self) -> Tuple[int, int]:
+        """Chooses a random location which was not shot at yet (once every location is shot, starts over)
+
+        Returns:
+            Tuple[int, int]: Location on the opponent's board
+        """
+        if not self.__n_remaining:
+            self.reset(self._board_size)
+        pick = self._rng.randrange(self.__n_remaining)
+        self.__n_remaining -= 1
+        cell = self.__swapped.get(pick, pick)
+        self.__swapped[pick] = self.__swapped.pop(self.__n_remaining, self.__n_remaining)
+        return divmod(cell, self._board_size)
+
+class HuntTargetStrategy(Strategy):
+    def reset(self, board_size:int) -> None:
+        """Starts a new game on a (board_size x board_size) board
+
+        Args:
+            board_size (int): Board size M
+        """
+        super().reset(board_size)
+        self.__hunt = RandomStrategy(seed=self._rng.random())
+        self.__hunt.reset(board_size)
+        self.__targets = []
+        self.__shot = set()
+
+    def next_move(self) -> Tuple[int, int]:
+        """Shoots at the neighbours of earlier hits first (target mode), and at random locations otherwise (hunt mode)
+
+        Returns:
+            Tuple[int, int]: Location on the opponent's board
+        """
+        while self.__targets:
+            target = self.__targets.pop()
+            if target not in self.__shot:
+                break
+        else:
+            target = self.__hunt.next_move()
+            if len(self.__shot) < self._board_size * self._board_size:
+                while target in self.__shot:
+                    target = self.__hunt.next_move()
+        self.__shot.add(target)
+        return target
+
+    def register_feedback(self, hit_loc:Tuple[int, int], hit:bool) -> None:
+        """Queues the unshot neighbours of a hit as targets
+
+        Args:
+            hit_loc (Tuple[int, int]): Location of the move
+            hit (bool): True if the move hit a ship
+        """
+        if not hit:
+            return
+        (x, y) = hit_loc
+        for neighbour in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= neighbour[0] < self._board_size and 0 <= neighbour[1] < self._board_size and neighbour not in self.__shot:
+                self.__targets.append(neighbour)
+
+class ProbabilityDensityStrategy(Strategy):
+    # Extra weight of a ship placement for every hit it covers
+    HIT_WEIGHT = 10
+
+    def __init__(self, ship_lengths:Optional[Sequence[int]]=None, seed:Optional[int]=None) -> None:
+        """Shoots at the location covered by the most (weighted) ship placements which are still possible.
+        The placement counts are updated incrementally after each move: only the placements covering the
+        location of the move are visited, instead of recounting every placement on every turn.
+
+        Args:
+            ship_lengths (Optional[Sequence[int]]): Lengths of the opponent's ships (1 for single-cell ships).
+                If None, they are taken from the game inputs (see set_ship_lengths), or are single-cell ships.
+            seed (Optional[int]): Seed of the random tie-breaking between equally likely locations
+        """
+        super().__init__(seed)
+        self.__fixed_lengths = ship_lengths is not None
+        self.__ship_lengths = {}
+        self.__count_lengths(ship_lengths if ship_lengths is not None else (1,))
+
+    def __count_lengths(self, ship_lengths:Sequence[int]) -> None:
+        """Counts the opponent's ships of each length (the weight of the placements of that length)
+
+        Args:
+            ship_lengths (Sequence[int]): Length of each ship
+        """
+        self.__ship_lengths = {}
+        for length in ship_lengths:
+            self.__ship_lengths[length] = self.__ship_lengths.get(length, 0) + 1
+
+    def set_ship_lengths(self, ship_lengths:Sequence[int]) -> None:
+        """Uses the lengths of the opponent's ships of the game inputs, unless lengths were given to the strategy
+
+        Args:
+            ship_lengths (Sequence[int]): Length of each ship of the opponent
+        """
+        if not self.__fixed_lengths and ship_lengths:
+            self.__count_lengths(ship_lengths)
+
+    def __placements(self, cell:Tuple[int, int]) -> Iterator[Tuple[int, int, int, int]]:
+        """Ship placements (length, horizontal, start x, start y) covering a location
+
+        Args:
+            cell (Tuple[int, int]): Location on the board
+
+        Yields:
+            Tuple[int, int, int, int]: Placements covering the location
+        """
+        (x, y) = cell
+        for length in self.__ship_lengths:
+            for horizontal in ((1, 0) if length > 1 else (1,)):
+                for offset in range(length):
+                    (start_x, start_y) = (x, y - offset) if horizontal else (x - offset, y)
+                    end_x, end_y = (start_x, start_y + length - 1) if horizontal else (start_x + length - 1, start_y)
+                    if start_x >= 0 and start_y >= 0 and end_x < self._board_size and end_y < self._board_size:
+                        yield (length, horizontal, start_x, start_y)
+
+    @staticmethod
+    def __cells(placement:Tuple[int, int, int, int]) -> Iterator[Tuple[int, int]]:
+        """Locations covered by a ship placement
+
+        Args:
+            placement (Tuple[int, int, int, int]): Ship placement (length, horizontal, start x, start y)
+
+        Yields:
+            Tuple[int, int]: Locations of the placement
+        """
+        (length, horizontal, start_x, start_y) = placement
+        for offset in range(length):
+            yield (start_x, start_y + offset) if horizontal else (start_x + offset, start_y)
+
+    def reset(self, board_size:int) -> None:
+        """Starts a new game on a (board_size x board_size) board, counting the placements covering each location once
+
+        Args:
+            board_size (int): Board size M
+        """
+        super().reset(board_size)
+        self.__shot = set()
+        self.__invalid = set()
+        self.__n_hits = {}
+        self.__density = {}
+        for x in range(board_size):
+            for y in range(board_size):
+                self.__density[(x, y)] = sum(self.__ship_lengths[placement[0]] for placement in self.__placements((x, y)))
+        self.__heap = [(-density, self._rng.random(), cell) for (cell, density) in self.__density.items()]
+        heapq.heapify(self.__heap)
+
+    def __add_density(self, placement:Tuple[int, int, int, int], weight:int) -> None:
+        """Adds the (weighted) count of a placement to the density of the locations it covers
+
+        Args:
+            placement (Tuple[int, int, int, int]): Ship placement
+            weight (int): Weight added to each location (negative to remove the placement)
+        """
+        weight *= self.__ship_lengths[placement[0]]
+        for cell in self.__cells(placement):
+            if cell not in self.__shot:
+                self.__density[cell] += weight
+                heapq.heappush(self.__heap, (-self.__density[cell], self._rng.random(), cell))
+
+    def next_move(self) -> Tuple[int, int]:
+        """Chooses the unshot location with the highest density (once every location is shot, starts over)
+
+        Returns:
+            Tuple[int, int]: Location on the opponent's board
+        """
+        while self.__heap:
+            (density, _, cell) = heapq.heappop(self.__heap)
+            # Skip the outdated heap entries
+            if cell not in self.__shot and -density == self.__density[cell]:
+                self.__shot.add(cell)
+                return cell
+        self.reset(self._board_size)
+        return self.next_move()
+
+    def register_feedback(self, hit_loc:Tuple[int, int], hit:bool) -> None:
+        """Updates the placement counts of the locations sharing a placement with the move's location.
+        A miss rules out every placement covering it, and a hit adds weight to them.
+
+        Args:
+            hit_loc (Tuple[int, int]): Location of the move
+            hit (bool): True if the move hit a ship
+        """
+        hit_loc = tuple(hit_loc)
+        for placement in self.__placements(hit_loc):
+            if placement in self.__invalid:
+                continue
+            weight = 1 + self.HIT_WEIGHT * self.__n_hits.get(placement, 0)
+            if hit:
+                self.__n_hits[placement] = self.__n_hits.get(placement, 0) + 1
+                self.__add_density(placement, self.HIT_WEIGHT)
+            else:
+                self.__invalid.add(placement)
+                self.__add_density(placement, -weight)
+
+# Strategies by name, for the command line
+STRATEGIES = {
+    'random': RandomStrategy,
+    'hunt-target': HuntTargetStrategy,
+    'density': ProbabilityDensityStrategy,
+}
@@ -0,0 +1,109 @@
+"""This file contains the streaming parser which reads player moves lazily from a Battleship input file.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+# Number of bytes read from the input file at once while tokenizing a line
+CHUNK_SIZE = 1 << 16
+
+def skip_line(f:BinaryIO, chunk_size:int=CHUNK_SIZE) -> None:
+    """Moves the file position to the start of the next line, without holding the skipped line in memory
+
+    Args:
+        f (BinaryIO): Input file opened in binary mode
+        chunk_size (int): Number of bytes read at once
+    """
+    while True:
+        chunk_start = f.tell()
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        newline_pos = chunk.find(b'\n')
+        if newline_pos >= 0:
+            f.seek(chunk_start + newline_pos + 1)
+            return
+
+def iter_line_tokens(f:BinaryIO, sep:str, chunk_size:int=CHUNK_SIZE) -> Iterator[str]:
+    """Splits the line starting at the current file position into tokens, reading the file chunk by chunk.
+    Once all the tokens are consumed, the file is positioned at the start of the next line.
+
+    Args:
+        f (BinaryIO): Input file opened in binary mode
+        sep (str): Separator character between the tokens
+        chunk_size (int): Number of bytes read at once
+
+    Yields:
+        str: Tokens of the line, in order (the last one without the line ending)
+    """
+    _sep = sep.encode()
+    pending = b''
+    while True:
+        chunk_start = f.tell()
+        chunk = f.read(chunk_size)
+        newline_pos = chunk.find(b'\n')
+        if newline_pos >= 0:
+            # Leave the file positioned at the start of the next line
+            f.seek(chunk_start + newline_pos + 1)
+            chunk = chunk[:newline_pos]
+        tokens = (pending + chunk).split(_sep)
+        if newline_pos >= 0 or not chunk:
+            for token in tokens:
+                yield token.decode()
+            return
+        # The last token may continue in the next chunk
+        pending = tokens.pop()
+        for token in tokens:
+            yield token.decode()
+
+def stream_list_input(file_path:Path, offset:int, _input_name:str, _line_n:int, _listsep:str, _item_sep:str,
+                        _list_len:int, _list_item_lower:int, _list_item_upper:int) -> Iterator[Tuple[int, int]]:
+    """Lazily parses and sanity checks a list type input of the input text file (same checks and error messages as
+    the Simulator performs on the whole line). Each coordinate is validated as it is read, and the line is never
+    held in memory as a whole.
+
+    Args:
+        file_path (Path): Path of the input file
+        offset (int): Byte offset of the start of the input's line in the file
+        _input_name (str): Name of the input for debugging messages
+        _line_n (int): Line no. of the input in the file
+        _listsep (str): Separator character using which the list items are separated
+        _item_sep (str): Separator character using which the item components are separated (coordinate values, in this case)
+        _list_len (int): Length of the list (no. of list items that should be present)
+        _list_item_lower (int): Lower bound for the coordinate values
+        _list_item_upper (int): Upper bound for the coordinate values
+
+    Raises:
+        ValueError: If a list item is in invalid format
+        ValueError: If the number of list items does not match to the _list_len parameter
+        ValueError: If a list item falls outside the range given be _list_item_lower and _list_item_upper
+
+    Yields:
+        Tuple[int, int]: Sanitized coordinates as integer tuples. The last item is only yielded after the end of
+            the line is reached, so that extra items are reported even if the consumer stops after _list_len items.
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        n_items = 0
+        previous: Optional[Tuple[int, int]] = None
+        for token in iter_line_tokens(f, _listsep):
+            try:
+                (in_x, in_y) = map(int, token.split(_item_sep))
+            except ValueError:
+                raise ValueError("One or more inputs in {name} is in invalid format. (Battleship input file: Line {line})"
+                                    .format(name=_input_name, line=_line_n))
+            n_items += 1
+            if n_items > _list_len:
+                raise ValueError("Number of inputs in {name} must match {list_len}. (Battleship input file: Line {line})"
+                                    .format(name=_input_name, line=_line_n, list_len=_list_len))
+            if in_x <= _list_item_lower or in_x >= _list_item_upper or in_y <= _list_item_lower or in_y >= _list_item_upper:
+                raise ValueError("One or more input item in {name} is not in the range [{lower}, {upper}]. (Battleship input file: Line {line})"
+                                    .format(name=_input_name, line=_line_n, lower=_list_item_lower+1, upper=_list_item_upper-1))
+            if previous is not None:
+                yield previous
+            previous = (in_x, in_y)
+
+        if n_items != _list_len:
+            raise ValueError("Number of inputs in {name} must match {list_len}. (Battleship input file: Line {line})"
+                                .format(name=_input_name, line=_line_n, list_len=_list_len))
+        yield previous
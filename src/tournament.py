@@ -0,0 +1,340 @@
+"""This file contains the round-robin tournament runner: every entrant (a ship layout with its move script) plays
+every other entrant once, and the games are ranked in a standings table.
+
+The pairings are split into deterministic shards, which are simulated over a process pool. Each finished shard is
+checkpointed to its own file, so an interrupted run resumes with the shards left, and separate invocations (e.g. on
+different machines, each running some of the shards) can merge their checkpoint directories into one standings table.
+"""
+
+from .simulator import Simulator
+from .player import Player
+from .engines import ENGINES
+from .batch import collect_input_files
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Columns of the standings file
+STANDINGS_FIELDS = ['rank', 'entrant', 'played', 'wins', 'draws', 'losses', 'points', 'hits_for', 'hits_against', 'errors']
+# Points of a win and of a draw
+WIN_POINTS = 3
+DRAW_POINTS = 1
+
+class Entrant(NamedTuple):
+    """Entrant of a tournament: name, and the raw ship positions and moves lines of its player"""
+    name: str
+    ships: str
+    moves: str
+
+def _shard_path(checkpoint_dir:Path, shard:int, n_shards:int) -> Path:
+    """Path of the checkpoint file of a shard
+
+    Args:
+        checkpoint_dir (Path): Checkpoint directory
+        shard (int): Index of the shard
+        n_shards (int): Number of shards
+
+    Returns:
+        Path: Checkpoint file
+    """
+    return Path(checkpoint_dir) / 'shard-{shard:05d}-of-{n:05d}.json'.format(shard=shard, n=n_shards)
+
+def _run_shard(task:Tuple[int, int, str, Path, str, List[Tuple[str, str, List[str]]]]) -> int:
+    """Simulates the games of a shard and writes its checkpoint file (runs inside a worker process)
+
+    Args:
+        task (Tuple[int, int, str, Path, str, List[Tuple[str, str, List[str]]]]): Index of the shard, number of shards,
+            fingerprint of the tournament, checkpoint directory, engine name, and the games of the shard as the
+            names of both entrants and the lines of the game
+
+    Returns:
+        int: Index of the shard
+    """
+    shard, n_shards, fingerprint, checkpoint_dir, engine, games = task
+    # One simulator is reused for all the games of the shard
+    s = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+    results = []
+    for (p1_name, p2_name, lines) in games:
+        result = {'p1': p1_name, 'p2': p2_name, 'P1': None, 'P2': None, 'result': None, 'error': None}
+        try:
+            s.read_input_lines(lines, name='{p1}__{p2}'.format(p1=p1_name, p2=p2_name))
+            s.simulate()
+        except (ValueError, IndexError) as e:
+            result['error'] = str(e) or type(e).__name__
+        else:
+            (result['P1'], result['P2'], result['result']) = s.get_scores()
+        results.append(result)
+
+    # Written under a temporary name and renamed, so that an interrupted run never leaves a partial checkpoint
+    data = json.dumps({'fingerprint': fingerprint, 'shard': shard, 'n_shards': n_shards, 'games': results})
+    fd, tmp_path = tempfile.mkstemp(dir=checkpoint_dir, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        f.write(data)
+    os.replace(tmp_path, _shard_path(checkpoint_dir, shard, n_shards))
+    return shard
+
+class Tournament():
+    def __init__(self, entrants:List[Entrant], board_size:int, n_ships:int, n_missiles:int, n_shards:int,
+                    checkpoint_dir:Path, engine:str='default') -> None:
+        """Round-robin tournament of the entrants. Pairing (i, j) of entrants i < j (in the order of the entrants)
+        is played with entrant i as Player 1, and goes in shard (index of the pairing) % n_shards.
+
+        Args:
+            entrants (List[Entrant]): Entrants, with distinct names
+            board_size (int): Board size M of all the games
+            n_ships (int): Number of ships S of all the games
+            n_missiles (int): Number of missiles T of all the games
+            n_shards (int): Number of shards the pairings are split into
+            checkpoint_dir (Path): Directory of the checkpoint files of the finished shards (created if it does not exist)
+            engine (str): Name of the game engine (see ENGINES)
+
+        Raises:
+            ValueError: If two entrants have the same name
+        """
+        names = [entrant.name for entrant in entrants]
+        if len(set(names)) != len(names):
+            raise ValueError("Entrant names need to be distinct.")
+        self.entrants = entrants
+        self.header = (board_size, n_ships, n_missiles)
+        self.n_shards = n_shards
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.engine = engine
+        # Checkpoints of other tournaments (other entrants, games or shards) are never resumed from
+        self.fingerprint = hashlib.sha256(json.dumps([engine, self.header, n_shards, entrants]).encode()).hexdigest()
+        self.__pairings = None
+
+    @classmethod
+    def from_files(cls, input_paths:Iterable[Path], n_shards:int, checkpoint_dir:Path, engine:str='default') -> 'Tournament':
+        """Tournament of the Player 1 ship layouts and moves of input text files (named after the files)
+
+        Args:
+            input_paths (Iterable[Path]): Input files, one per entrant
+            n_shards (int): Number of shards the pairings are split into
+            checkpoint_dir (Path): Directory of the checkpoint files
+            engine (str): Name of the game engine (see ENGINES)
+
+        Raises:
+            ValueError: If the input files do not all have the same board size, number of ships and number of missiles
+                (or they are not numbers)
+
+        Returns:
+            Tournament: The tournament
+        """
+        entrants, headers = [], set()
+        for input_path in input_paths:
+            with open(input_path, 'r') as f:
+                lines = f.read().split('\n')
+            headers.add((lines[0].strip(), lines[1].strip(), lines[4].strip()))
+            entrants.append(Entrant(Path(input_path).name.split('.')[0], lines[2], lines[5]))
+        if len(headers) != 1:
+            raise ValueError("Entrants need the same board size, number of ships and number of missiles. (Found {headers})"
+                                .format(headers=sorted(headers)))
+        (M, S, T) = map(int, headers.pop())
+        return cls(entrants, M, S, T, n_shards=n_shards, checkpoint_dir=checkpoint_dir, engine=engine)
+
+    def pairings(self) -> List[Tuple[int, int]]:
+        """All the pairings of the tournament, in a deterministic order
+
+        Returns:
+            List[Tuple[int, int]]: Indexes of the entrants (Player 1 first) of each game
+        """
+        # Listed once, and sliced for each shard
+        if self.__pairings is None:
+            n = len(self.entrants)
+            self.__pairings = [(i, j) for i in range(n) for j in range(i + 1, n)]
+        return self.__pairings
+
+    def shard_games(self, shard:int) -> List[Tuple[str, str, List[str]]]:
+        """Games of a shard
+
+        Args:
+            shard (int): Index of the shard
+
+        Returns:
+            List[Tuple[str, str, List[str]]]: Names of both entrants, and the lines of the game
+        """
+        (M, S, T) = self.header
+        games = []
+        for (i, j) in self.pairings()[shard::self.n_shards]:
+            (p1, p2) = (self.entrants[i], self.entrants[j])
+            games.append((p1.name, p2.name, [str(M), str(S), p1.ships, p2.ships, str(T), p1.moves, p2.moves]))
+        return games
+
+    def is_done(self, shard:int) -> bool:
+        """Whether a shard has a checkpoint of this tournament
+
+        Args:
+            shard (int): Index of the shard
+
+        Returns:
+            bool: True if the shard is finished
+        """
+        try:
+            with open(_shard_path(self.checkpoint_dir, shard, self.n_shards)) as f:
+                return json.load(f).get('fingerprint') == self.fingerprint
+        except (OSError, ValueError):
+            return False
+
+    def run(self, shards:Optional[Iterable[int]]=None, workers:Optional[int]=None) -> List[int]:
+        """Simulates the shards which are not finished yet over a pool of worker processes
+
+        Args:
+            shards (Optional[Iterable[int]]): Shards to run (defaults to all of them), e.g. the shards of this machine
+            workers (Optional[int]): Number of worker processes (defaults to the number of CPUs).
+                With a single worker the shards are simulated in the current process.
+
+        Raises:
+            ValueError: If a shard index is not between 0 and n_shards - 1
+
+        Returns:
+            List[int]: Shards simulated by this call (finished shards are skipped)
+        """
+        shards = sorted(set(range(self.n_shards) if shards is None else shards))
+        if shards and (shards[0] < 0 or shards[-1] >= self.n_shards):
+            raise ValueError("Shards need to be between 0 and {n}.".format(n=self.n_shards - 1))
+        pending = [shard for shard in shards if not self.is_done(shard)]
+        logging.info("Running {n} of {total} shards ({done} already finished)"
+                        .format(n=len(pending), total=len(shards), done=len(shards) - len(pending)))
+        tasks = [(shard, self.n_shards, self.fingerprint, self.checkpoint_dir, self.engine, self.shard_games(shard)) for shard in pending]
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            return [_run_shard(task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run_shard, tasks))
+
+def load_results(checkpoint_dirs:Iterable[Path]) -> Tuple[List[Dict], List[int]]:
+    """Reads the games of the finished shards of checkpoint directories (of one tournament)
+
+    Args:
+        checkpoint_dirs (Iterable[Path]): Checkpoint directories, e.g. one per machine
+
+    Raises:
+        ValueError: If the checkpoints are of different tournaments
+
+    Returns:
+        Tuple[List[Dict], List[int]]: Games of the finished shards (a shard found twice is counted once), and the
+            shards which are not finished
+    """
+    shards = {}
+    fingerprints = set()
+    n_shards = 0
+    for checkpoint_dir in checkpoint_dirs:
+        for path in sorted(Path(checkpoint_dir).glob('shard-*.json')):
+            with open(path) as f:
+                checkpoint = json.load(f)
+            fingerprints.add(checkpoint['fingerprint'])
+            n_shards = checkpoint['n_shards']
+            shards[checkpoint['shard']] = checkpoint['games']
+    if len(fingerprints) > 1:
+        raise ValueError("Checkpoints of {n} different tournaments cannot be merged.".format(n=len(fingerprints)))
+    missing = [shard for shard in range(n_shards) if shard not in shards]
+    return [game for shard in sorted(shards) for game in shards[shard]], missing
+
+def compute_standings(games:Iterable[Dict]) -> List[Dict[str, int]]:
+    """Ranks the entrants by points (WIN_POINTS per win, DRAW_POINTS per draw), then by the difference of the hits
+    they scored and conceded, then by name
+
+    Args:
+        games (Iterable[Dict]): Games of the tournament (see load_results)
+
+    Returns:
+        List[Dict[str, int]]: Standings rows (see STANDINGS_FIELDS), best entrant first
+    """
+    table = {}
+    def row(name:str) -> Dict[str, int]:
+        return table.setdefault(name, dict.fromkeys(STANDINGS_FIELDS[2:], 0))
+
+    for game in games:
+        (p1, p2) = (row(game['p1']), row(game['p2']))
+        if game['error']:
+            p1['errors'] += 1
+            p2['errors'] += 1
+            continue
+        for (player, score, other_score) in ((p1, game['P1'], game['P2']), (p2, game['P2'], game['P1'])):
+            player['played'] += 1
+            player['hits_for'] += score
+            player['hits_against'] += other_score
+        if game['result'] == "It is a draw":
+            for player in (p1, p2):
+                player['draws'] += 1
+                player['points'] += DRAW_POINTS
+        else:
+            (winner, loser) = (p1, p2) if game['result'] == "Player 1 wins" else (p2, p1)
+            winner['wins'] += 1
+            winner['points'] += WIN_POINTS
+            loser['losses'] += 1
+
+    ranked = sorted(table.items(), key=lambda item: (-item[1]['points'], item[1]['hits_against'] - item[1]['hits_for'], item[0]))
+    return [dict(rank=rank, entrant=name, **stats) for (rank, (name, stats)) in enumerate(ranked, start=1)]
+
+def write_standings(rows:List[Dict[str, int]], output_dir:Path) -> Path:
+    """Writes the standings table as a CSV file
+
+    Args:
+        rows (List[Dict[str, int]]): Standings rows returned by compute_standings
+        output_dir (Path): Directory in which the standings file is written
+
+    Returns:
+        Path: Path of the standings file
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    standings_path = Path(output_dir) / ('Standings__' + str(int(datetime.now().timestamp())) + '.csv')
+    with open(standings_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=STANDINGS_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    logging.debug("Standings written in the file: {path}".format(path=standings_path))
+    return standings_path
+
+def _parse_shards(spec:str) -> List[int]:
+    """Parses a list of shards given on the command line, e.g. '0-3,8'
+
+    Args:
+        spec (str): Comma separated shard indexes and inclusive ranges
+
+    Returns:
+        List[int]: Shard indexes
+    """
+    shards = []
+    for part in spec.split(','):
+        (first, _, last) = part.partition('-')
+        shards.extend(range(int(first), int(last or first) + 1))
+    return shards
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs a sharded round-robin tournament of Battleship entrants")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run_parser = subparsers.add_parser('run', help="Simulates (some of) the shards, skipping the finished ones")
+    run_parser.add_argument('entrants', help="Directory (or glob pattern) of the input files of the entrants (their Player 1 lines)")
+    run_parser.add_argument('checkpoint_dir', help="Directory of the checkpoint files")
+    run_parser.add_argument('-n', '--n-shards', type=int, required=True, help="Number of shards (the same for every invocation)")
+    run_parser.add_argument('--shards', type=_parse_shards, default=None, help="Shards to run, e.g. '0-3,8' (defaults to all)")
+    run_parser.add_argument('-w', '--workers', type=int, default=None, help="Number of worker processes")
+    run_parser.add_argument('-e', '--engine', choices=sorted(ENGINES), default='default')
+    merge_parser = subparsers.add_parser('merge', help="Merges the checkpoint directories into one standings table")
+    merge_parser.add_argument('checkpoint_dirs', nargs='+', help="Checkpoint directories of the invocations")
+    merge_parser.add_argument('-o', '--output-dir', default='.', help="Directory of the standings file")
+    parser.add_argument('-v', '--verbose', action="store_const", dest="loglevel", const=logging.INFO, default=logging.WARNING)
+    args = parser.parse_args()
+    logging.basicConfig(level=args.loglevel)
+
+    if args.command == 'run':
+        tournament = Tournament.from_files(collect_input_files(args.entrants), n_shards=args.n_shards,
+                                            checkpoint_dir=Path(args.checkpoint_dir), engine=args.engine)
+        tournament.run(shards=args.shards, workers=args.workers)
+    else:
+        (games, missing) = load_results(Path(checkpoint_dir) for checkpoint_dir in args.checkpoint_dirs)
+        if missing:
+            logging.warning("{n} shards are not finished: {shards}".format(n=len(missing), shards=missing))
+        print(write_standings(compute_standings(games), Path(args.output_dir)))
@@ -0,0 +1,682 @@
+"""This file contains the bulk validator of the simulation inputs (the 7 lines of the input text file format).
+
+Every line is checked, and every error is reported (with its line and column) instead of stopping at the first one.
+Coordinate lines are parsed and range checked as whole arrays when NumPy is installed, and ship positions are checked
+for duplicates with a hashed index of the positions.
+"""
+
+from .binary_format import CoordinateArray
+from .fleet import Ship, index_fleet, parse_ship
+from .packed import PackedLocations, packed_typecode
+
+import logging
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bytes of a line parsed at a time by the bulk parser (keeps its intermediate arrays small)
+_SEGMENT_BYTES = 1 << 17
+# Valid location lists longer than this are returned as CoordinateArray views of the parsed array instead of
+# lists of tuples (which take ~100 bytes per location)
+TUPLE_LIST_LIMIT = 1 << 16
+
+class InputError(NamedTuple):
+    """Error in a simulation input"""
+    line: int
+    column: Optional[int]
+    message: str
+
+class InputValidationError(ValueError):
+    def __init__(self, errors:List[InputError]) -> None:
+        """Raised for invalid simulation inputs. The message has one line per error (the message of the first
+        error comes first, as the sanity checks of the Simulator used to raise it).
+
+        Args:
+            errors (List[InputError]): Every error found in the inputs, in the order of the lines
+        """
+        self.errors = errors
+        super().__init__('\n'.join(error.message for error in errors))
+
+def _digit_values(padded:bytes, ends:'np.ndarray', lengths:'np.ndarray') -> 'np.ndarray':
+    """Values of numbers of 1 to 8 digits, read 8 (or 4) bytes at a time and converted without a loop over their digits
+
+    Args:
+        padded (bytes): Line (ASCII) preceded by 8 zero bytes
+        ends (np.ndarray): Position (in padded) of the byte following each number
+        lengths (np.ndarray): Number of digits of each number
+
+    Returns:
+        np.ndarray: Value of each number
+    """
+    if not lengths.size or lengths.max() <= 4:
+        # Same as below with the 4 bytes ending with each number (boards of up to 10000 rows)
+        words = np.ndarray(shape=(len(padded) - 3,), dtype='<u4', buffer=padded, strides=(1,))[ends - 4]
+        keep = np.left_shift(np.uint32(0xFFFFFFFF), ((4 - lengths) * 8).astype(np.uint32))
+        words = (words & keep) - (np.uint32(0x30303030) & keep)
+        words = words * np.uint32(10) + (words >> np.uint32(8))
+        words = ((words & np.uint32(0x00FF00FF)) * np.uint32(1 + (100 << 16))) >> np.uint32(16)
+        return words.astype(np.int64)
+
+    # The 8 bytes ending with each number (little-endian, so the last digit is the high byte), with the bytes
+    # before the number cleared, and the digits converted in 3 multiplications
+    words = np.ndarray(shape=(len(padded) - 7,), dtype='<u8', buffer=padded, strides=(1,))[ends - 8]
+    keep = np.left_shift(np.uint64(0xFFFFFFFFFFFFFFFF), ((8 - lengths) * 8).astype(np.uint64))
+    words = (words & keep) - (np.uint64(0x3030303030303030) & keep)
+    words = words * np.uint64(10) + (words >> np.uint64(8))
+    words = (((words & np.uint64(0x000000FF000000FF)) * np.uint64(100 + (1000000 << 32)))
+                + (((words >> np.uint64(16)) & np.uint64(0x000000FF000000FF)) * np.uint64(1 + (10000 << 32)))) >> np.uint64(32)
+    return words.astype(np.int64)
+
+def _parse_numbers(padded:bytes, start:int, stop:int, list_sep:str, item_sep:str) -> Optional['np.ndarray']:
+    """Parses well-formed coordinates (x<item_sep>y<list_sep>x<item_sep>y...) of a byte range as a whole array.
+    Numbers of more than 8 digits are left to NumPy's text parser (which parses numbers too large for int64 as its
+    largest value).
+
+    Args:
+        padded (bytes): Line (ASCII) preceded by 8 zero bytes
+        start (int): Start of the byte range (at least 8)
+        stop (int): End of the byte range (exclusive)
+        list_sep (str): Separator of the list items
+        item_sep (str): Separator of the coordinate values of an item
+
+    Returns:
+        Optional[np.ndarray]: Flat array of the numbers (x0, y0, x1, y1, ...), or None if the range is not well-formed
+    """
+    data = np.frombuffer(padded, dtype=np.uint8, count=stop - start, offset=start)
+    # Separators (and any other character) alternate, starting with an item separator
+    sep_pos = np.flatnonzero((data - ord('0')) >= 10)
+    seps = data[sep_pos]
+    if seps.size % 2 == 0 or np.any(seps[0::2] != ord(item_sep)) or np.any(seps[1::2] != ord(list_sep)):
+        return None
+    # Every number has at least one digit
+    ends = np.empty(sep_pos.size + 1, dtype=np.intp)
+    ends[:-1] = sep_pos
+    ends[-1] = data.size
+    lengths = np.diff(ends, prepend=-1) - 1
+    if lengths.min() < 1:
+        return None
+    if lengths.max() > 8:
+        return np.fromstring(data.tobytes().decode().replace(item_sep, list_sep), dtype=np.int64, sep=list_sep)
+    return _digit_values(padded, ends + start, lengths)
+
+def _parse_bulk(line:str, list_sep:str, item_sep:str) -> Optional[Tuple['np.ndarray', Optional['np.ndarray'], List[int]]]:
+    """Parses a line of coordinates as whole arrays, a segment of the line at a time. In a segment with items which
+    are not made of two numbers (e.g. with signs, spaces or missing values), the well-formed items are still parsed
+    as an array, and only the other items are parsed one by one (with int(), like _parse_items).
+
+    Args:
+        line (str): Raw line
+        list_sep (str): Separator of the list items
+        item_sep (str): Separator of the coordinate values of an item
+
+    Returns:
+        Optional[Tuple[np.ndarray, Optional[np.ndarray], List[int]]]: (n, 2) array of the coordinates of the parsed
+            items, indices of the parsed items (None if every item is parsed) and columns (from 1) of the items in
+            invalid format, or None if the line is left to _parse_items (empty or not ASCII)
+    """
+    if not line or not line.isascii():
+        return None
+    raw = line.encode()
+    padded = bytes(8) + raw
+    list_byte = list_sep.encode()
+    (segments, invalid_items, invalid_columns) = ([], [], [])
+    (start, n_items) = (0, 0)
+    while True:
+        # Segments end at a list separator, so that they hold whole items
+        stop = raw.find(list_byte, min(start + _SEGMENT_BYTES, len(raw)))
+        stop = len(raw) if stop < 0 else stop
+        numbers = _parse_numbers(padded, start + 8, stop + 8, list_sep, item_sep) if stop > start else None
+        if numbers is not None:
+            segments.append(numbers.reshape(-1, 2))
+            n_items += len(segments[-1])
+        else:
+            (coords, is_parsed, item_starts) = _parse_segment_items(padded, start + 8, stop + 8, list_sep, item_sep)
+            segments.append(coords[is_parsed])
+            invalid = np.flatnonzero(~is_parsed)
+            invalid_items.append(invalid + n_items)
+            invalid_columns.extend((item_starts[invalid] + start + 1).tolist())
+            n_items += len(coords)
+        if stop >= len(raw):
+            break
+        start = stop + 1
+
+    coords = np.concatenate(segments)
+    if not invalid_columns:
+        return coords, None, []
+    return coords, np.delete(np.arange(n_items), np.concatenate(invalid_items)), invalid_columns
+
+def _parse_segment_items(padded:bytes, start:int, stop:int, list_sep:str, item_sep:str) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Parses a segment of a line which is not well-formed as a whole: its well-formed items as one array, and the
+    other items one by one
+
+    Args:
+        padded (bytes): Line (ASCII) preceded by 8 zero bytes
+        start (int): Start of the segment (at least 8)
+        stop (int): End of the segment (exclusive)
+        list_sep (str): Separator of the list items
+        item_sep (str): Separator of the coordinate values of an item
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (n, 2) array of the coordinates of every item of the segment
+            (zeros for the items in invalid format), whether each item is parsed, and the offset of each item in the
+            segment
+    """
+    data = np.frombuffer(padded, dtype=np.uint8, count=stop - start, offset=start)
+    non_digit = np.flatnonzero((data - ord('0')) >= 10)
+    chars = data[non_digit]
+    is_list_sep = chars == ord(list_sep)
+    list_sep_pos = non_digit[is_list_sep]
+    item_starts = np.concatenate(([0], list_sep_pos + 1))
+    item_ends = np.append(list_sep_pos, data.size)
+    # Well-formed items have exactly one non-digit character: the item separator, with 1 to 8 digits on both sides
+    other_pos = non_digit[~is_list_sep]
+    other_items = np.cumsum(is_list_sep)[~is_list_sep]
+    well_formed = np.bincount(other_items, minlength=len(item_starts)) == 1
+    well_formed[other_items[chars[~is_list_sep] != ord(item_sep)]] = False
+    item_sep_pos = np.zeros(len(item_starts), dtype=np.intp)
+    item_sep_pos[other_items] = other_pos
+    x_lengths = item_sep_pos - item_starts
+    y_lengths = item_ends - item_sep_pos - 1
+    well_formed &= (x_lengths >= 1) & (x_lengths <= 8) & (y_lengths >= 1) & (y_lengths <= 8)
+
+    coords = np.zeros((len(item_starts), 2), dtype=np.int64)
+    is_parsed = well_formed.copy()
+    parsed = np.flatnonzero(well_formed)
+    coords[parsed, 0] = _digit_values(padded, item_sep_pos[parsed] + start, x_lengths[parsed])
+    coords[parsed, 1] = _digit_values(padded, item_ends[parsed] + start, y_lengths[parsed])
+    int64_max = np.iinfo(np.int64).max
+    for index in np.flatnonzero(~well_formed).tolist():
+        item = padded[start + item_starts[index]:start + item_ends[index]].decode()
+        try:
+            loc = tuple(map(int, item.split(item_sep)))
+        except ValueError:
+            loc = ()
+        if len(loc) == 2:
+            coords[index] = [min(max(value, -int64_max - 1), int64_max) for value in loc]
+            is_parsed[index] = True
+    return coords, is_parsed, item_starts
+
+def _item_columns(line:str, list_sep:str) -> 'np.ndarray':
+    """Columns of the items of a line parsed in bulk (only computed to report errors)
+
+    Args:
+        line (str): Raw line
+        list_sep (str): Separator of the list items
+
+    Returns:
+        np.ndarray: Column (from 1) of the first character of each item
+    """
+    data = np.frombuffer(line.encode(), dtype=np.uint8)
+    return np.concatenate(([1], np.flatnonzero(data == ord(list_sep)) + 2))
+
+def _parsed_columns(line:str, list_sep:str, item_index:Optional['np.ndarray']) -> 'np.ndarray':
+    """Columns of the parsed items of a line parsed in bulk (only computed to report errors)
+
+    Args:
+        line (str): Raw line
+        list_sep (str): Separator of the list items
+        item_index (Optional[np.ndarray]): Indices of the parsed items (None if every item is parsed)
+
+    Returns:
+        np.ndarray: Column (from 1) of the first character of each parsed item
+    """
+    columns = _item_columns(line, list_sep)
+    return columns if item_index is None else columns[item_index]
+
+def _parse_items(line:str, list_sep:str, item_sep:str, n_values:int=2) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+    """Parses a line of coordinates item by item (with int(), as the sanity checks of the Simulator did)
+
+    Args:
+        line (str): Raw line
+        list_sep (str): Separator of the list items
+        item_sep (str): Separator of the coordinate values of an item
+        n_values (int): Number of values of an item
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[int], List[int]]: Coordinates and columns of the valid items, and
+            columns of the items in invalid format
+    """
+    coords, columns, invalid_columns = [], [], []
+    column = 1
+    for item in line.split(list_sep):
+        try:
+            loc = tuple(map(int, item.split(item_sep)))
+        except ValueError:
+            loc = ()
+        if len(loc) == n_values:
+            coords.append(loc)
+            columns.append(column)
+        else:
+            invalid_columns.append(column)
+        column += len(item) + 1
+    return coords, columns, invalid_columns
+
+def duplicate_locations(locations:Iterable[Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
+    """Finds the locations which appear more than once, with a hashed index of the first appearance of each location
+
+    Args:
+        locations (Iterable[Tuple[int, int]]): Locations (e.g. ship positions)
+
+    Yields:
+        Tuple[int, int]: Index of every repeated location, and index of its first appearance
+    """
+    first_indices = {}
+    for (index, loc) in enumerate(locations):
+        first_index = first_indices.setdefault(loc, index)
+        if first_index != index:
+            yield (index, first_index)
+
+class _Line(NamedTuple):
+    """Location of an input in the input text file"""
+    index: int
+    name: str
+
+    @property
+    def number(self) -> int:
+        """Line number (from 1), as in the error messages"""
+        return self.index + 1
+
+M_LINE = _Line(0, 'Battleground size input (M)')
+S_LINE = _Line(1, 'Number of ships (S)')
+P1_SHIPS_LINE = _Line(2, 'Player 1 ship positions')
+P2_SHIPS_LINE = _Line(3, 'Player 2 ship positions')
+T_LINE = _Line(4, 'Number of missiles (T)')
+P1_MOVES_LINE = _Line(5, 'Player 1 moves')
+P2_MOVES_LINE = _Line(6, 'Player 2 moves')
+SALVO_LINE = _Line(5, 'Salvo size (K)')
+P1_VOLLEYS_LINE = _Line(6, 'Player 1 volleys')
+P2_VOLLEYS_LINE = _Line(7, 'Player 2 volleys')
+
+# Salvo size of the salvo rules where each player fires as many shots as they have ships left
+SALVO_SHIPS = 'ships'
+
+class InputValidator():
+    def __init__(self, max_board_size:Optional[int]=None, max_missiles:Optional[int]=None, fleets:bool=False,
+                    packed:bool=False) -> None:
+        """Validator of the simulation inputs of a game engine
+
+        Args:
+            max_board_size (Optional[int]): Exclusive upper bound on the board size M (None for no bound)
+            max_missiles (Optional[int]): Exclusive upper bound on the number of missiles T (None for no bound)
+            fleets (bool): If True, ship lines hold multi-location ships ('x:y' or 'x:y:length:H|V' items)
+            packed (bool): If True, valid move lists are returned as PackedLocations (x * M + y integers)
+        """
+        self.__max_board_size = max_board_size
+        self.__max_missiles = max_missiles
+        self.__fleets = fleets
+        self.__packed = packed
+
+    def __check_number(self, lines:Sequence[str], line:_Line, lower:int, upper:Optional[int],
+                        errors:List[InputError]) -> Optional[int]:
+        """Parses and range checks a numeric input
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs
+            line (_Line): Line of the input
+            lower (int): Exclusive lower bound
+            upper (Optional[int]): Exclusive upper bound (None for no bound)
+            errors (List[InputError]): Errors found so far (appended to)
+
+        Returns:
+            Optional[int]: Value of the input, or None if it is invalid
+        """
+        try:
+            value = int(lines[line.index])
+        except ValueError:
+            errors.append(InputError(line.number, 1, "{name} is in invalid format. (Battleship input file: Line {line_n})"
+                                        .format(name=line.name, line_n=line.number)))
+            return None
+        if value <= lower:
+            errors.append(InputError(line.number, 1, '{name} must be greater than {bound}. (Battleship input file: Line {line_n})'
+                                        .format(name=line.name, bound=lower, line_n=line.number)))
+            return None
+        if upper is not None and value >= upper:
+            errors.append(InputError(line.number, 1, '{name} must be less than {bound}. (Battleship input file: Line {line_n})'
+                                        .format(name=line.name, bound=upper, line_n=line.number)))
+            return None
+        return value
+
+    def __check_locations(self, lines:Sequence[str], line:_Line, list_sep:str, item_sep:str, n_items:Optional[int],
+                            board_size:Optional[int], errors:List[InputError],
+                            unique:bool=False, packed:bool=False) -> Optional[Sequence[Tuple[int, int]]]:
+        """Parses a list of locations, and checks their format, number and range (and uniqueness)
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs
+            line (_Line): Line of the input
+            list_sep (str): Separator of the list items
+            item_sep (str): Separator of the coordinate values of an item
+            n_items (Optional[int]): Expected number of items (None if unknown, i.e. not checked)
+            board_size (Optional[int]): Board size M (None if unknown, i.e. the range is not checked)
+            errors (List[InputError]): Errors found so far (appended to)
+            unique (bool): If True, locations which appear more than once are errors
+            packed (bool): If True, valid locations are returned as PackedLocations (if the board size is known)
+
+        Returns:
+            Optional[Sequence[Tuple[int, int]]]: Locations as integer tuples (or a sequence of them), or None if the 
+                input is invalid
+        """
+        raw = lines[line.index]
+        n_errors = len(errors)
+        parsed = _parse_bulk(raw, list_sep, item_sep) if np is not None else None
+        bulk = parsed is not None
+        if bulk:
+            (coords, item_index, invalid_columns) = parsed
+            columns = None
+        else:
+            (coords, columns, invalid_columns) = _parse_items(raw, list_sep, item_sep)
+        n_parsed = len(coords) + len(invalid_columns)
+        for column in invalid_columns:
+            errors.append(InputError(line.number, column, "One or more inputs in {name} is in invalid format. (Battleship input file: Line {line})"
+                                        .format(name=line.name, line=line.number)))
+
+        if n_items is not None and n_parsed != n_items:
+            errors.append(InputError(line.number, None, "Number of inputs in {name} must match {list_len}. (Battleship input file: Line {line})"
+                                        .format(name=line.name, line=line.number, list_len=n_items)))
+
+        if board_size is not None:
+            if bulk:
+                out_of_range = []
+                if len(coords) and (coords.min() < 0 or coords.max() >= board_size):
+                    out_of_range = _parsed_columns(raw, list_sep, item_index)[np.any((coords < 0) | (coords >= board_size), axis=1)].tolist()
+            else:
+                out_of_range = [column for ((x, y), column) in zip(coords, columns)
+                                if x < 0 or x >= board_size or y < 0 or y >= board_size]
+            for column in out_of_range:
+                errors.append(InputError(line.number, column, "One or more input item in {name} is not in the range [{lower}, {upper}]. (Battleship input file: Line {line})"
+                                            .format(name=line.name, line=line.number, lower=0, upper=board_size-1)))
+
+        if packed and len(errors) == n_errors and board_size is not None:
+            # Each location is packed into a single integer, without building tuples for the parsed array
+            typecode = packed_typecode(board_size)
+            if bulk:
+                cells = array(typecode)
+                cells.frombytes((coords[:, 0] * board_size + coords[:, 1]).astype(cells.typecode).tobytes())
+            else:
+                cells = array(typecode, [loc_x * board_size + loc_y for (loc_x, loc_y) in coords])
+            return PackedLocations(cells, board_size)
+        if bulk:
+            if not unique and len(errors) != n_errors:
+                return None
+            if not unique and n_parsed > TUPLE_LIST_LIMIT \
+                    and board_size is not None and board_size <= 1 << 32:
+                # Large valid move lists are kept as one uint32 buffer
+                return CoordinateArray(memoryview(coords.astype(np.uint32).reshape(-1)).cast('B').cast('I'))
+            coords = list(zip(coords[:, 0].tolist(), coords[:, 1].tolist()))
+            if unique:
+                columns = _parsed_columns(raw, list_sep, item_index).tolist()
+        if unique:
+            for (index, first_index) in duplicate_locations(coords):
+                (loc_x, loc_y) = coords[index]
+                errors.append(InputError(line.number, columns[index], "Position {x}:{y} in {name} is duplicated (first at column {first}). (Battleship input file: Line {line})"
+                                            .format(x=loc_x, y=loc_y, name=line.name, first=columns[first_index], line=line.number)))
+
+        return coords if len(errors) == n_errors else None
+
+    def validate_lines(self, lines:Sequence[str], moves:bool=True) -> Tuple[Dict, List[InputError]]:
+        """Validates the lines of a game, collecting every error
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs (without line endings)
+            moves (bool): If False, the move lines (6 and 7) are not validated (e.g. when they are streamed)
+
+        Returns:
+            Tuple[Dict, List[InputError]]: Sanitized inputs ('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS',
+                'P1_MOVES', 'P2_MOVES'; None for the invalid ones), and the errors in the order of the lines
+        """
+        errors = []
+        n_lines = P2_MOVES_LINE.number if moves else T_LINE.number
+        if len(lines) < n_lines:
+            for line in (M_LINE, S_LINE, P1_SHIPS_LINE, P2_SHIPS_LINE, T_LINE, P1_MOVES_LINE, P2_MOVES_LINE)[len(lines):n_lines]:
+                errors.append(InputError(line.number, None, "{name} is missing. (Battleship input file: Line {line_n})"
+                                            .format(name=line.name, line_n=line.number)))
+            return dict.fromkeys(('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES')), errors
+
+        inputs = {}
+        inputs['M'] = M = self.__check_number(lines, M_LINE, 0, self.__max_board_size, errors)
+        inputs['S'] = S = self.__check_number(lines, S_LINE, 0, int(M**2/2) if M is not None else None, errors)
+        if self.__fleets:
+            inputs['P1_POS_SHIPS'] = self.__check_fleet(lines, P1_SHIPS_LINE, S, M, errors)
+            inputs['P2_POS_SHIPS'] = self.__check_fleet(lines, P2_SHIPS_LINE, S, M, errors)
+        else:
+            inputs['P1_POS_SHIPS'] = self.__check_locations(lines, P1_SHIPS_LINE, ',', ':', S, M, errors, unique=True)
+            inputs['P2_POS_SHIPS'] = self.__check_locations(lines, P2_SHIPS_LINE, ',', ':', S, M, errors, unique=True)
+        inputs['T'] = T = self.__check_number(lines, T_LINE, 0, self.__max_missiles, errors)
+        inputs['P1_MOVES'] = self.__check_locations(lines, P1_MOVES_LINE, ':', ',', T, M, errors, packed=self.__packed) if moves else None
+        inputs['P2_MOVES'] = self.__check_locations(lines, P2_MOVES_LINE, ':', ',', T, M, errors, packed=self.__packed) if moves else None
+        if errors:
+            logging.debug("{n} errors in the inputs: {errors}".format(n=len(errors), errors=errors[:10]))
+        return inputs, errors
+
+    def __check_fleet(self, lines:Sequence[str], line:_Line, n_items:Optional[int], board_size:Optional[int],
+                        errors:List[InputError]) -> Optional[List[Ship]]:
+        """Parses a fleet of ships, and checks their format and number, and that they fit on the board without overlapping
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs
+            line (_Line): Line of the input
+            n_items (Optional[int]): Expected number of ships (None if unknown, i.e. not checked)
+            board_size (Optional[int]): Board size M (None if unknown, i.e. the bounds are not checked)
+            errors (List[InputError]): Errors found so far (appended to)
+
+        Returns:
+            Optional[List[Ship]]: Ships, or None if the input is invalid
+        """
+        n_errors = len(errors)
+        (ships, columns) = ([], [])
+        column = 1
+        for item in lines[line.index].split(','):
+            try:
+                ships.append(parse_ship(item))
+                columns.append(column)
+            except ValueError:
+                errors.append(InputError(line.number, column, "One or more inputs in {name} is in invalid format. (Battleship input file: Line {line})"
+                                            .format(name=line.name, line=line.number)))
+            column += len(item) + 1
+        if n_items is not None and len(errors) == n_errors and len(ships) != n_items:
+            errors.append(InputError(line.number, None, "Number of inputs in {name} must match {list_len}. (Battleship input file: Line {line})"
+                                        .format(name=line.name, line=line.number, list_len=n_items)))
+
+        (_, conflicts) = index_fleet(ships, board_size)
+        for (ship, other) in conflicts:
+            if other is None:
+                errors.append(InputError(line.number, columns[ship], "Ship at column {column} in {name} does not fit in the range [{lower}, {upper}]. (Battleship input file: Line {line})"
+                                            .format(column=columns[ship], name=line.name, lower=0, upper=board_size-1, line=line.number)))
+            else:
+                errors.append(InputError(line.number, columns[ship], "Ship at column {column} in {name} overlaps the ship at column {other}. (Battleship input file: Line {line})"
+                                            .format(column=columns[ship], name=line.name, other=columns[other], line=line.number)))
+        return ships if len(errors) == n_errors else None
+
+    def __check_shots(self, lines:Sequence[str], line:_Line, n_items:Optional[int], board_size:Optional[int],
+                        n_players:Optional[int], player_id:int, errors:List[InputError]) -> Optional[List[Tuple[int, Tuple[int, int]]]]:
+        """Parses a list of free-for-all moves (targeted player, x and y), and checks their format, number, targets and range
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs
+            line (_Line): Line of the input
+            n_items (Optional[int]): Expected number of moves (None if unknown, i.e. not checked)
+            board_size (Optional[int]): Board size M (None if unknown, i.e. the range is not checked)
+            n_players (Optional[int]): Number of players N (None if unknown, i.e. the targets are not checked)
+            player_id (int): ID of the player making the moves (who cannot target themselves)
+            errors (List[InputError]): Errors found so far (appended to)
+
+        Returns:
+            Optional[List[Tuple[int, Tuple[int, int]]]]: Targeted players and locations, or None if the input is invalid
+        """
+        n_errors = len(errors)
+        (items, columns, invalid_columns) = _parse_items(lines[line.index], ':', ',', n_values=3)
+        for column in invalid_columns:
+            errors.append(InputError(line.number, column, "One or more inputs in {name} is in invalid format. (Battleship input file: Line {line})"
+                                        .format(name=line.name, line=line.number)))
+        if n_items is not None and len(items) + len(invalid_columns) != n_items:
+            errors.append(InputError(line.number, None, "Number of inputs in {name} must match {list_len}. (Battleship input file: Line {line})"
+                                        .format(name=line.name, line=line.number, list_len=n_items)))
+        for ((target_id, x, y), column) in zip(items, columns):
+            if n_players is not None and (target_id < 1 or target_id > n_players or target_id == player_id):
+                errors.append(InputError(line.number, column, "One or more targets in {name} is not another player in the range [1, {upper}]. (Battleship input file: Line {line})"
+                                            .format(name=line.name, line=line.number, upper=n_players)))
+            elif board_size is not None and (x < 0 or x >= board_size or y < 0 or y >= board_size):
+                errors.append(InputError(line.number, column, "One or more input item in {name} is not in the range [{lower}, {upper}]. (Battleship input file: Line {line})"
+                                            .format(name=line.name, line=line.number, lower=0, upper=board_size-1)))
+        return [(target_id, (x, y)) for (target_id, x, y) in items] if len(errors) == n_errors else None
+
+    def validate_free_for_all_lines(self, lines:Sequence[str], max_players:Optional[int]=None) -> Tuple[Dict, List[InputError]]:
+        """Validates the lines of a free-for-all game (see ffa.py for the format), collecting every error
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs (without line endings)
+            max_players (Optional[int]): Exclusive upper bound on the number of players N (None for no bound)
+
+        Returns:
+            Tuple[Dict, List[InputError]]: Sanitized inputs ('M', 'N', 'S', 'T', and the 'POS_SHIPS' and 'MOVES' lists
+                with one item per player; None for the invalid ones), and the errors in the order of the lines
+        """
+        errors = []
+        header = (M_LINE, _Line(1, 'Number of players (N)'), _Line(2, 'Number of ships (S)'), _Line(3, 'Number of missiles (T)'))
+        inputs = dict.fromkeys(('M', 'N', 'S', 'T', 'POS_SHIPS', 'MOVES'))
+        if len(lines) < len(header):
+            for line in header[len(lines):]:
+                errors.append(InputError(line.number, None, "{name} is missing. (Battleship input file: Line {line_n})"
+                                            .format(name=line.name, line_n=line.number)))
+            return inputs, errors
+
+        inputs['M'] = M = self.__check_number(lines, header[0], 0, self.__max_board_size, errors)
+        inputs['N'] = N = self.__check_number(lines, header[1], 1, max_players, errors)
+        inputs['S'] = S = self.__check_number(lines, header[2], 0, int(M**2/2) if M is not None else None, errors)
+        inputs['T'] = T = self.__check_number(lines, header[3], 0, self.__max_missiles, errors)
+        if N is None:
+            return inputs, errors
+        if len(lines) < len(header) + 2 * N:
+            errors.append(InputError(len(lines) + 1, None, "Ship positions and moves of {N} players need {n} lines. (Battleship input file: Line {line_n})"
+                                        .format(N=N, n=len(header) + 2 * N, line_n=len(lines) + 1)))
+            return inputs, errors
+
+        ship_lines = [_Line(len(header) + i, 'Player {k} ship positions'.format(k=i + 1)) for i in range(N)]
+        move_lines = [_Line(len(header) + N + i, 'Player {k} moves'.format(k=i + 1)) for i in range(N)]
+        ships = [self.__check_locations(lines, line, ',', ':', S, M, errors, unique=True) for line in ship_lines]
+        moves = [self.__check_shots(lines, line, T, M, N, i + 1, errors) for (i, line) in enumerate(move_lines)]
+        inputs['POS_SHIPS'] = ships if None not in ships else None
+        inputs['MOVES'] = moves if None not in moves else None
+        if errors:
+            logging.debug("{n} errors in the inputs: {errors}".format(n=len(errors), errors=errors[:10]))
+        return inputs, errors
+
+    def __check_volleys(self, lines:Sequence[str], line:_Line, n_volleys:Optional[int], max_shots:Optional[int],
+                        board_size:Optional[int], errors:List[InputError]) -> Optional[List[Sequence[Tuple[int, int]]]]:
+        """Parses a list of volleys, and checks their number and size, and the format and range of their shots
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs
+            line (_Line): Line of the input
+            n_volleys (Optional[int]): Expected number of volleys (None if unknown, i.e. not checked)
+            max_shots (Optional[int]): Largest number of shots of a volley (None if unknown, i.e. not checked)
+            board_size (Optional[int]): Board size M (None if unknown, i.e. the range is not checked)
+            errors (List[InputError]): Errors found so far (appended to)
+
+        Returns:
+            Optional[List[Sequence[Tuple[int, int]]]]: Shots of each volley, or None if the input is invalid
+        """
+        n_errors = len(errors)
+        raw = lines[line.index]
+        # Volleys can be empty (a player holding fire for a turn, e.g. with a salvo size of 0 ships)
+        volleys = raw.split(';')
+        if n_volleys is not None and len(volleys) != n_volleys:
+            errors.append(InputError(line.number, None, "Number of volleys in {name} must match {n}. (Battleship input file: Line {line_n})"
+                                        .format(name=line.name, n=n_volleys, line_n=line.number)))
+        sizes = [volley.count(':') + 1 if volley else 0 for volley in volleys]
+        if max_shots is not None:
+            column = 1
+            for (volley, size) in zip(volleys, sizes):
+                if size > max_shots:
+                    errors.append(InputError(line.number, column, "Volley at column {column} in {name} has more than {k} shots. (Battleship input file: Line {line_n})"
+                                                .format(column=column, name=line.name, k=max_shots, line_n=line.number)))
+                column += len(volley) + 1
+
+        # The shots of all the non-empty volleys are parsed as one list, and split into the volleys. The columns of
+        # the shot errors are moved past the empty volleys left out of the list.
+        shot_lines = list(lines)
+        shot_lines[line.index] = ':'.join(volley for volley in volleys if volley)
+        n_shot_errors = len(errors)
+        shots = self.__check_locations(shot_lines, line, ':', ',', None, board_size, errors,
+                                        packed=self.__packed) if shot_lines[line.index] else []
+        if '' in volleys:
+            (shifts, column, n_empty) = ([], 1, 0)
+            for volley in volleys:
+                if volley:
+                    shifts.append((column - n_empty, n_empty))
+                else:
+                    n_empty += 1
+                column += len(volley) + 1
+            for index in range(n_shot_errors, len(errors)):
+                if errors[index].column is not None:
+                    n_empty = max(shift for (start, shift) in shifts if start <= errors[index].column)
+                    errors[index] = errors[index]._replace(column=errors[index].column + n_empty)
+        if len(errors) != n_errors:
+            return None
+        bounds = [0]
+        for size in sizes:
+            bounds.append(bounds[-1] + size)
+        return [shots[start:stop] for (start, stop) in zip(bounds, bounds[1:])]
+
+    def validate_salvo_lines(self, lines:Sequence[str]) -> Tuple[Dict, List[InputError]]:
+        """Validates the lines of a salvo game (see salvo.py for the format), collecting every error
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs (without line endings)
+
+        Returns:
+            Tuple[Dict, List[InputError]]: Sanitized inputs ('M', 'S', 'T', 'K' (the salvo size, or SALVO_SHIPS),
+                'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_VOLLEYS', 'P2_VOLLEYS'; None for the invalid ones), and the errors
+                in the order of the lines
+        """
+        errors = []
+        header = (M_LINE, S_LINE, P1_SHIPS_LINE, P2_SHIPS_LINE, T_LINE, SALVO_LINE, P1_VOLLEYS_LINE, P2_VOLLEYS_LINE)
+        inputs = dict.fromkeys(('M', 'S', 'T', 'K', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_VOLLEYS', 'P2_VOLLEYS'))
+        if len(lines) < len(header):
+            for line in header[len(lines):]:
+                errors.append(InputError(line.number, None, "{name} is missing. (Battleship input file: Line {line_n})"
+                                            .format(name=line.name, line_n=line.number)))
+            return inputs, errors
+
+        inputs['M'] = M = self.__check_number(lines, M_LINE, 0, self.__max_board_size, errors)
+        inputs['S'] = S = self.__check_number(lines, S_LINE, 0, int(M**2/2) if M is not None else None, errors)
+        if self.__fleets:
+            inputs['P1_POS_SHIPS'] = self.__check_fleet(lines, P1_SHIPS_LINE, S, M, errors)
+            inputs['P2_POS_SHIPS'] = self.__check_fleet(lines, P2_SHIPS_LINE, S, M, errors)
+        else:
+            inputs['P1_POS_SHIPS'] = self.__check_locations(lines, P1_SHIPS_LINE, ',', ':', S, M, errors, unique=True)
+            inputs['P2_POS_SHIPS'] = self.__check_locations(lines, P2_SHIPS_LINE, ',', ':', S, M, errors, unique=True)
+        inputs['T'] = T = self.__check_number(lines, T_LINE, 0, self.__max_missiles, errors)
+        if lines[SALVO_LINE.index].strip() == SALVO_SHIPS:
+            # A player never fires more shots than their number of ships
+            inputs['K'] = SALVO_SHIPS
+            max_shots = S
+        else:
+            inputs['K'] = max_shots = self.__check_number(lines, SALVO_LINE, 0, None, errors)
+        inputs['P1_VOLLEYS'] = self.__check_volleys(lines, P1_VOLLEYS_LINE, T, max_shots, M, errors)
+        inputs['P2_VOLLEYS'] = self.__check_volleys(lines, P2_VOLLEYS_LINE, T, max_shots, M, errors)
+        if errors:
+            logging.debug("{n} errors in the inputs: {errors}".format(n=len(errors), errors=errors[:10]))
+        return inputs, errors
+
+    def validate(self, lines:Sequence[str], moves:bool=True) -> Dict:
+        """Validates the lines of a game
+
+        Args:
+            lines (Sequence[str]): Raw lines of the inputs (without line endings)
+            moves (bool): If False, the move lines (6 and 7) are not validated (e.g. when they are streamed)
+
+        Raises:
+            InputValidationError: With every error, if the inputs are invalid
+
+        Returns:
+            Dict: Sanitized inputs ('M', 'S', 'T', 'P1_POS_SHIPS', 'P2_POS_SHIPS', 'P1_MOVES', 'P2_MOVES')
+        """
+        inputs, errors = self.validate_lines(lines, moves=moves)
+        if errors:
+            raise InputValidationError(errors)
+        return inputs
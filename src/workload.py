@@ -0,0 +1,99 @@
+"""This file contains the generator of seeded synthetic Battleship games (for benchmarks and large simulation runs).
+"""
+
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+def random_locations(rng:random.Random, board_size:int, n_locations:int, distinct:bool=False) -> List[Tuple[int, int]]:
+    """Draws random locations on a (board_size x board_size) board
+
+    Args:
+        rng (random.Random): Random number generator
+        board_size (int): Board size M
+        n_locations (int): Number of locations to draw
+        distinct (bool): If True, no location is drawn twice
+
+    Returns:
+        List[Tuple[int, int]]: Locations as integer tuples
+    """
+    if distinct:
+        cells = rng.sample(range(board_size * board_size), n_locations)
+    else:
+        cells = [rng.randrange(board_size * board_size) for _ in range(n_locations)]
+    return [divmod(cell, board_size) for cell in cells]
+
+def generate_game(rng:random.Random, board_size:int, n_ships:int, n_missiles:int) -> List[str]:
+    """Generates a random game in the input text file format (distinct ship locations, random moves)
+
+    Args:
+        rng (random.Random): Random number generator
+        board_size (int): Board size M
+        n_ships (int): Number of ships S of each player
+        n_missiles (int): Number of missiles T of each player
+
+    Returns:
+        List[str]: The 7 lines of the game
+    """
+    lines = [str(board_size), str(n_ships)]
+    for _ in range(2):
+        lines.append(','.join('{x}:{y}'.format(x=x, y=y) for (x, y) in random_locations(rng, board_size, n_ships, distinct=True)))
+    lines.append(str(n_missiles))
+    for _ in range(2):
+        lines.append(':'.join('{x},{y}'.format(x=x, y=y) for (x, y) in random_locations(rng, board_size, n_missiles)))
+    return lines
+
+def generate_free_for_all_game(rng:random.Random, board_size:int, n_players:int, n_ships:int, n_missiles:int) -> List[str]:
+    """Generates a random free-for-all game in its input text file format (distinct ship locations, random targets and moves)
+
+    Args:
+        rng (random.Random): Random number generator
+        board_size (int): Board size M
+        n_players (int): Number of players N
+        n_ships (int): Number of ships S of each player
+        n_missiles (int): Number of missiles T of each player
+
+    Returns:
+        List[str]: The 4 + 2N lines of the game
+    """
+    lines = [str(board_size), str(n_players), str(n_ships), str(n_missiles)]
+    for _ in range(n_players):
+        lines.append(','.join('{x}:{y}'.format(x=x, y=y) for (x, y) in random_locations(rng, board_size, n_ships, distinct=True)))
+    for player_id in range(1, n_players + 1):
+        # Targets are drawn among the other players
+        targets = [rng.randrange(1, n_players) for _ in range(n_missiles)]
+        lines.append(':'.join('{t},{x},{y}'.format(t=t + (t >= player_id), x=x, y=y)
+                                for (t, (x, y)) in zip(targets, random_locations(rng, board_size, n_missiles))))
+    return lines
+
+def generate_salvo_game(rng:random.Random, board_size:int, n_ships:int, n_turns:int, salvo_size:int) -> List[str]:
+    """Generates a random salvo game in its input text file format (distinct ship locations, full random volleys)
+
+    Args:
+        rng (random.Random): Random number generator
+        board_size (int): Board size M
+        n_ships (int): Number of ships S of each player
+        n_turns (int): Number of turns T
+        salvo_size (int): Number of shots K of each volley
+
+    Returns:
+        List[str]: The 8 lines of the game
+    """
+    lines = [str(board_size), str(n_ships)]
+    for _ in range(2):
+        lines.append(','.join('{x}:{y}'.format(x=x, y=y) for (x, y) in random_locations(rng, board_size, n_ships, distinct=True)))
+    lines.extend((str(n_turns), str(salvo_size)))
+    for _ in range(2):
+        lines.append(';'.join(':'.join('{x},{y}'.format(x=x, y=y) for (x, y) in random_locations(rng, board_size, salvo_size))
+                                for _ in range(n_turns)))
+    return lines
+
+def write_game(lines:List[str], file_path:Path) -> None:
+    """Writes the lines of a game as an input text file
+
+    Args:
+        lines (List[str]): Lines of the game
+        file_path (Path): Path of the input file to write
+    """
+    with open(file_path, 'w') as f:
+        f.write('\n'.join(lines))
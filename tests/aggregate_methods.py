@@ -0,0 +1,104 @@
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.engines import ENGINES
+from ..src.numpy_game import np
+from ..src.aggregate import HeatmapAggregator, COUNTERS
+from ..src.workload import generate_game, write_game
+from ..src import batch
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class AggregateMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.out_dir = tempfile.TemporaryDirectory()
+        rng = random.Random(5)
+        self.games = [generate_game(rng, board_size=6, n_ships=6, n_missiles=20) for _ in range(12)]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.out_dir.cleanup()
+        return super().tearDown()
+
+    def aggregate(self, games, engine='default'):
+        aggregator = HeatmapAggregator()
+        s = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+        for (index, lines) in enumerate(games):
+            s.read_input_lines(lines, name='game-{i}'.format(i=index))
+            s.simulate()
+            aggregator.add_simulator(s)
+        return aggregator
+
+    def assertSameAggregate(self, first, second):
+        self.assertEqual(first.n_games, second.n_games)
+        for counter in COUNTERS:
+            self.assertTrue(np.array_equal(first.get_counts(counter), second.get_counts(counter)), counter)
+        # Score columns are grown differently, so they are compared up to the highest score
+        (first_scores, second_scores) = (first.get_score_counts(), second.get_score_counts())
+        n_scores = max(first_scores.shape[1], second_scores.shape[1])
+        self.assertTrue(np.array_equal(np.pad(first_scores, ((0, 0), (0, n_scores - first_scores.shape[1]))),
+                                        np.pad(second_scores, ((0, 0), (0, n_scores - second_scores.shape[1])))))
+        self.assertEqual(first.get_results(), second.get_results())
+
+    def test_same_counts_across_engines(self):
+        aggregator = self.aggregate(self.games)
+        # Counts of the rendered boards of the default engine
+        s = Simulator(p1=Player(), p2=Player(), g=ENGINES['default']())
+        expected = {counter: np.zeros((2, 6, 6), dtype=np.int64) for counter in COUNTERS}
+        results = {}
+        for lines in self.games:
+            s.read_input_lines(lines, name='game')
+            s.simulate()
+            for player_id in (1, 2):
+                for (loc_x, row) in enumerate(s.get_game().get_player_board(player_id=player_id)):
+                    for (loc_y, cell) in enumerate(row):
+                        for (counter, cells) in (('ships', 'BX'), ('hits', 'X'), ('misses', 'O'), ('survived', 'B')):
+                            expected[counter][player_id - 1, loc_x, loc_y] += cell in cells
+            result = s.get_scores()[2]
+            results[result] = results.get(result, 0) + 1
+        for counter in COUNTERS:
+            self.assertTrue(np.array_equal(aggregator.get_counts(counter), expected[counter]), counter)
+        self.assertEqual({result: n for (result, n) in aggregator.get_results().items() if n}, results)
+        self.assertEqual(aggregator.get_score_counts().sum(axis=1).tolist(), [12, 12])
+
+        for engine in ENGINES:
+            self.assertSameAggregate(self.aggregate(self.games, engine=engine), aggregator)
+
+    def test_merge_and_export(self):
+        aggregator = self.aggregate(self.games)
+        merged = HeatmapAggregator()
+        for start in range(0, 12, 5):
+            merged.merge(self.aggregate(self.games[start:start + 5]))
+        self.assertSameAggregate(merged, aggregator)
+        with self.assertRaises(ValueError):
+            merged.merge(HeatmapAggregator(board_size=7))
+
+        archive_path = Path(self.out_dir.name) / 'heatmaps.npz'
+        self.assertEqual(aggregator.save(archive_path), [archive_path])
+        self.assertSameAggregate(HeatmapAggregator.load(archive_path), aggregator)
+
+        (cells_path, scores_path) = aggregator.save(Path(self.out_dir.name) / 'heatmaps.csv')
+        with open(cells_path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], 'player,x,y,ships,hits,misses,survived')
+        self.assertEqual(len(lines), 1 + 2 * 6 * 6)
+        (player, loc_x, loc_y, *counts) = map(int, lines[1 + 36 + 6 * 2 + 3].split(','))
+        self.assertEqual((player, loc_x, loc_y), (2, 2, 3))
+        self.assertEqual(counts, [int(aggregator.get_counts(counter)[1, 2, 3]) for counter in COUNTERS])
+        with open(scores_path) as f:
+            self.assertEqual(f.readline().strip(), 'score,P1,P2')
+
+    def test_batch_aggregate(self):
+        input_paths = []
+        for (index, lines) in enumerate(self.games):
+            input_paths.append(Path(self.out_dir.name) / 'game-{i}.txt'.format(i=index))
+            write_game(lines, input_paths[-1])
+        expected = self.aggregate(self.games)
+        for workers in (1, 2):
+            aggregator = HeatmapAggregator()
+            rows = batch.run_batch(input_paths, Path(self.out_dir.name), workers=workers, chunksize=5, aggregator=aggregator)
+            self.assertFalse(any(row['error'] for row in rows))
+            self.assertSameAggregate(aggregator, expected)
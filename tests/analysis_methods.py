@@ -0,0 +1,59 @@
+from ..src.analysis import GameAnalysis
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.game import Game
+from ..src.workload import generate_game
+
+import random
+import unittest
+from pathlib import Path
+
+class AnalysisMethodsUnitTests(unittest.TestCase):
+    def simulate(self, lines):
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        s.read_input_lines(lines, name='analysis')
+        s.simulate()
+        return s.get_scores()
+
+    def stopped(self, lines, stop_turn):
+        # Same game with only the first stop_turn moves of each player
+        return lines[:4] + [str(stop_turn)] + [':'.join(line.split(':')[:stop_turn]) for line in lines[5:7]]
+
+    def test_prefix_results(self):
+        rng = random.Random(12)
+        for _ in range(10):
+            lines = generate_game(rng, board_size=5, n_ships=6, n_missiles=30)
+            s = Simulator(p1=Player(), p2=Player(), g=Game())
+            s.read_input_lines(lines, name='analysis')
+            analysis = GameAnalysis(s.get_sim_inputs())
+            self.assertEqual(analysis.result_at(0), (0, 0, "It is a draw"))
+            for turn in (1, 7, 18, 30):
+                self.assertEqual(analysis.result_at(turn), self.simulate(self.stopped(lines, turn)))
+        with self.assertRaises(ValueError):
+            analysis.result_at(31)
+
+    def test_substitutions(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            lines = generate_game(rng, board_size=4, n_ships=5, n_missiles=12)
+            s = Simulator(p1=Player(), p2=Player(), g=Game())
+            s.read_input_lines(lines, name='analysis')
+            analysis = GameAnalysis(s.get_sim_inputs())
+            (player_id, turn, stop_turn) = (rng.randint(1, 2), rng.randint(1, 12), rng.randint(0, 12))
+            hit_loc = (rng.randrange(4), rng.randrange(4))
+
+            moves = lines[4 + player_id].split(':')
+            moves[turn - 1] = '{x},{y}'.format(x=hit_loc[0], y=hit_loc[1])
+            substituted = list(lines)
+            substituted[4 + player_id] = ':'.join(moves)
+            expected = self.simulate(self.stopped(substituted, stop_turn)) if stop_turn else (0, 0, "It is a draw")
+            self.assertEqual(analysis.substitute(player_id, turn, hit_loc, stop_turn=stop_turn), expected)
+            self.assertEqual(analysis.flips_result(player_id, turn, hit_loc, stop_turn=stop_turn),
+                                expected[2] != analysis.result_at(stop_turn)[2])
+
+    def test_first_hit_turns(self):
+        analysis = GameAnalysis.from_file(Path(__file__).parent / '..' / 'data' / 'sample-data-1.txt')
+        self.assertEqual(analysis.get_first_hit_turn(player_id=1, hit_loc=(0, 1)), 1)
+        self.assertIsNone(analysis.get_first_hit_turn(player_id=1, hit_loc=(4, 4)))
+        with self.assertRaises(ValueError):
+            analysis.substitute(player_id=1, turn=1, hit_loc=(5, 0))
@@ -0,0 +1,50 @@
+from ..src import batch
+
+import tempfile
+import unittest
+from pathlib import Path
+
+class BatchMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_dir = Path(__file__).parent.resolve() / '..' / 'data'
+        self.out_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.out_dir.cleanup()
+        return super().tearDown()
+
+    def test_collect_input_files(self):
+        input_paths = batch.collect_input_files(str(self.data_dir / 'unittest--in*.txt'))
+        self.assertEqual(len(input_paths), 11)
+        self.assertEqual(input_paths, sorted(input_paths))
+
+    def test_batch_collects_errors(self):
+        input_paths = batch.collect_input_files(str(self.data_dir / 'unittest--in*.txt'))
+        rows = batch.run_batch(input_paths, Path(self.out_dir.name), workers=2, chunksize=3)
+
+        self.assertEqual([row['input'] for row in rows], [str(p) for p in input_paths])
+        self.assertEqual(sum(1 for row in rows if row['error']), len(input_paths) - 1)
+        valid_row = rows[0]
+        self.assertEqual(Path(valid_row['input']).name, 'unittest--input1.txt')
+        self.assertIsNone(valid_row['error'])
+        self.assertTrue(Path(valid_row['output']).exists())
+
+    def test_batch_summary(self):
+        rows = batch.run_batch([self.data_dir / 'sample-data-1.txt'], Path(self.out_dir.name), workers=1)
+        summary_path = batch.write_summary(rows, Path(self.out_dir.name))
+        with open(summary_path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], ','.join(batch.SUMMARY_FIELDS))
+        self.assertTrue(lines[1].endswith(',3,3,It is a draw,'))
+
+    def test_batch_cache(self):
+        input_paths = [self.data_dir / 'sample-data-1.txt', self.data_dir / 'unittest--input1.txt']
+        cache_dir = str(Path(self.out_dir.name) / 'cache')
+        for (cache_max_bytes, expected_hits) in ((1, 0), (2**20, 2)):
+            cache_stats = {}
+            for _ in range(2):
+                batch.run_batch(input_paths, Path(self.out_dir.name), workers=2, chunksize=1, cache_dir=cache_dir,
+                                cache_max_bytes=cache_max_bytes, cache_stats=cache_stats)
+            # The size limit is that of the workers' caches: results larger than it are not stored
+            self.assertEqual((cache_stats['hits'], cache_stats['misses']), (expected_hits, 4 - expected_hits))
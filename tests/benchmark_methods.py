@@ -0,0 +1,43 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.player import Player
+from ..src.workload import generate_game
+from ..benchmarks.run import check_parse_budget, find_regressions, main, time_move_parse, workload_grid
+
+import io
+import random
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+class BenchmarkMethodsUnitTests(unittest.TestCase):
+    def test_generated_game_is_valid(self):
+        lines = generate_game(random.Random(7), board_size=9, n_ships=20, n_missiles=99)
+        self.assertEqual(lines, generate_game(random.Random(7), board_size=9, n_ships=20, n_missiles=99))
+
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        s.read_input_lines(lines, name='generated')
+        s.simulate()
+        self.assertEqual(len(set(s.get_sim_inputs()['P1_POS_SHIPS'])), 20)
+
+    def test_workload_grid(self):
+        self.assertEqual(list(workload_grid([5, 100], [4, 20], [50, 10000], 'default')), [(5, 4, 50)])
+        self.assertEqual(len(list(workload_grid([5, 100], [4, 20], [50, 10000], 'sparse'))), 6)
+
+    def test_find_regressions(self):
+        baseline = [{'engine': 'default', 'M': 5, 'S': 4, 'T': 50, 'stage': stage, 'seconds': 0.01}
+                        for stage in ('parse', 'simulate')]
+        results = [dict(baseline[0], seconds=0.011), dict(baseline[1], seconds=0.02)]
+        regressions = find_regressions(results, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('simulate', regressions[0])
+
+    def test_move_parse_budget(self):
+        self.assertGreater(time_move_parse(1000, n_bad=10, repeat=1), 0)
+        self.assertIsNone(check_parse_budget(0.5, 10**7, budget=1.0))
+        self.assertIn('over the budget', check_parse_budget(0.5, 10**6, budget=1.0))
+
+        (stdout, stderr) = (io.StringIO(), io.StringIO())
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            self.assertEqual(main(['--parse-moves', '1000', '--repeat', '1', '--parse-budget', '0']), 1)
+        self.assertIn('parse 2000 coordinates', stdout.getvalue())
+        self.assertTrue(stderr.getvalue().startswith('REGRESSION parse'))
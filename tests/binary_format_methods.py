@@ -0,0 +1,64 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.numpy_game import NumpyGame, np
+from ..src.player import Player
+from ..src import binary_format
+
+import tempfile
+import unittest
+from pathlib import Path
+
+class BinaryFormatMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_dir = Path(__file__).parent.resolve() / '..' / 'data'
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binary_path = Path(self.tmp_dir.name) / ('sample-data-1' + binary_format.BINARY_SUFFIX)
+        binary_format.convert_text_to_binary(self.data_dir / 'sample-data-1.txt', self.binary_path)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_load_binary(self):
+        inputs = binary_format.load_binary(self.binary_path)
+        self.assertEqual((inputs['M'], inputs['S'], inputs['T']), (5, 5, 5))
+        self.assertEqual(list(inputs['P1_POS_SHIPS']), [(1, 1), (2, 0), (2, 3), (3, 4), (4, 3)])
+        self.assertEqual(inputs['P2_MOVES'][-1], (4, 3))
+        self.assertEqual(list(inputs['P1_MOVES'][1:3]), [(4, 3), (2, 3)])
+
+    def test_invalid_binary(self):
+        with open(self.binary_path, 'r+b') as f:
+            f.truncate(40)
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        with self.assertRaises(ValueError):
+            s.read_binary_input(str(self.binary_path))
+
+    def test_same_as_text_input(self):
+        engines = [Game] + ([NumpyGame] if np is not None else [])
+        for engine in engines:
+            games = [engine(), engine()]
+            s_text = Simulator(p1=Player(), p2=Player(), g=games[0])
+            s_text.read_input('sample-data-1.txt')
+            s_text.simulate()
+            s_binary = Simulator(p1=Player(), p2=Player(), g=games[1])
+            s_binary.read_binary_input(str(self.binary_path))
+            s_binary.simulate()
+            for player_id in (1, 2):
+                self.assertEqual(games[0].get_player_board(player_id), games[1].get_player_board(player_id))
+            self.assertEqual(games[0].get_game_result(), games[1].get_game_result())
+
+    def test_invalid_coordinates(self):
+        inputs = binary_format.load_binary(self.binary_path)
+        inputs = {name: inputs[name] if isinstance(inputs[name], int) else list(inputs[name]) for name in inputs}
+        inputs['P2_POS_SHIPS'][3] = inputs['P2_POS_SHIPS'][1]
+        binary_format.write_binary(inputs, self.binary_path)
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        with self.assertRaisesRegex(ValueError, 'duplicated \\(first at item 2\\)'):
+            s.read_binary_input(str(self.binary_path))
+
+        inputs['P2_POS_SHIPS'][3] = (0, 0)
+        inputs['P1_MOVES'][2] = (5, 0)
+        binary_format.write_binary(inputs, self.binary_path)
+        with self.assertRaisesRegex(ValueError, 'not in the range'):
+            s.read_binary_input(str(self.binary_path))
@@ -0,0 +1,72 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.player import Player
+from ..src.instrumentation import Instrumentation
+from ..src.cache import ResultCache, input_key
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+class CacheMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        return super().tearDown()
+
+    def test_canonical_key(self):
+        inputs = {'M': 3, 'S': 2, 'T': 1, 'P1_POS_SHIPS': [(0, 0), (1, 1)], 'P2_POS_SHIPS': [(2, 2), (0, 1)],
+                    'P1_MOVES': [(1, 1)], 'P2_MOVES': [(0, 0)]}
+        reordered = dict(inputs, P1_POS_SHIPS=[(1, 1), (0, 0)])
+        self.assertEqual(input_key(inputs, 'Game'), input_key(reordered, 'Game'))
+        self.assertNotEqual(input_key(inputs, 'Game'), input_key(dict(inputs, P1_MOVES=[(2, 1)]), 'Game'))
+        self.assertNotEqual(input_key(inputs, 'Game'), input_key(inputs, 'SparseGame'))
+        self.assertIsNone(input_key(dict(inputs, P1_MOVES=iter([(1, 1)])), 'Game'))
+
+    def test_cache_hit_skips_simulation(self):
+        cache = ResultCache(Path(self.cache_dir.name))
+        results = []
+        for _ in range(2):
+            instrumentation = Instrumentation()
+            s = Simulator(p1=Player(), p2=Player(), g=Game(), instrumentation=instrumentation, cache=cache)
+            s.read_input('sample-data-1.txt')
+            s.simulate()
+            results.append((s.render_result(), s.get_scores(), instrumentation.counters['shot']))
+        self.assertEqual(cache.get_stats()['hits'], 1)
+        self.assertEqual(cache.get_stats()['misses'], 1)
+        self.assertEqual(results[0][:2], results[1][:2])
+        # The second game was not simulated
+        self.assertEqual(results[1][2], 0)
+
+    def test_lru_eviction(self):
+        record = {'P1': 1, 'P2': 0, 'result': "Player 1 wins", 'text': 'x' * 50, 'decided_turn': 3}
+        # Room for 3 records
+        cache = ResultCache(Path(self.cache_dir.name), max_bytes=3 * len(json.dumps(record)))
+        for (n, key) in enumerate(('a', 'b', 'c')):
+            cache.put(key, record)
+            os.utime(Path(self.cache_dir.name) / (key + '.json'), (n, n))
+        # 'a' is used again, so 'b' and 'c' are the least recently used records, evicted down to the low-water mark
+        self.assertIsNotNone(cache.get('a'))
+        cache.put('d', record)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNone(cache.get('c'))
+        self.assertIsNotNone(cache.get('d'))
+        self.assertEqual(cache.get_stats()['evictions'], 2)
+        # The next record fits without evicting again
+        cache.put('e', record)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.get_stats()['evictions'], 2)
+
+    def test_overwrite_keeps_size(self):
+        record = {'P1': 1, 'P2': 0, 'result': "Player 1 wins", 'text': 'x' * 50, 'decided_turn': 3}
+        cache = ResultCache(Path(self.cache_dir.name), max_bytes=3 * len(json.dumps(record)))
+        for key in ('a', 'b', 'a', 'a', 'a'):
+            cache.put(key, record)
+        # Rewriting the same key replaces its record, so nothing is evicted
+        self.assertEqual(cache.get_stats()['bytes'], 2 * len(json.dumps(record)))
+        self.assertEqual(cache.get_stats()['evictions'], 0)
@@ -0,0 +1,58 @@
+from ..src import container
+
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+class ContainerMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_dir = Path(__file__).parent.resolve() / '..' / 'data'
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_iter_games(self):
+        f = io.StringIO('3\n3\n0:1,2:0,1:0\n1:1,1:2,2:1\n3\n0,2:1,2:2,2\n0,0:1,2:2,1\n\n---\n' * 2)
+        games = list(container.iter_games(f))
+        self.assertEqual([game_index for (game_index, _) in games], [0, 1])
+        self.assertEqual(games[1][1][2], '0:1,2:0,1:0')
+        self.assertEqual(len(games[1][1]), 7)
+
+        # The last game without its separator, and a game with an empty move line
+        games = list(container.iter_games(io.StringIO('3\n3\n0:1,2:0,1:0\n1:1,1:2,2:1\n3\n\n0,0:1,2:2,1\n---\n3\n3\n0:1,2:0,1:0\n')))
+        self.assertEqual([len(lines) for (_, lines) in games], [7, 3])
+        self.assertEqual(games[0][1][5], '')
+
+    def test_simulate_container(self):
+        container_path = Path(self.tmp_dir.name) / 'games.txt'
+        output_path = Path(self.tmp_dir.name) / 'results.jsonl'
+        input_names = ['sample-data-1.txt', 'unittest--invalid_input1.txt', 'unittest--input1.txt']
+        n_packed = container.pack_files([self.data_dir / name for name in input_names], container_path)
+        self.assertEqual(n_packed, 3)
+
+        self.assertEqual(container.simulate_container(container_path, output_path), (3, 1))
+        with open(output_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0], {'game': 0, 'P1': 3, 'P2': 3, 'result': "It is a draw"})
+        self.assertIn('error', records[1])
+        self.assertEqual(records[2]['result'], "Player 1 wins")
+
+    def test_malformed_game_does_not_shift_later_games(self):
+        with open(self.data_dir / 'sample-data-1.txt') as f:
+            lines = f.read().split('\n')[:container.GAME_N_LINES]
+        container_path = Path(self.tmp_dir.name) / 'games.txt'
+        output_path = Path(self.tmp_dir.name) / 'results.jsonl'
+        with open(container_path, 'w') as f:
+            container.write_games([lines, lines[:5] + [''] + lines[6:], lines[:6], lines], f)
+        self.assertEqual(container.simulate_container(container_path, output_path), (4, 2))
+        with open(output_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([record['game'] for record in records], [0, 1, 2, 3])
+        self.assertIn('Player 1 moves', records[1]['error'])
+        self.assertIn('has 6 lines instead of 7', records[2]['error'])
+        self.assertEqual(records[3], dict(records[0], game=3))
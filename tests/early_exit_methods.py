@@ -0,0 +1,39 @@
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.engines import ENGINES
+from ..src.numpy_game import np
+from ..src.workload import generate_game
+
+import random
+import unittest
+
+class EarlyExitMethodsUnitTests(unittest.TestCase):
+    def simulate(self, lines, engine='default', early_exit=False):
+        g = ENGINES[engine]()
+        s = Simulator(p1=Player(), p2=Player(), g=g, early_exit=early_exit)
+        s.read_input_lines(lines, name='early-exit')
+        s.simulate()
+        return s, g
+
+    def test_stops_when_decided(self):
+        # Both ships are destroyed by turn 2, so the draw can no longer change
+        lines = ['3', '1', '0:0', '1:1', '5', '1,1:2,2:2,1:2,0:0,2', '2,2:0,0:2,1:2,0:1,2']
+        (s, g) = self.simulate(lines, early_exit=True)
+        self.assertEqual(s.get_decided_turn(), 2)
+        self.assertEqual(s.get_scores(), (1, 1, "It is a draw"))
+        self.assertEqual(sum(row.count('O') + row.count('X') for row in g.get_player_board(player_id=1)), 2)
+
+        (full, g) = self.simulate(lines)
+        self.assertEqual(full.get_decided_turn(), 2)
+        self.assertEqual(sum(row.count('O') + row.count('X') for row in g.get_player_board(player_id=1)), 5)
+
+    def test_same_result_as_full_mode(self):
+        rng = random.Random(7)
+        engines = [engine for engine in ENGINES if engine != 'numpy' or np is not None]
+        for _ in range(50):
+            lines = generate_game(rng, board_size=rng.randint(3, 9), n_ships=rng.randint(1, 3), n_missiles=rng.randint(1, 99))
+            (full, _) = self.simulate(lines)
+            for engine in engines:
+                (early, _) = self.simulate(lines, engine=engine, early_exit=True)
+                self.assertEqual(early.get_scores()[2], full.get_scores()[2])
+                self.assertEqual(early.get_decided_turn(), full.get_decided_turn())
@@ -0,0 +1,59 @@
+from ..src.ffa import FreeForAllGame, FreeForAllSimulator
+from ..src.validator import InputValidationError
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.game import Game
+from ..src.workload import generate_game, generate_free_for_all_game
+
+import random
+import unittest
+
+class FreeForAllMethodsUnitTests(unittest.TestCase):
+    def test_sample_game(self):
+        s = FreeForAllSimulator(g=FreeForAllGame())
+        s.read_input('sample-ffa-1.txt')
+        s.simulate()
+        g = s.get_game()
+        self.assertEqual(g.get_scores(), [4, 3, 2])
+        self.assertEqual(g.get_game_result(), "Player 1 wins")
+        self.assertEqual([g.get_ships_left(player_id=k) for k in (1, 2, 3)], [0, 0, 0])
+        self.assertTrue(s.render_result().endswith("P1:4\nP2:3\nP3:2\nPlayer 1 wins"))
+
+    def test_two_players_same_as_game(self):
+        rng = random.Random(4)
+        for _ in range(20):
+            lines = generate_game(rng, board_size=rng.randint(2, 9), n_ships=1, n_missiles=rng.randint(1, 99))
+            s = Simulator(p1=Player(), p2=Player(), g=Game())
+            s.read_input_lines(lines, name='two-players')
+            s.simulate()
+            # Same game in the free-for-all format: every move targets the other player
+            ffa_lines = [lines[0], '2', lines[1], lines[4], lines[2], lines[3]] + [
+                ':'.join('{t},{move}'.format(t=t, move=move) for move in line.split(':')) for (t, line) in ((2, lines[5]), (1, lines[6]))]
+            ffa = FreeForAllSimulator(g=FreeForAllGame())
+            ffa.read_input_lines(ffa_lines, name='two-players')
+            ffa.simulate()
+            for player_id in (1, 2):
+                self.assertEqual(ffa.get_game().get_player_board(player_id=player_id), s.get_game().get_player_board(player_id=player_id))
+            self.assertEqual(ffa.get_game().get_scores(), list(s.get_scores()[:2]))
+
+    def test_many_players(self):
+        lines = generate_free_for_all_game(random.Random(9), board_size=6, n_players=200, n_ships=4, n_missiles=30)
+        s = FreeForAllSimulator(g=FreeForAllGame())
+        s.read_input_lines(lines, name='many-players')
+        s.simulate()
+        g = s.get_game()
+        self.assertEqual(g.get_n_players(), 200)
+        # Every hit destroys one ship location of another player
+        self.assertEqual(sum(g.get_scores()), sum(4 - g.get_ships_left(player_id=k) for k in range(1, 201)))
+        self.assertIn("wins" if g.get_scores().count(max(g.get_scores())) == 1 else "draw between", g.get_game_result())
+
+    def test_invalid_inputs(self):
+        s = FreeForAllSimulator(g=FreeForAllGame())
+        with self.assertRaises(InputValidationError) as cm:
+            s.read_input_lines(['5', '3', '2', '1', '0:0,1:1', '1:1,2:2', '3:3,4:4', '1,0,0', '3,0,9', '2,0,0:1,1,1'], name='invalid')
+        self.assertEqual([(e.line, e.column) for e in cm.exception.errors], [(8, 1), (9, 1), (10, None)])
+        self.assertIn("One or more targets in Player 1 moves is not another player in the range [1, 3]", str(cm.exception))
+        with self.assertRaisesRegex(ValueError, "Ship positions and moves of 3 players need 10 lines"):
+            s.read_input_lines(['5', '3', '2', '1', '0:0,1:1'], name='invalid')
+        with self.assertRaises(ValueError):
+            FreeForAllGame().register_player_move(player_id=1, target_id=2, hit_loc=(0, 0))
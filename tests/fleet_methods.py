@@ -0,0 +1,69 @@
+from ..src.fleet import FleetGame, Ship, index_fleet
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.game import Game
+from ..src.instrumentation import Instrumentation
+from ..src.workload import generate_game
+
+import random
+import unittest
+
+class FleetMethodsUnitTests(unittest.TestCase):
+    def simulate(self, lines, g, instrumentation=None):
+        s = Simulator(p1=Player(), p2=Player(), g=g, instrumentation=instrumentation)
+        s.read_input_lines(lines, name='fleet')
+        s.simulate()
+        return s
+
+    def test_sunk_ships(self):
+        instrumentation = Instrumentation()
+        sunk = []
+        instrumentation.add_hook('sunk', lambda player_id, ship: sunk.append((player_id, ship)))
+        lines = ['5', '2', '0:0:3:H,2:2', '1:0:2:V,4:4', '5', '1,0:2,0:2,2:4,4:0,0', '0,0:0,1:0,2:2,2:3,3']
+        s = self.simulate(lines, FleetGame(), instrumentation=instrumentation)
+        # Both players sink both ships of the other player, each ship on the turn its last location is hit
+        self.assertEqual(sunk, [(1, Ship(1, 0, 2, 'V')), (2, Ship(0, 0, 3, 'H')), (1, Ship(4, 4)), (2, Ship(2, 2))])
+        self.assertEqual(s.get_scores(), (2, 2, "It is a draw"))
+        self.assertEqual(instrumentation.counters['hit'], 7)
+        self.assertEqual(s.get_game().get_ships_left(player_id=1), [])
+
+        g = FleetGame()
+        g.setup_boards(n_ships=1, p1_ships=[Ship(0, 0, 4, 'V')], p2_ships=[Ship(1, 1)], board_size=5)
+        for x in (0, 1, 2, 2):
+            g.register_player_move(player_id=2, hit_loc=(x, 0))
+        self.assertEqual((g.get_player_scores(player_id=2), len(g.get_ships_left(player_id=1))), (0, 1))
+        g.register_player_move(player_id=2, hit_loc=(3, 0))
+        self.assertEqual((g.get_player_scores(player_id=2), g.get_ships_left(player_id=1)), (1, []))
+
+    def test_placement_errors(self):
+        lines = ['5', '3', '0:0:3:H,0:1:2:V,2:2:4:V', '0:0,1:2:2:D,x', '1', '0,0', '0,0']
+        with self.assertRaises(ValueError) as cm:
+            self.simulate(lines, FleetGame())
+        self.assertEqual([(e.line, e.column) for e in cm.exception.errors], [(3, 9), (3, 17), (4, 5), (4, 13)])
+        self.assertIn("Ship at column 9 in Player 1 ship positions overlaps the ship at column 1.", str(cm.exception))
+        self.assertIn("Ship at column 17 in Player 1 ship positions does not fit in the range [0, 4].", str(cm.exception))
+
+        (_, conflicts) = index_fleet([Ship(0, 0, 2, 'V'), Ship(1, 0, 3, 'H'), Ship(0, 4, 2, 'H')], board_size=5)
+        self.assertEqual(conflicts, [(1, 0), (2, None)])
+        with self.assertRaisesRegex(ValueError, "overlaps"):
+            FleetGame().setup_boards(n_ships=2, p1_ships=[(0, 0), (0, 0)], p2_ships=[(1, 1)], board_size=2)
+
+    def test_single_location_ships_same_as_game(self):
+        rng = random.Random(8)
+        for _ in range(30):
+            board_size = rng.randint(3, 9)
+            lines = generate_game(rng, board_size=board_size, n_ships=rng.randint(2, board_size**2 // 2 - 1),
+                                    n_missiles=rng.randint(1, 99))
+            fleet = self.simulate(lines, FleetGame())
+            game = self.simulate(lines, Game())
+            self.assertEqual(fleet.get_scores(), game.get_scores())
+            self.assertEqual(fleet.render_result().split('\n')[-3:], game.render_result().split('\n')[-3:])
+
+    def test_large_fleet(self):
+        # 1000 ships of 100 locations on a (10^6 x 10^6) board: shots only touch the index of the location
+        ships = ','.join('{x}:{y}:100:H'.format(x=x, y=x % 7) for x in range(1000))
+        moves = ':'.join('{x},{y}'.format(x=x, y=y) for x in range(3) for y in range(110))
+        lines = ['1000000', '1000', ships, ships, str(3 * 110), moves, moves]
+        s = self.simulate(lines, FleetGame())
+        self.assertEqual(s.get_scores(), (3, 3, "It is a draw"))
+        self.assertEqual(len(s.get_game().get_ships_left(player_id=1)), 997)
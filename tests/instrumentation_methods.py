@@ -0,0 +1,67 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.numpy_game import NumpyGame, np
+from ..src.packed import PackedGame
+from ..src.player import Player
+from ..src.instrumentation import Instrumentation, PHASES
+
+import tempfile
+import unittest
+
+class InstrumentationMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.out_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.out_dir.cleanup()
+        return super().tearDown()
+
+    def __run(self, g):
+        instrumentation = Instrumentation()
+        events = []
+        for event in ('hit', 'miss'):
+            instrumentation.add_hook(event, lambda player_id, hit_loc, event=event: events.append((event, player_id, hit_loc)))
+        s = Simulator(p1=Player(), p2=Player(), g=g, output_dir=self.out_dir.name, instrumentation=instrumentation)
+        s.read_input('sample-data-1.txt')
+        s.simulate()
+        s.write_result()
+        return instrumentation, events
+
+    def test_event_hooks(self):
+        instrumentation, events = self.__run(Game())
+        self.assertEqual(instrumentation.counters['shot'], 10)
+        self.assertEqual(instrumentation.counters['hit'], 6)
+        self.assertEqual(instrumentation.counters['miss'], 4)
+        self.assertEqual(instrumentation.counters['game_over'], 1)
+        self.assertEqual(events[0], ('hit', 1, (0, 1)))
+
+        with self.assertRaises(ValueError):
+            instrumentation.add_hook('explosion', print)
+
+    def test_phase_timings(self):
+        instrumentation, _ = self.__run(Game())
+        for phase in PHASES:
+            self.assertEqual(instrumentation.phase_calls[phase], 1)
+        self.assertEqual(len(instrumentation.report().split('\n')), len(PHASES) + 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_same_events_as_numpy_engine(self):
+        _, events = self.__run(Game())
+        _, numpy_events = self.__run(NumpyGame())
+        self.assertEqual(sorted(events), sorted(numpy_events))
+
+    def test_counters_without_hooks(self):
+        # Vectorized engines only count the events which have no hooks
+        engines = [Game, PackedGame] + ([NumpyGame] if np is not None else [])
+        counters = []
+        for engine in engines:
+            instrumentation = Instrumentation()
+            self.assertFalse(instrumentation.has_hooks('shot', 'hit', 'miss'))
+            s = Simulator(p1=Player(), p2=Player(), g=engine(), instrumentation=instrumentation)
+            s.read_input('sample-data-1.txt')
+            s.simulate()
+            counters.append(dict(instrumentation.counters))
+        self.assertEqual(counters[0], {'shot': 10, 'hit': 6, 'miss': 4, 'game_over': 1})
+        for other in counters[1:]:
+            self.assertEqual(other, counters[0])
@@ -40,4 +40,11 @@ class InvalidInputUnitTests(unittest.TestCase):
     def test_ship_locations_invalid_format(self):
         with self.assertRaises(ValueError):
             self.s.read_input('unittest--invalid_input8.txt')
-    
\ No newline at end of file
+
+    def test_moves_range_violation(self):
+        with self.assertRaises(ValueError):
+            self.s.read_input('unittest--invalid_input9.txt')
+
+    def test_moves_number_violation(self):
+        with self.assertRaises(ValueError):
+            self.s.read_input('unittest--invalid_input10.txt')
@@ -4,6 +4,31 @@ from .invalid_input import InvalidInputUnitTests
 from .player_methods import PlayerMethodsUnitTests
 from .game_methods import GameMethodsUnitTests
 from .simulator_methods import SimulatorMethodsUnitTests
+from .batch_methods import BatchMethodsUnitTests
+from .numpy_game_methods import NumpyGameMethodsUnitTests
+from .sparse_game_methods import SparseGameMethodsUnitTests
+from .streaming_methods import StreamingMethodsUnitTests
+from .container_methods import ContainerMethodsUnitTests
+from .binary_format_methods import BinaryFormatMethodsUnitTests
+from .instrumentation_methods import InstrumentationMethodsUnitTests
+from .benchmark_methods import BenchmarkMethodsUnitTests
+from .monte_carlo_methods import MonteCarloMethodsUnitTests
+from .strategy_methods import StrategyMethodsUnitTests
+from .service_methods import ServiceMethodsUnitTests
+from .reuse_methods import ReuseMethodsUnitTests
+from .sink_methods import SinkMethodsUnitTests
+from .cache_methods import CacheMethodsUnitTests
+from .early_exit_methods import EarlyExitMethodsUnitTests
+from .validator_methods import ValidatorMethodsUnitTests
+from .replay_methods import ReplayMethodsUnitTests
+from .ffa_methods import FreeForAllMethodsUnitTests
+from .fleet_methods import FleetMethodsUnitTests
+from .tournament_methods import TournamentMethodsUnitTests
+from .packed_methods import PackedMethodsUnitTests
+from .salvo_methods import SalvoMethodsUnitTests
+from .spectator_methods import SpectatorMethodsUnitTests
+from .aggregate_methods import AggregateMethodsUnitTests
+from .analysis_methods import AnalysisMethodsUnitTests
 
 def suite():
     suite = unittest.TestSuite()
@@ -17,6 +42,8 @@ def suite():
     suite.addTest(InvalidInputUnitTests('test_ship_locations_nonnumeric'))
     suite.addTest(InvalidInputUnitTests('test_ship_locations_number_violation'))
     suite.addTest(InvalidInputUnitTests('test_ship_locations_invalid_format'))
+    suite.addTest(InvalidInputUnitTests('test_moves_range_violation'))
+    suite.addTest(InvalidInputUnitTests('test_moves_number_violation'))
 
     # Player class unit tests
     suite.addTest(PlayerMethodsUnitTests('test_moves_setter'))
@@ -29,10 +56,154 @@ def suite():
     suite.addTest(GameMethodsUnitTests('test_player_scores'))
     suite.addTest(GameMethodsUnitTests('test_game_result'))
 
+    # NumpyGame class unit tests
+    suite.addTest(NumpyGameMethodsUnitTests('test_repeated_moves'))
+    suite.addTest(NumpyGameMethodsUnitTests('test_same_as_default_engine'))
+    suite.addTest(NumpyGameMethodsUnitTests('test_single_moves_same_as_default_engine'))
+    suite.addTest(NumpyGameMethodsUnitTests('test_large_games_same_as_sparse_engine'))
+
+    # SparseGame class unit tests
+    suite.addTest(SparseGameMethodsUnitTests('test_same_as_default_engine'))
+    suite.addTest(SparseGameMethodsUnitTests('test_large_board'))
+
     # Simulator class unit test
     suite.addTest(SimulatorMethodsUnitTests('test_simulating_before_reading_input'))
     suite.addTest(SimulatorMethodsUnitTests('test_simulate_without_error'))
     suite.addTest(SimulatorMethodsUnitTests('test_simulate_and_write_output'))
+
+    # Streaming input parser unit tests
+    suite.addTest(StreamingMethodsUnitTests('test_line_tokens'))
+    suite.addTest(StreamingMethodsUnitTests('test_same_as_full_read'))
+    suite.addTest(StreamingMethodsUnitTests('test_invalid_move_while_simulating'))
+    suite.addTest(StreamingMethodsUnitTests('test_extra_moves'))
+    suite.addTest(StreamingMethodsUnitTests('test_vectorized_moves_in_chunks'))
+
+    # Container format unit tests
+    suite.addTest(ContainerMethodsUnitTests('test_iter_games'))
+    suite.addTest(ContainerMethodsUnitTests('test_simulate_container'))
+    suite.addTest(ContainerMethodsUnitTests('test_malformed_game_does_not_shift_later_games'))
+
+    # Binary game format unit tests
+    suite.addTest(BinaryFormatMethodsUnitTests('test_load_binary'))
+    suite.addTest(BinaryFormatMethodsUnitTests('test_invalid_binary'))
+    suite.addTest(BinaryFormatMethodsUnitTests('test_same_as_text_input'))
+    suite.addTest(BinaryFormatMethodsUnitTests('test_invalid_coordinates'))
+
+    # Instrumentation unit tests
+    suite.addTest(InstrumentationMethodsUnitTests('test_event_hooks'))
+    suite.addTest(InstrumentationMethodsUnitTests('test_phase_timings'))
+    suite.addTest(InstrumentationMethodsUnitTests('test_same_events_as_numpy_engine'))
+    suite.addTest(InstrumentationMethodsUnitTests('test_counters_without_hooks'))
+
+    # Benchmark suite unit tests
+    suite.addTest(BenchmarkMethodsUnitTests('test_generated_game_is_valid'))
+    suite.addTest(BenchmarkMethodsUnitTests('test_workload_grid'))
+    suite.addTest(BenchmarkMethodsUnitTests('test_find_regressions'))
+    suite.addTest(BenchmarkMethodsUnitTests('test_move_parse_budget'))
+
+    # Monte Carlo engine unit tests
+    suite.addTest(MonteCarloMethodsUnitTests('test_same_as_default_engine'))
+    suite.addTest(MonteCarloMethodsUnitTests('test_estimate_outcomes'))
+    suite.addTest(MonteCarloMethodsUnitTests('test_fleet_same_as_fleet_engine'))
+
+    # Player strategy unit tests
+    suite.addTest(StrategyMethodsUnitTests('test_random_without_replacement'))
+    suite.addTest(StrategyMethodsUnitTests('test_hunt_target_shoots_neighbours'))
+    suite.addTest(StrategyMethodsUnitTests('test_density_update'))
+    suite.addTest(StrategyMethodsUnitTests('test_density_does_not_repeat'))
+    suite.addTest(StrategyMethodsUnitTests('test_simulate_with_strategies'))
+    suite.addTest(StrategyMethodsUnitTests('test_density_takes_ship_lengths_from_inputs'))
+
+    # Simulation service unit tests
+    suite.addTest(ServiceMethodsUnitTests('test_latency_percentiles'))
+    suite.addTest(ServiceMethodsUnitTests('test_serve_requests'))
+    suite.addTest(ServiceMethodsUnitTests('test_worker_exception'))
+    suite.addTest(ServiceMethodsUnitTests('test_backpressure'))
+    suite.addTest(ServiceMethodsUnitTests('test_timeout'))
+
+    # Object reuse and board pool unit tests
+    suite.addTest(ReuseMethodsUnitTests('test_board_pool'))
+    suite.addTest(ReuseMethodsUnitTests('test_game_reset'))
+    suite.addTest(ReuseMethodsUnitTests('test_reused_simulator_same_as_new'))
+
+    # Result sink unit tests
+    suite.addTest(SinkMethodsUnitTests('test_text_sink_does_not_overwrite'))
+    suite.addTest(SinkMethodsUnitTests('test_append_sink_buffers'))
+    suite.addTest(SinkMethodsUnitTests('test_sqlite_sink'))
+    suite.addTest(SinkMethodsUnitTests('test_batch_with_sqlite_sink'))
+
+    # Result cache unit tests
+    suite.addTest(CacheMethodsUnitTests('test_canonical_key'))
+    suite.addTest(CacheMethodsUnitTests('test_cache_hit_skips_simulation'))
+    suite.addTest(CacheMethodsUnitTests('test_lru_eviction'))
+    suite.addTest(CacheMethodsUnitTests('test_overwrite_keeps_size'))
+
+    # Early exit unit tests
+    suite.addTest(EarlyExitMethodsUnitTests('test_stops_when_decided'))
+    suite.addTest(EarlyExitMethodsUnitTests('test_same_result_as_full_mode'))
+
+    # Input validator unit tests
+    suite.addTest(ValidatorMethodsUnitTests('test_collects_every_error'))
+    suite.addTest(ValidatorMethodsUnitTests('test_missing_lines'))
+    suite.addTest(ValidatorMethodsUnitTests('test_simulator_messages'))
+    suite.addTest(ValidatorMethodsUnitTests('test_bulk_parse_matches_items'))
+    suite.addTest(ValidatorMethodsUnitTests('test_large_move_list'))
+
+    # Replay log unit tests
+    suite.addTest(ReplayMethodsUnitTests('test_boards_at_every_turn'))
+    suite.addTest(ReplayMethodsUnitTests('test_same_log_for_every_engine'))
+    suite.addTest(ReplayMethodsUnitTests('test_save_and_load'))
+
+    # Free-for-all game unit tests
+    suite.addTest(FreeForAllMethodsUnitTests('test_sample_game'))
+    suite.addTest(FreeForAllMethodsUnitTests('test_two_players_same_as_game'))
+    suite.addTest(FreeForAllMethodsUnitTests('test_many_players'))
+    suite.addTest(FreeForAllMethodsUnitTests('test_invalid_inputs'))
+
+    # Fleet game unit tests
+    suite.addTest(FleetMethodsUnitTests('test_sunk_ships'))
+    suite.addTest(FleetMethodsUnitTests('test_placement_errors'))
+    suite.addTest(FleetMethodsUnitTests('test_single_location_ships_same_as_game'))
+    suite.addTest(FleetMethodsUnitTests('test_large_fleet'))
+
+    # Tournament unit tests
+    suite.addTest(TournamentMethodsUnitTests('test_standings'))
+    suite.addTest(TournamentMethodsUnitTests('test_resume'))
+    suite.addTest(TournamentMethodsUnitTests('test_merge_invocations'))
+
+    # Game analysis unit tests
+    suite.addTest(AnalysisMethodsUnitTests('test_prefix_results'))
+    suite.addTest(AnalysisMethodsUnitTests('test_substitutions'))
+    suite.addTest(AnalysisMethodsUnitTests('test_first_hit_turns'))
+
+    # Aggregation unit tests
+    suite.addTest(AggregateMethodsUnitTests('test_same_counts_across_engines'))
+    suite.addTest(AggregateMethodsUnitTests('test_merge_and_export'))
+    suite.addTest(AggregateMethodsUnitTests('test_batch_aggregate'))
+
+    # Spectator unit tests
+    suite.addTest(SpectatorMethodsUnitTests('test_screen_matches_boards'))
+    suite.addTest(SpectatorMethodsUnitTests('test_only_changed_locations_are_drawn'))
+    suite.addTest(SpectatorMethodsUnitTests('test_view_of_large_board'))
+
+    # Packed locations unit tests
+    suite.addTest(PackedMethodsUnitTests('test_same_as_default_engine'))
+    suite.addTest(PackedMethodsUnitTests('test_packed_locations'))
+    suite.addTest(PackedMethodsUnitTests('test_memory_per_move'))
+
+    # Salvo game unit tests
+    suite.addTest(SalvoMethodsUnitTests('test_ships_salvo_size'))
+    suite.addTest(SalvoMethodsUnitTests('test_same_result_across_engines'))
+    suite.addTest(SalvoMethodsUnitTests('test_one_shot_salvo_is_standard_game'))
+    suite.addTest(SalvoMethodsUnitTests('test_invalid_volleys'))
+    suite.addTest(SalvoMethodsUnitTests('test_empty_volleys'))
+    suite.addTest(SalvoMethodsUnitTests('test_large_volleys_in_bulk'))
+
+    # Batch runner unit tests
+    suite.addTest(BatchMethodsUnitTests('test_collect_input_files'))
+    suite.addTest(BatchMethodsUnitTests('test_batch_collects_errors'))
+    suite.addTest(BatchMethodsUnitTests('test_batch_summary'))
+    suite.addTest(BatchMethodsUnitTests('test_batch_cache'))
     return suite
 
 if __name__ == '__main__':
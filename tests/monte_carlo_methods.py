@@ -0,0 +1,53 @@
+from ..src.game import Game
+from ..src.fleet import FleetGame, Ship
+from ..src import monte_carlo
+from ..src.monte_carlo import np
+
+import unittest
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class MonteCarloMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.p1_ships = [(1, 2), (2, 4), (2, 3), (3, 4), (4, 0)]
+        self.p2_ships = [(0, 3), (1, 0), (3, 1), (2, 4), (0, 4)]
+        return super().setUp()
+
+    def test_same_as_default_engine(self):
+        rng = np.random.default_rng(3)
+        p1_moves = monte_carlo.random_moves(rng, 50, 20, 5)
+        p2_moves = monte_carlo.random_moves(rng, 50, 20, 5)
+        (p1_scores, p2_scores, results) = monte_carlo.simulate_batch(5, self.p1_ships, self.p2_ships, 
+                                                                        p1_moves, p2_moves, chunk_size=16)
+        for n in range(50):
+            g = Game()
+            g.setup_boards(n_ships=5, p1_ships=self.p1_ships, p2_ships=self.p2_ships, board_size=5)
+            for (p1_move, p2_move) in zip(p1_moves[n].tolist(), p2_moves[n].tolist()):
+                g.register_player_move(player_id=1, hit_loc=p1_move)
+                g.register_player_move(player_id=2, hit_loc=p2_move)
+            self.assertEqual(g.get_player_scores(player_id=1), p1_scores[n])
+            self.assertEqual(g.get_player_scores(player_id=2), p2_scores[n])
+            self.assertEqual(g.get_game_result(), monte_carlo.RESULT_STRINGS[results[n]])
+
+    def test_estimate_outcomes(self):
+        distribution = monte_carlo.estimate_outcomes(5, self.p1_ships, self.p2_ships, n_missiles=5, 
+                                                        n_games=1000, seed=0, chunk_size=300)
+        self.assertEqual(sum(distribution.values()), 1000)
+        self.assertEqual(distribution, monte_carlo.estimate_outcomes(5, self.p1_ships, self.p2_ships, n_missiles=5, 
+                                                                        n_games=1000, seed=0, chunk_size=300))
+
+    def test_fleet_same_as_fleet_engine(self):
+        p1_fleet = [Ship(0, 0, 3, 'H'), Ship(2, 1, 2, 'V'), Ship(4, 4)]
+        p2_fleet = [Ship(1, 1, 2, 'V'), Ship(3, 3, 2, 'H')]
+        rng = np.random.default_rng(4)
+        p1_moves = monte_carlo.random_moves(rng, 40, 15, 5)
+        p2_moves = monte_carlo.random_moves(rng, 40, 15, 5)
+        (p1_scores, p2_scores, results) = monte_carlo.simulate_batch(5, p1_fleet, p2_fleet, p1_moves, p2_moves, chunk_size=16)
+        for n in range(40):
+            g = FleetGame()
+            g.setup_boards(n_ships=3, p1_ships=p1_fleet, p2_ships=p2_fleet, board_size=5)
+            for (p1_move, p2_move) in zip(p1_moves[n].tolist(), p2_moves[n].tolist()):
+                g.register_player_move(player_id=1, hit_loc=tuple(p1_move))
+                g.register_player_move(player_id=2, hit_loc=tuple(p2_move))
+            self.assertEqual((g.get_player_scores(player_id=1), g.get_player_scores(player_id=2)), (p1_scores[n], p2_scores[n]))
+            self.assertEqual(g.get_game_result(), monte_carlo.RESULT_STRINGS[results[n]])
+        self.assertGreater(p1_scores.max(), 0)
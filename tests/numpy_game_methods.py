@@ -0,0 +1,72 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.numpy_game import NumpyGame, np
+from ..src.player import Player
+from ..src.sparse_game import SparseGame
+from ..src.workload import generate_game
+
+import random
+import unittest
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class NumpyGameMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = NumpyGame()
+        input_ship_n = 5
+        input_ship_loc_p1 = [(1, 2), (2, 4), (2, 3), (3, 4), (4, 0)]
+        input_ship_loc_p2 = [(0, 3), (1, 0), (3, 1), (2, 4), (0, 4)]
+        self.g.setup_boards(n_ships=input_ship_n, p1_ships=input_ship_loc_p1, p2_ships=input_ship_loc_p2)
+        return super().setUp()
+
+    def test_repeated_moves(self):
+        self.g.register_player_moves(player_id=1, hit_locs=[(0, 3), (0, 3), (4, 4), (0, 3)])
+        self.g.register_player_move(player_id=1, hit_loc=(0, 3))
+        board = self.g.get_player_board(player_id=2)
+
+        self.assertEqual(board[0][3], 'X')
+        self.assertEqual(board[4][4], 'O')
+        self.assertEqual(self.g.get_player_scores(player_id=1), 1)
+        self.assertEqual(self.g.get_game_result(), "Player 1 wins")
+
+    def test_same_as_default_engine(self):
+        for filename in ('sample-data-1.txt', 'unittest--input1.txt'):
+            games = [Game(), NumpyGame()]
+            for g in games:
+                s = Simulator(p1=Player(), p2=Player(), g=g)
+                s.read_input(filename)
+                s.simulate()
+            for player_id in (1, 2):
+                self.assertEqual(games[0].get_player_board(player_id), games[1].get_player_board(player_id))
+                self.assertEqual(games[0].get_player_scores(player_id), games[1].get_player_scores(player_id))
+            self.assertEqual(games[0].get_game_result(), games[1].get_game_result())
+
+    def test_single_moves_same_as_default_engine(self):
+        # Move by move, as with early exit, replays and strategies
+        games = [Game(), NumpyGame()]
+        for g in games:
+            s = Simulator(p1=Player(), p2=Player(), g=g, early_exit=True)
+            s.read_input('sample-data-1.txt')
+            s.simulate()
+        for player_id in (1, 2):
+            self.assertEqual(games[0].get_player_board(player_id), games[1].get_player_board(player_id))
+            self.assertEqual(games[0].get_player_scores(player_id), games[1].get_player_scores(player_id))
+        self.assertIs(self.g.register_player_move(player_id=2, hit_loc=(1, 2)), True)
+        self.assertIs(self.g.register_player_move(player_id=2, hit_loc=(1, 2)), False)
+        self.assertEqual(self.g.get_player_scores(player_id=2), 1)
+
+    def test_large_games_same_as_sparse_engine(self):
+        rng = random.Random(12)
+        for (board_size, n_missiles) in ((60, 5000), (300, 70000)):
+            lines = generate_game(rng, board_size=board_size, n_ships=board_size * 3, n_missiles=n_missiles)
+            games = [SparseGame(), NumpyGame()]
+            for g in games:
+                s = Simulator(p1=Player(), p2=Player(), g=g)
+                s.read_input_lines(lines, name='large')
+                s.simulate()
+            for player_id in (1, 2):
+                self.assertEqual(games[0].get_player_scores(player_id), games[1].get_player_scores(player_id))
+                occupied = games[0].get_occupied_cells(player_id=player_id)
+                board = games[1].get_player_board(player_id)
+                self.assertEqual({loc: board[loc[0]][loc[1]] for loc in occupied}, occupied)
+                self.assertEqual(sum(len(row) - row.count('_') for row in board), len(occupied))
+            self.assertEqual(games[0].get_game_result(), games[1].get_game_result())
@@ -0,0 +1,66 @@
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.game import Game
+from ..src.packed import PackedGame, PackedLocations, pack_locations
+from ..src.validator import InputValidator
+from ..src.workload import generate_game
+
+import random
+import tracemalloc
+import unittest
+
+class PackedMethodsUnitTests(unittest.TestCase):
+    def simulate(self, lines, g, **kwargs):
+        s = Simulator(p1=Player(), p2=Player(), g=g, **kwargs)
+        s.read_input_lines(lines, name='packed')
+        s.simulate()
+        return s
+
+    def test_same_as_default_engine(self):
+        rng = random.Random(4)
+        for _ in range(30):
+            board_size = rng.randint(2, 9)
+            lines = generate_game(rng, board_size=board_size, n_ships=rng.randint(1, board_size * board_size // 2 - 1),
+                                    n_missiles=rng.randint(1, 99))
+            for kwargs in ({}, {'early_exit': True}):
+                expected = self.simulate(lines, Game(), **kwargs)
+                s = self.simulate(lines, PackedGame(), **kwargs)
+                self.assertEqual(s.get_scores(), expected.get_scores())
+                self.assertEqual(s.render_result(), expected.render_result())
+
+    def test_packed_locations(self):
+        validator = InputValidator(packed=True)
+        # The spaces make the validator parse the moves of Player 2 item by item (without NumPy)
+        (inputs, errors) = validator.validate_lines(['5', '2', '0:0,4:4', '1:1,2:2', '3', '0,0:4,3:2,1', '0, 0:4, 3:2, 1'])
+        self.assertEqual(errors, [])
+        for moves in (inputs['P1_MOVES'], inputs['P2_MOVES']):
+            self.assertIsInstance(moves, PackedLocations)
+            self.assertEqual(moves.cells.typecode, 'H')
+            self.assertEqual(list(moves.cells), [0, 23, 11])
+            self.assertEqual(list(moves), [(0, 0), (4, 3), (2, 1)])
+            self.assertEqual(moves[-1], (2, 1))
+            self.assertEqual(list(moves[1:]), [(4, 3), (2, 1)])
+        # Ship locations are kept as tuples
+        self.assertEqual(inputs['P1_POS_SHIPS'], [(0, 0), (4, 4)])
+
+        moves = iter(inputs['P1_MOVES'])
+        self.assertEqual(next(moves), (0, 0))
+        self.assertEqual(list(moves.take(5).cells), [23, 11])
+        self.assertEqual(pack_locations([(299, 299)], 300).typecode, 'I')
+        self.assertIs(pack_locations(inputs['P1_MOVES'], 5), inputs['P1_MOVES'].cells)
+
+    def test_memory_per_move(self):
+        rng = random.Random(9)
+        lines = generate_game(rng, board_size=200, n_ships=50, n_missiles=20000)
+        sizes = []
+        for validator in (InputValidator(), InputValidator(packed=True)):
+            tracemalloc.start()
+            inputs = validator.validate(lines)
+            sizes.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            self.assertEqual(list(inputs['P1_MOVES'][:100]), [tuple(loc) for loc in InputValidator().validate(lines)['P1_MOVES'][:100]])
+            del inputs
+        self.assertLess(sizes[1] * 10, sizes[0])
+
+        for obj in (Game(), PackedGame(), Player(), Simulator(p1=Player(), p2=Player(), g=Game())):
+            self.assertFalse(hasattr(obj, '__dict__'))
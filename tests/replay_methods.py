@@ -0,0 +1,83 @@
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.engines import ENGINES
+from ..src.numpy_game import np
+from ..src.replay import ReplayLog
+from ..src.workload import generate_game
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+class ReplayMethodsUnitTests(unittest.TestCase):
+    def simulate(self, lines, engine='default', **kwargs):
+        g = ENGINES[engine]()
+        s = Simulator(p1=Player(), p2=Player(), g=g, **kwargs)
+        s.read_input_lines(lines, name='replay')
+        s.simulate()
+        return s, g
+
+    def truncated(self, lines, n_turns):
+        # Same game with only the first n_turns moves of each player
+        return lines[:4] + [str(n_turns)] + [':'.join(line.split(':')[:n_turns]) for line in lines[5:7]]
+
+    def test_boards_at_every_turn(self):
+        rng = random.Random(11)
+        lines = generate_game(rng, board_size=6, n_ships=5, n_missiles=40)
+        (s, _) = self.simulate(lines, replay=True, snapshot_interval=4)
+        replay = s.get_replay()
+        self.assertEqual(replay.get_n_turns(), 40)
+        # Seeks back and forth
+        for turn in [40, 3, 17, 16, 39, 8, 1]:
+            (_, g) = self.simulate(self.truncated(lines, turn))
+            self.assertEqual(replay.get_boards(turn), (g.get_player_board(player_id=1), g.get_player_board(player_id=2)))
+            self.assertEqual(replay.get_scores(turn), (g.get_player_scores(player_id=1), g.get_player_scores(player_id=2)))
+        self.assertEqual(replay.get_scores(0), (0, 0))
+        self.assertEqual([sum(row.count('B') for row in board) for board in replay.get_boards(0)], [5, 5])
+        with self.assertRaises(ValueError):
+            replay.get_boards(41)
+
+    def test_same_log_for_every_engine(self):
+        rng = random.Random(5)
+        lines = generate_game(rng, board_size=8, n_ships=6, n_missiles=30)
+        engines = [engine for engine in ENGINES if engine != 'numpy' or np is not None]
+        logs = []
+        for engine in engines:
+            (s, _) = self.simulate(lines, engine=engine, replay=True)
+            logs.append(list(s.get_replay().events()))
+            self.assertEqual(s.get_replay().get_scores(30), s.get_scores()[:2])
+        self.assertTrue(all(log == logs[0] for log in logs))
+        self.assertEqual(len(logs[0]), 60)
+        self.assertEqual(logs[0][:2], [(1, 1, tuple(map(int, lines[5].split(':')[0].split(','))), logs[0][0][3]),
+                                        (1, 2, tuple(map(int, lines[6].split(':')[0].split(','))), logs[0][1][3])])
+
+        # Fleet games score a point for each sunk ship, not for each hit
+        lines = ['5', '2', '0:0:3:H,4:4:1:H', '1:1:2:V,3:3:1:H', '4', '1,1:2,1:3,3:4,4', '0,0:0,1:4,4:3,3']
+        (s, _) = self.simulate(lines, engine='fleet', replay=True, snapshot_interval=1)
+        self.assertEqual(s.get_scores(), (2, 1, 'Player 1 wins'))
+        replay = s.get_replay()
+        self.assertEqual([replay.get_scores(turn) for turn in range(5)], [(0, 0), (0, 0), (1, 0), (2, 1), (2, 1)])
+        self.assertIn('P1:2\nP2:1\n', replay.render(4))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'fleet.brpl'
+            replay.save(path)
+            self.assertEqual(ReplayLog.load(path).render(3), replay.render(3))
+
+    def test_save_and_load(self):
+        rng = random.Random(2)
+        lines = generate_game(rng, board_size=9, n_ships=10, n_missiles=90)
+        (s, _) = self.simulate(lines, replay=True, early_exit=True, snapshot_interval=7)
+        replay = s.get_replay()
+        self.assertEqual(replay.get_n_turns(), s.get_decided_turn())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'game.brpl'
+            replay.save(path)
+            loaded = ReplayLog.load(path)
+            path.write_bytes(path.read_bytes()[:-1])
+            with self.assertRaises(ValueError):
+                ReplayLog.load(path)
+        self.assertEqual(loaded.snapshot_interval, 7)
+        self.assertEqual(list(loaded.events()), list(replay.events()))
+        for turn in range(replay.get_n_turns() + 1):
+            self.assertEqual(loaded.render(turn), replay.render(turn))
@@ -0,0 +1,52 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.player import Player
+from ..src.board_pool import BoardPool
+from ..src.engines import ENGINES
+from ..src.numpy_game import np
+
+import unittest
+
+class ReuseMethodsUnitTests(unittest.TestCase):
+    def test_board_pool(self):
+        pool = BoardPool()
+        board = pool.acquire(3)
+        board[1][2] = 'X'
+        pool.release(board)
+        reused = pool.acquire(3)
+        self.assertIs(reused, board)
+        self.assertEqual(reused, [['_'] * 3 for _ in range(3)])
+        self.assertIsNot(pool.acquire(3), board)
+        self.assertEqual(pool.get_stats(), {'allocated': 2, 'reused': 1, 'free': 0})
+
+    def test_game_reset(self):
+        g = Game()
+        g.setup_boards(n_ships=2, p1_ships=[(0, 0), (1, 1)], p2_ships=[(0, 1), (1, 0)], board_size=3)
+        g.register_player_move(player_id=1, hit_loc=(0, 1))
+        board = g.get_player_board(player_id=2)
+        g.reset()
+        self.assertEqual(g.get_player_scores(player_id=1), 0)
+        g.setup_boards(n_ships=1, p1_ships=[(2, 2)], p2_ships=[(2, 1)], board_size=3)
+        # The boards of the last game are cleared and reused
+        self.assertTrue(any(g.get_player_board(player_id=player_id) is board for player_id in (1, 2)))
+        self.assertEqual(g.get_player_board(player_id=2)[0][1], '_')
+        self.assertEqual(g.get_player_board(player_id=2)[2][1], 'B')
+
+    def test_reused_simulator_same_as_new(self):
+        filenames = ['sample-data-1.txt', 'unittest--input1.txt', 'unittest--invalid_input1.txt', 'sample-data-1.txt']
+        for engine in ENGINES:
+            if engine == 'numpy' and np is None:
+                continue
+            reused = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+            for filename in filenames:
+                new = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine]())
+                try:
+                    new.read_input(filename)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        reused.read_input(filename)
+                    continue
+                reused.read_input(filename)
+                new.simulate()
+                reused.simulate()
+                self.assertEqual(reused.render_result(), new.render_result())
@@ -0,0 +1,102 @@
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.engines import ENGINES
+from ..src.numpy_game import np
+from ..src.salvo import SalvoSimulator
+from ..src.validator import InputValidator, InputValidationError, SALVO_SHIPS
+from ..src.workload import generate_game, generate_salvo_game
+
+import random
+import unittest
+
+class SalvoMethodsUnitTests(unittest.TestCase):
+    def simulate(self, lines, engine='default'):
+        s = SalvoSimulator(g=ENGINES[engine]())
+        s.read_input_lines(lines, name='salvo')
+        s.simulate()
+        return s
+
+    def test_ships_salvo_size(self):
+        # Player 2 loses a ship in the first turn, so they fire 1 shot (out of 2) in the second turn. Player 1 fires
+        # at 2:2 twice in the first turn, which is one shot (and one hit).
+        lines = ['4', '2', '0:0,1:1', '2:2,3:3', '2', SALVO_SHIPS,
+                    '2,2:2,2;3,3:0,1', '3,0:0,1;0,0:1,1']
+        for engine in ENGINES:
+            if engine == 'numpy' and np is None:
+                continue
+            s = self.simulate(lines, engine=engine)
+            self.assertEqual(s.get_scores(), (2, 1, 'Player 1 wins'), engine)
+        s = self.simulate(lines)
+        self.assertEqual(s.get_game().get_player_board(player_id=1), [list('XO__'), list('_B__'), list('____'), list('O___')])
+        self.assertEqual(s.get_game().get_player_board(player_id=2), [list('_O__'), list('____'), list('__X_'), list('___X')])
+        self.assertEqual(s.get_sim_inputs()['P1_VOLLEYS'][0], [(2, 2), (2, 2)])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_same_result_across_engines(self):
+        rng = random.Random(6)
+        for _ in range(20):
+            lines = generate_salvo_game(rng, board_size=8, n_ships=rng.randint(1, 20), n_turns=rng.randint(1, 12),
+                                        salvo_size=rng.randint(1, 9))
+            if rng.random() < 0.5:
+                lines[5] = SALVO_SHIPS
+                lines[6:] = [';'.join(':'.join(volley.split(':')[:int(lines[1])]) for volley in line.split(';')) for line in lines[6:]]
+            expected = self.simulate(lines)
+            for engine in ENGINES:
+                s = self.simulate(lines, engine=engine)
+                self.assertEqual(s.get_scores(), expected.get_scores(), engine)
+                if engine != 'sparse' and engine != 'fleet':
+                    self.assertEqual(s.render_result(), expected.render_result(), engine)
+
+    def test_one_shot_salvo_is_standard_game(self):
+        rng = random.Random(2)
+        for _ in range(10):
+            lines = generate_game(rng, board_size=7, n_ships=10, n_missiles=30)
+            salvo_lines = lines[:5] + ['1', lines[5].replace(':', ';'), lines[6].replace(':', ';')]
+            expected = Simulator(p1=Player(), p2=Player(), g=ENGINES['default']())
+            expected.read_input_lines(lines, name='standard')
+            expected.simulate()
+            for engine in ('default', 'packed'):
+                self.assertEqual(self.simulate(salvo_lines, engine=engine).render_result(), expected.render_result())
+
+    def test_invalid_volleys(self):
+        lines = ['4', '2', '0:0,1:1', '2:2,3:3', '2', '2', '0,0:1,1:2,2;3,3', '0,0;1,1;2,2']
+        (_, errors) = InputValidator().validate_salvo_lines(lines)
+        self.assertEqual([(error.line, error.column) for error in errors], [(7, 1), (8, None)])
+        self.assertIn('more than 2 shots', errors[0].message)
+        self.assertIn('Number of volleys', errors[1].message)
+
+        lines[5:] = [SALVO_SHIPS, '0,0:1,4;3,3', '0,0;x,1']
+        (_, errors) = InputValidator().validate_salvo_lines(lines)
+        self.assertEqual([(error.line, error.column) for error in errors], [(7, 5), (8, 5)])
+        with self.assertRaises(InputValidationError):
+            SalvoSimulator(g=ENGINES['default']()).read_input_lines(lines, name='invalid')
+        (_, errors) = InputValidator().validate_salvo_lines(lines[:6])
+        self.assertEqual([error.line for error in errors], [7, 8])
+
+    def test_empty_volleys(self):
+        # Player 1 holds fire in the second turn, and Player 2 in the first one
+        lines = ['4', '2', '0:0,1:1', '2:2,3:3', '2', '2', '2,2;', ';0,0:3,3']
+        for engine in ENGINES:
+            if engine == 'numpy' and np is None:
+                continue
+            s = self.simulate(lines, engine=engine)
+            self.assertEqual(s.get_scores(), (1, 1, 'It is a draw'), engine)
+        self.assertEqual(list(s.get_sim_inputs()['P2_VOLLEYS'][0]), [])
+
+        # Columns of the errors are those of the line, with its empty volleys
+        lines[4:] = ['4', '2', '2,2;;;x,1', ';0,0;;4,4']
+        (_, errors) = InputValidator().validate_salvo_lines(lines)
+        self.assertEqual([(error.line, error.column) for error in errors], [(7, 7), (8, 7)])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_large_volleys_in_bulk(self):
+        # Volleys of hundreds of shots on a large board (resolved with one NumPy update by the packed engine)
+        rng = random.Random(9)
+        lines = generate_salvo_game(rng, board_size=300, n_ships=2000, n_turns=6, salvo_size=500)
+        # The last volley of Player 1 fires twice at its first location
+        lines[5] = '501'
+        lines[6] = lines[6] + ':' + lines[6].split(';')[-1].split(':')[0]
+        expected = self.simulate(lines, engine='sparse')
+        s = self.simulate(lines, engine='packed')
+        self.assertEqual(s.get_scores(), expected.get_scores())
+        self.assertGreater(s.get_scores()[0], 0)
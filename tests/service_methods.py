@@ -0,0 +1,94 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.player import Player
+from ..src.service import SimulationService, LatencyMetrics, request
+
+import asyncio
+import unittest
+from pathlib import Path
+
+class ServiceMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_dir = Path(__file__).parent.resolve() / '..' / 'data'
+        with open(self.data_dir / 'sample-data-1.txt') as f:
+            self.text = f.read()
+        return super().setUp()
+
+    def test_latency_percentiles(self):
+        metrics = LatencyMetrics(window=100)
+        self.assertIsNone(metrics.percentile(50))
+        for ms in range(1, 201):
+            metrics.record(ms / 1e3)
+        # Only the 100 most recent latencies (101..200 ms) are kept
+        self.assertAlmostEqual(metrics.percentile(50), 0.150)
+        self.assertAlmostEqual(metrics.percentile(99), 0.199)
+
+    def test_serve_requests(self):
+        async def run():
+            service = SimulationService(workers=1, timeout=30)
+            port = await service.start()
+            try:
+                return await request('127.0.0.1', port, [{'input': self.text}, {'input': '11\n5'}, {'metrics': True}])
+            finally:
+                await service.close()
+
+        (response, invalid_response, metrics) = asyncio.run(run())
+        g = Game()
+        s = Simulator(p1=Player(), p2=Player(), g=g)
+        s.read_input('sample-data-1.txt')
+        s.simulate()
+        self.assertEqual(response['boards'], s.render_result())
+        self.assertEqual(response['result'], g.get_game_result())
+        self.assertIn('error', invalid_response)
+        self.assertEqual((metrics['requests'], metrics['errors']), (2, 1))
+        self.assertIsNotNone(metrics['p99_ms'])
+
+    def test_worker_exception(self):
+        async def run():
+            service = SimulationService(workers=1, timeout=30)
+            port = await service.start()
+            try:
+                return await request('127.0.0.1', port, [{'input': self.text, 'engine': []}, {'input': self.text}, {'metrics': True}])
+            finally:
+                await service.close()
+
+        (failed_response, response, metrics) = asyncio.run(run())
+        self.assertTrue(failed_response['error'].startswith("Request failed: TypeError"))
+        self.assertNotIn('error', response)
+        self.assertEqual((metrics['requests'], metrics['errors']), (2, 1))
+
+    def test_backpressure(self):
+        async def run():
+            service = SimulationService(workers=1, max_pending=1, timeout=30)
+            await service.start()
+            try:
+                return await asyncio.gather(*(service.handle_request({'input': self.text}) for _ in range(3)))
+            finally:
+                await service.close()
+
+        responses = asyncio.run(run())
+        self.assertNotIn('error', responses[0])
+        self.assertTrue(all(response['error'].startswith("Server busy") for response in responses[1:]))
+
+    def test_timeout(self):
+        # A game long enough to time out: its slot stays pending until the worker is done with it
+        moves = ':'.join('{x},{y}'.format(x=i % 1000, y=i // 1000) for i in range(100000))
+        slow_text = '1000\n1\n0:0\n1:1\n100000\n{moves}\n{moves}'.format(moves=moves)
+
+        async def run():
+            service = SimulationService(workers=1, max_pending=1, timeout=0.1)
+            await service.start()
+            try:
+                timed_out = await service.handle_request({'input': slow_text, 'engine': 'sparse'})
+                busy = await service.handle_request({'input': self.text})
+                while (await service.handle_request({'metrics': True}))['pending']:
+                    await asyncio.sleep(0.05)
+                metrics = await service.handle_request({'metrics': True})
+                return (timed_out, busy, metrics)
+            finally:
+                await service.close()
+
+        (timed_out, busy, metrics) = asyncio.run(run())
+        self.assertTrue(timed_out['error'].startswith("Request timed out"))
+        self.assertTrue(busy['error'].startswith("Server busy"))
+        self.assertEqual((metrics['requests'], metrics['timeouts'], metrics['rejected'], metrics['pending']), (2, 1, 1, 0))
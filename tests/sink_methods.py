@@ -0,0 +1,58 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.player import Player
+from ..src.sinks import TextFileSink, AppendFileSink, SQLiteSink, read_records
+from ..src import batch
+
+import tempfile
+import unittest
+from pathlib import Path
+
+class SinkMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_dir = Path(__file__).parent.resolve() / '..' / 'data'
+        self.out_dir = tempfile.TemporaryDirectory()
+        self.s = Simulator(p1=Player(), p2=Player(), g=Game(), output_dir=Path(self.out_dir.name))
+        self.s.read_input('sample-data-1.txt')
+        self.s.simulate()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.out_dir.cleanup()
+        return super().tearDown()
+
+    def test_text_sink_does_not_overwrite(self):
+        sink = TextFileSink(Path(self.out_dir.name))
+        paths = [self.s.write_result(sink) for _ in range(3)]
+        self.assertEqual(len(set(paths)), 3)
+        for path in paths:
+            with open(path) as f:
+                self.assertEqual(f.read(), self.s.render_result())
+
+    def test_append_sink_buffers(self):
+        path = Path(self.out_dir.name) / 'results.jsonl'
+        with AppendFileSink(path, buffer_size=2) as sink:
+            self.s.write_result(sink)
+            self.assertEqual(read_records(path), [])
+            self.s.write_result(sink)
+            self.assertEqual(len(read_records(path)), 2)
+            self.s.write_result(sink)
+        records = read_records(path)
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0], self.s.get_result_record())
+
+    def test_sqlite_sink(self):
+        path = Path(self.out_dir.name) / 'results.sqlite'
+        with SQLiteSink(path, batch_size=2) as sink:
+            for _ in range(5):
+                self.s.write_result(sink)
+        records = read_records(path)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[-1], self.s.get_result_record())
+
+    def test_batch_with_sqlite_sink(self):
+        input_paths = batch.collect_input_files(str(self.data_dir / 'unittest--in*.txt'))
+        rows = batch.run_batch(input_paths, Path(self.out_dir.name), workers=2, chunksize=3, sink='sqlite')
+        records = read_records(Path(self.out_dir.name) / 'results.sqlite')
+        self.assertEqual(len(records), sum(1 for row in rows if not row['error']))
+        self.assertEqual(records[0]['input'], str(input_paths[0]))
@@ -0,0 +1,47 @@
+from ..src.simulator import Simulator
+from ..src.game import Game
+from ..src.sparse_game import SparseGame
+from ..src.player import Player
+
+import tempfile
+import unittest
+
+class SparseGameMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.out_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.out_dir.cleanup()
+        return super().tearDown()
+
+    def test_same_as_default_engine(self):
+        games = [Game(), SparseGame()]
+        for g in games:
+            s = Simulator(p1=Player(), p2=Player(), g=g)
+            s.read_input('sample-data-1.txt')
+            s.simulate()
+        for player_id in (1, 2):
+            self.assertEqual(games[0].get_player_board(player_id), games[1].get_player_board(player_id))
+            self.assertEqual(games[0].get_player_scores(player_id), games[1].get_player_scores(player_id))
+        self.assertEqual(games[0].get_game_result(), games[1].get_game_result())
+
+    def test_large_board(self):
+        with self.assertRaises(ValueError):
+            Simulator(p1=Player(), p2=Player(), g=Game()).read_input('unittest--large_input1.txt')
+
+        g = SparseGame()
+        s = Simulator(p1=Player(), p2=Player(), g=g, output_dir=self.out_dir.name)
+        s.read_input('unittest--large_input1.txt')
+        s.simulate()
+        self.assertEqual(g.get_player_scores(player_id=1), 2)
+        self.assertEqual(g.get_player_scores(player_id=2), 1)
+        self.assertEqual(g.get_game_result(), "Player 1 wins")
+
+        with open(s.write_result()) as f:
+            result_lines = f.read().split('\n')
+        self.assertEqual(result_lines[1], '1:1 B')
+        self.assertIn('25000:7 X', result_lines)
+        self.assertIn('49999:49999 B', result_lines)
+        self.assertEqual(sum(1 for line in result_lines if line.endswith(' X')), 3)
+        self.assertEqual(result_lines[-3:], ['P1:2', 'P2:1', 'Player 1 wins'])
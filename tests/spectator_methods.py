@@ -0,0 +1,83 @@
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.engines import ENGINES
+from ..src.instrumentation import Instrumentation
+from ..src.spectator import Spectator
+from ..src.workload import generate_game
+
+import io
+import random
+import re
+import unittest
+
+# Cursor moves, screen clears and text of the frames
+_TERMINAL_CODES = re.compile(r'\x1b\[(\d+);(\d+)H|\x1b\[2J|\x1b\[K|([^\x1b]+)')
+
+def draw(screen, text):
+    # Applies the frames to a screen of line -> list of chars (1-based lines and columns)
+    (line, column) = (1, 1)
+    for match in _TERMINAL_CODES.finditer(text):
+        if match.group(1):
+            (line, column) = (int(match.group(1)), int(match.group(2)))
+        elif match.group(3):
+            chars = screen.setdefault(line, [])
+            chars.extend(' ' * (column - 1 + len(match.group(3)) - len(chars)))
+            chars[column - 1:column - 1 + len(match.group(3))] = match.group(3)
+            column += len(match.group(3))
+    return screen
+
+class SpectatorMethodsUnitTests(unittest.TestCase):
+    def watch(self, lines, engine='default', **kwargs):
+        instrumentation = Instrumentation()
+        s = Simulator(p1=Player(), p2=Player(), g=ENGINES[engine](), instrumentation=instrumentation)
+        s.read_input_lines(lines, name='watched')
+        stream = io.StringIO()
+        spectator = Spectator.from_simulator(s, stream=stream, **kwargs)
+        spectator.attach(instrumentation)
+        return s, spectator, stream
+
+    def test_screen_matches_boards(self):
+        rng = random.Random(3)
+        lines = generate_game(rng, board_size=9, n_ships=12, n_missiles=60)
+        for engine in ('default', 'sparse'):
+            (s, spectator, stream) = self.watch(lines, engine=engine, fps=1000)
+            with spectator:
+                s.simulate()
+            screen = draw({}, stream.getvalue())
+            for player_id in (1, 2):
+                board = s.get_game().get_player_board(player_id=player_id)
+                title = 1 + (player_id - 1) * 12
+                self.assertEqual(''.join(screen[title]), 'Player{k}'.format(k=player_id))
+                self.assertEqual([''.join(screen[title + 1 + row]) for row in range(9)], [' '.join(row) + ' ' for row in board])
+            (p1_score, p2_score, result) = s.get_scores()
+            self.assertEqual(''.join(screen[25]), 'P1 hits: {p1}  P2 hits: {p2}  {result}'.format(p1=p1_score, p2=p2_score, result=result))
+
+    def test_only_changed_locations_are_drawn(self):
+        spectator = Spectator(5, [(0, 0), (1, 1)], [(0, 0), (4, 4)], stream=io.StringIO())
+        instrumentation = Instrumentation()
+        spectator.attach(instrumentation)
+        self.assertIn('\x1b[2J', spectator.render_frame())
+        self.assertEqual(spectator.render_frame(), '')
+        instrumentation.emit('hit', 1, (4, 4))
+        instrumentation.emit('miss', 2, (2, 3))
+        frame = spectator.render_frame()
+        # Location of the board of Player 2 (title on line 9), location of the board of Player 1 (title on line 1),
+        # and the status line
+        self.assertEqual(re.findall(r'\x1b\[(\d+);(\d+)H', frame), [('14', '9'), ('4', '7'), ('17', '1')])
+        self.assertTrue(frame.startswith('\x1b[14;9HX\x1b[4;7HO'))
+        self.assertEqual(spectator.get_cells()[1][4][4], 'X')
+
+    def test_view_of_large_board(self):
+        rng = random.Random(8)
+        lines = generate_game(rng, board_size=300, n_ships=2000, n_missiles=5000)
+        (s, spectator, stream) = self.watch(lines, engine='sparse', view_size=20)
+        s.simulate()
+        spectator.render_frame()
+        for player_id in (1, 2):
+            cells = s.get_game().get_occupied_cells(player_id=player_id)
+            view = [[cells.get((loc_x, loc_y), '_') for loc_y in range(20)] for loc_x in range(20)]
+            self.assertEqual(spectator.get_cells()[player_id - 1], view)
+        (p1_score, p2_score, _) = s.get_scores()
+        self.assertIn('P1 hits: {p1}  P2 hits: {p2}'.format(p1=p1_score, p2=p2_score), stream.getvalue())
+        with self.assertRaises(ValueError):
+            Spectator(5, [], [], fps=0)
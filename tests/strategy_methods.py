@@ -0,0 +1,73 @@
+from ..src.game import Game
+from ..src.fleet import FleetGame
+from ..src.player import Player
+from ..src.simulator import Simulator
+from ..src.strategies import RandomStrategy, HuntTargetStrategy, ProbabilityDensityStrategy
+
+import unittest
+
+class StrategyMethodsUnitTests(unittest.TestCase):
+    def test_random_without_replacement(self):
+        strategy = RandomStrategy(seed=0)
+        strategy.reset(6)
+        moves = [strategy.next_move() for _ in range(36)]
+        self.assertEqual(sorted(moves), [(x, y) for x in range(6) for y in range(6)])
+        # Once every location is shot, the strategy starts over
+        self.assertIn(strategy.next_move(), moves)
+
+    def test_hunt_target_shoots_neighbours(self):
+        strategy = HuntTargetStrategy(seed=1)
+        strategy.reset(5)
+        move = strategy.next_move()
+        strategy.register_feedback(move, True)
+        (x, y) = move
+        neighbours = {(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)}
+        self.assertIn(strategy.next_move(), neighbours)
+
+    def test_density_update(self):
+        strategy = ProbabilityDensityStrategy(ship_lengths=(3,), seed=0)
+        strategy.reset(5)
+        # The center is covered by the most placements of a 3-cell ship
+        self.assertEqual(strategy.next_move(), (2, 2))
+        strategy.register_feedback((2, 2), True)
+        self.assertIn(strategy.next_move(), {(1, 2), (3, 2), (2, 1), (2, 3)})
+
+    def test_density_does_not_repeat(self):
+        strategy = ProbabilityDensityStrategy(ship_lengths=(2, 3), seed=4)
+        strategy.reset(6)
+        moves = []
+        for _ in range(36):
+            move = strategy.next_move()
+            strategy.register_feedback(move, move[0] == 1)
+            moves.append(move)
+        self.assertEqual(len(set(moves)), 36)
+
+    def test_simulate_with_strategies(self):
+        p1 = Player(strategy=HuntTargetStrategy(seed=0))
+        p2 = Player(strategy=ProbabilityDensityStrategy(seed=0))
+        g = Game()
+        s = Simulator(p1=p1, p2=p2, g=g)
+        s.read_input('sample-data-1.txt')
+        s.simulate()
+        # Every move of a strategy is at a location which was not shot at yet, so each board holds T shots
+        for player_id in (1, 2):
+            board = g.get_player_board(player_id=player_id)
+            self.assertEqual(sum(row.count('O') + row.count('X') for row in board), 5)
+
+    def test_density_takes_ship_lengths_from_inputs(self):
+        # The center of the board is covered by the most placements of the 4-location ship of Player 1
+        lines = ['6', '1', '0:0:4:H', '5:5', '1', '0,0', '0,0']
+        for seed in range(5):
+            g = FleetGame()
+            s = Simulator(p1=Player(), p2=Player(strategy=ProbabilityDensityStrategy(seed=seed)), g=g)
+            s.read_input_lines(lines, name='fleet')
+            s.simulate()
+            shots = [(x, y) for (x, row) in enumerate(g.get_player_board(player_id=1)) for (y, cell) in enumerate(row) if cell in 'OX']
+            self.assertEqual(len(shots), 1)
+            self.assertIn(shots[0], {(2, 2), (2, 3), (3, 2), (3, 3)})
+
+        # Lengths given to the strategy are kept
+        strategy = ProbabilityDensityStrategy(ship_lengths=(3,), seed=0)
+        strategy.set_ship_lengths([1])
+        strategy.reset(5)
+        self.assertEqual(strategy.next_move(), (2, 2))
@@ -0,0 +1,67 @@
+from ..src.simulator import Simulator, MOVE_CHUNK_SIZE
+from ..src.game import Game
+from ..src.packed import PackedGame
+from ..src.player import Player
+from ..src.streaming import iter_line_tokens
+from ..src.workload import generate_game, write_game
+
+import io
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+class ChunkRecordingGame(PackedGame):
+    # Packed game which records the number of moves of each register_player_moves call
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunk_sizes = []
+
+    def register_player_moves(self, player_id, hit_locs):
+        self.chunk_sizes.append(len(hit_locs))
+        super().register_player_moves(player_id, hit_locs)
+
+class StreamingMethodsUnitTests(unittest.TestCase):
+    def test_line_tokens(self):
+        f = io.BytesIO(b'0,1:12,3:2,33\n4,4')
+        self.assertEqual(list(iter_line_tokens(f, ':', chunk_size=3)), ['0,1', '12,3', '2,33'])
+        self.assertEqual(list(iter_line_tokens(f, ':', chunk_size=3)), ['4,4'])
+
+    def test_same_as_full_read(self):
+        games = [Game(), Game()]
+        for streaming, g in zip((False, True), games):
+            s = Simulator(p1=Player(), p2=Player(), g=g)
+            s.read_input('sample-data-1.txt', streaming=streaming)
+            s.simulate()
+        for player_id in (1, 2):
+            self.assertEqual(games[0].get_player_board(player_id), games[1].get_player_board(player_id))
+        self.assertEqual(games[0].get_game_result(), games[1].get_game_result())
+
+    def test_invalid_move_while_simulating(self):
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        s.read_input('unittest--invalid_input9.txt', streaming=True)
+        with self.assertRaises(ValueError):
+            s.simulate()
+
+    def test_extra_moves(self):
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        s.read_input('unittest--invalid_input10.txt', streaming=True)
+        with self.assertRaises(ValueError):
+            s.simulate()
+
+    def test_vectorized_moves_in_chunks(self):
+        n_missiles = 2 * MOVE_CHUNK_SIZE + 5
+        lines = generate_game(random.Random(3), board_size=1000, n_ships=50, n_missiles=n_missiles)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = Path(tmp_dir) / 'long.txt'
+            write_game(lines, input_path)
+            games = [PackedGame(), ChunkRecordingGame()]
+            for streaming, g in zip((False, True), games):
+                s = Simulator(p1=Player(), p2=Player(), g=g)
+                s.read_input(str(input_path), streaming=streaming)
+                s.simulate()
+        # Streamed moves are read and resolved MOVE_CHUNK_SIZE moves at a time
+        self.assertEqual(games[1].chunk_sizes, [MOVE_CHUNK_SIZE, MOVE_CHUNK_SIZE, 5] * 2)
+        for player_id in (1, 2):
+            self.assertEqual(games[0].get_player_scores(player_id), games[1].get_player_scores(player_id))
+        self.assertEqual(games[0].get_game_result(), games[1].get_game_result())
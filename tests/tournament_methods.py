@@ -0,0 +1,81 @@
+from ..src.tournament import Tournament, Entrant, load_results, compute_standings, write_standings, STANDINGS_FIELDS
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.game import Game
+from ..src.workload import generate_game, write_game
+
+import csv
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+class TournamentMethodsUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+        rng = random.Random(6)
+        self.input_paths = []
+        for k in range(7):
+            path = self.dir / 'entrant{k}.txt'.format(k=k)
+            write_game(generate_game(rng, board_size=6, n_ships=8, n_missiles=20), path)
+            self.input_paths.append(path)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def tournament(self, checkpoint_dir, n_shards=4):
+        return Tournament.from_files(self.input_paths, n_shards=n_shards, checkpoint_dir=self.dir / checkpoint_dir)
+
+    def test_standings(self):
+        tournament = self.tournament('all')
+        self.assertEqual(tournament.run(workers=1), [0, 1, 2, 3])
+        (games, missing) = load_results([self.dir / 'all'])
+        self.assertEqual((len(games), missing), (21, []))
+
+        # Every game matches a direct simulation of the pairing
+        for game in games:
+            (p1, p2) = [next(e for e in tournament.entrants if e.name == game[key]) for key in ('p1', 'p2')]
+            s = Simulator(p1=Player(), p2=Player(), g=Game())
+            s.read_input_lines(['6', '8', p1.ships, p2.ships, '20', p1.moves, p2.moves], name='game')
+            s.simulate()
+            self.assertEqual((game['P1'], game['P2'], game['result']), s.get_scores())
+
+        rows = compute_standings(games)
+        self.assertEqual([row['rank'] for row in rows], list(range(1, 8)))
+        self.assertTrue(all(row['played'] == 6 for row in rows))
+        self.assertEqual(sum(row['wins'] for row in rows), sum(row['losses'] for row in rows))
+        self.assertEqual([row['points'] for row in rows], sorted((row['points'] for row in rows), reverse=True))
+        with open(write_standings(rows, self.dir)) as f:
+            self.assertEqual(next(csv.reader(f)), STANDINGS_FIELDS)
+
+    def test_resume(self):
+        tournament = self.tournament('resume')
+        self.assertEqual(tournament.run(shards=[2], workers=1), [2])
+        # An interrupted run leaves only finished shards, which are not run again
+        self.assertEqual(tournament.run(workers=1), [0, 1, 3])
+        self.assertEqual(tournament.run(workers=1), [])
+        # Checkpoints of another tournament are not resumed from
+        self.assertEqual(self.tournament('resume', n_shards=3).run(shards=[0], workers=1), [0])
+        with self.assertRaises(ValueError):
+            tournament.run(shards=[4])
+
+    def test_merge_invocations(self):
+        # Two invocations (e.g. on two machines) run some of the shards each, over worker processes
+        self.assertEqual(sorted(self.tournament('machine1').run(shards=[0, 3], workers=2)), [0, 3])
+        (_, missing) = load_results([self.dir / 'machine1'])
+        self.assertEqual(missing, [1, 2])
+        self.tournament('machine2').run(shards=[1, 2, 3], workers=1)
+        (merged, missing) = load_results([self.dir / 'machine1', self.dir / 'machine2'])
+        self.assertEqual((len(merged), missing), (21, []))
+
+        self.tournament('single').run(workers=1)
+        (games, _) = load_results([self.dir / 'single'])
+        self.assertEqual(compute_standings(merged), compute_standings(games))
+
+        other = Tournament([Entrant('a', '0:0', '1,1'), Entrant('b', '1:1', '0,0')], 2, 1, 1, n_shards=1, checkpoint_dir=self.dir / 'other')
+        other.run(workers=1)
+        with self.assertRaises(ValueError):
+            load_results([self.dir / 'single', self.dir / 'other'])
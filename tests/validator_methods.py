@@ -0,0 +1,60 @@
+from ..src.validator import InputValidator, InputValidationError, TUPLE_LIST_LIMIT, _parse_items
+from ..src.simulator import Simulator
+from ..src.player import Player
+from ..src.game import Game
+from ..src.numpy_game import np
+
+import random
+import unittest
+
+class ValidatorMethodsUnitTests(unittest.TestCase):
+    def test_collects_every_error(self):
+        lines = ['5', '3', '0:0,0:0,9:1', '1:1,2:2,x', '3', '1,1:-1,2:0,0', '1,1:1,2:0,0']
+        (inputs, errors) = InputValidator().validate_lines(lines)
+        self.assertEqual([(e.line, e.column) for e in errors], [(3, 9), (3, 5), (4, 9), (6, 5)])
+        self.assertEqual(errors[1].message, "Position 0:0 in Player 1 ship positions is duplicated (first at column 1). (Battleship input file: Line 3)")
+        self.assertIsNone(inputs['P1_POS_SHIPS'])
+        self.assertEqual(inputs['P2_MOVES'], [(1, 1), (1, 2), (0, 0)])
+
+        with self.assertRaises(InputValidationError) as cm:
+            InputValidator().validate(lines)
+        self.assertEqual(len(cm.exception.errors), 4)
+        self.assertEqual(str(cm.exception).split('\n'), [e.message for e in errors])
+
+    def test_missing_lines(self):
+        (_, errors) = InputValidator().validate_lines(['5', '1', '0:0'])
+        self.assertEqual([e.line for e in errors], [4, 5, 6, 7])
+        (_, errors) = InputValidator().validate_lines(['5', '1', '0:0', '1:1', '2'], moves=False)
+        self.assertEqual(errors, [])
+
+    def test_simulator_messages(self):
+        s = Simulator(p1=Player(), p2=Player(), g=Game())
+        with self.assertRaisesRegex(ValueError, r"Number of inputs in Player 2 moves must match 2\. \(Battleship input file: Line 7\)"):
+            s.read_input_lines(['5', '1', '0:0', '1:1', '2', '1,1:2,2', '1,1'], name='invalid')
+        with self.assertRaisesRegex(ValueError, r"Battleground size input \(M\) is in invalid format"):
+            s.read_input_lines(['M', '1', '0:0', '1:1', '1', '1,1', '1,1'], name='invalid')
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_bulk_parse_matches_items(self):
+        rng = random.Random(3)
+        validator = InputValidator()
+        for _ in range(100):
+            moves = ':'.join(rng.choice(['{x},{y}', '{x},{y}', '0{x},{y}', '{x}.{y}', '{x},', ',{y}', '{x},{y}:'])
+                                .format(x=rng.randint(-2, 12), y=rng.randint(0, 12)) for _ in range(rng.randint(1, 5)))
+            lines = ['10', '1', '0:0', '1:1', str(moves.count(':') + 1), moves, '1,1']
+            (inputs, errors) = validator.validate_lines(lines)
+            (coords, columns, invalid_columns) = _parse_items(moves, ':', ',')
+            out_of_range = [column for ((x, y), column) in zip(coords, columns) if not (0 <= x < 10 and 0 <= y < 10)]
+            self.assertEqual(sorted(e.column for e in errors if e.line == 6), sorted(invalid_columns + out_of_range))
+            if not invalid_columns and not out_of_range:
+                self.assertEqual(inputs['P1_MOVES'], coords)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_large_move_list(self):
+        n = TUPLE_LIST_LIMIT + 1
+        moves = ':'.join('{x},{y}'.format(x=i % 7, y=i % 5) for i in range(n))
+        (inputs, errors) = InputValidator().validate_lines(['7', '1', '0:0', '1:1', str(n), moves, moves])
+        self.assertEqual(errors, [])
+        self.assertEqual(len(inputs['P1_MOVES']), n)
+        self.assertEqual(list(inputs['P1_MOVES'][:3]), [(0, 0), (1, 1), (2, 2)])
+        self.assertEqual(tuple(inputs['P2_MOVES'][n - 1]), ((n - 1) % 7, (n - 1) % 5))